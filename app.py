@@ -1,30 +1,113 @@
-import datetime
-from dash import Dash, html, dcc, Input, Output, State
-from yfinance_data import Yfinance
+from dash import Dash, html, dcc, dash_table, Input, Output, State, ClientsideFunction, Patch, DiskcacheManager, no_update
+from dash.exceptions import PreventUpdate
+from flask import Response, abort, stream_with_context
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote as url_quote
+from datetime import timedelta
+from yfinance_data import Yfinance, history_ttl
+from cache import TTLCache
 import pandas as pd
+import numpy as np
 import plotly.graph_objs as go
 from ta_lib_utility import Talib
-import plotly.subplots as sp
-import yfinance as yf
-from plotly.subplots import make_subplots
 from candles import candle_patterns
-import requests
-from bs4 import BeautifulSoup
-import time
+import os
+import json
+import diskcache
 from stocks_names import stocks_names
-
-app = Dash(__name__)
+from ticker_index import TickerIndex
+from history_plan import HistoryPlan
+from live_price import poller
+from market_hours import EXCHANGE_SESSIONS, exchange_for_suffix, known_exchange_for_symbol
+from screener import SCREENER_COLUMNS, SCREENER_FILTERS, screen
+from downsample import line, ohlcv, window, visible_range
+from regression import channel, fit_line, linear_fit
+from rangebreaks import range_breaks
+from live_chart import INTRADAY_INTERVALS, MA_FIELDS, REFRESH_SECONDS, LiveIndicators, chart_tail, drawn_bars, full_resolution, ma_windows, refresh_interval
+from metrics import cache_lookups, exposition, instrument, instrument_server, record_error, stage
+import profiling
+
+# plotly imports orjson lazily, on the first figure.to_json(). Panels serialize figures on several
+# threads at once, and a thread can get the module while another is still initializing it
+# ("partially initialized module 'orjson'"), so it is imported here, before any thread runs.
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    pass
+
+# Panels share slices of one fetched frame; copy-on-write keeps those slices zero-copy until a panel adds a column
+pd.set_option('mode.copy_on_write', True)
+
+# Job store for the background panels (info, news), kept on local disk
+background_callback_manager = DiskcacheManager(diskcache.Cache(os.environ.get('DASH_JOB_STORE_DIR', '.dash_jobs')))
+
+app = Dash(__name__, suppress_callback_exceptions=True, background_callback_manager=background_callback_manager)
 app.title="Stock"
 server=app.server
-start_time = datetime.time(9, 15)
-end_time = datetime.time(15, 30)
-now = datetime.datetime.now().time()
-
-if datetime.datetime.today().weekday() < 5 and start_time <= now <= end_time:
-    interval_time = 2000  
-else:
-    interval_time = 24 * 60 * 60 * 1000 
-    
+instrument_server(server, app.callback_map)
+profiling.install(server)
+
+_ticker_index = None
+
+
+# Built on the first autocomplete rather than at worker boot
+def get_ticker_index():
+    global _ticker_index
+    if _ticker_index is None:
+        _ticker_index = TickerIndex(stocks_names)
+    return _ticker_index
+
+
+# Page panels, top to bottom; each one is filled by its own callback
+PANELS = ['info', 'candle', 'volume', 'rsi', 'macd', 'dmi-adx', 'bollinger', 'atr', 'roc', 'news']
+
+# Independent upstream fetches of one submit run side by side on this bounded pool
+def new_fetch_pool():
+    global fetch_pool
+    fetch_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='fetch')
+
+
+new_fetch_pool()
+# Background jobs are forked from this process, and the parent's pool threads do not exist there
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=new_fetch_pool)
+# Seconds each source may take before its panel degrades to a placeholder
+FETCH_TIMEOUTS = {'info': 10, 'history': 20, 'calendar': 8, 'news': 8}
+
+
+def fetch_result(future, timeout, default):
+    try:
+        return future.result(timeout=timeout)
+    except Exception:
+        # Timed out or failed upstream: the panel shows a placeholder instead of failing the page
+        return default
+
+# Serialized figures shared by every session, keyed on the data version plus the panel and its parameters
+figure_cache = TTLCache(max_bytes=int(os.environ.get('FIGURE_CACHE_MAX_MB', 128)) * 1024 * 1024,
+                        on_lookup=cache_lookups('figure'))
+
+
+# The last bar keeps changing until it closes, so its close and volume are part of the version too
+def figure_version(symbol, interval, period, history):
+    last = history.iloc[-1]
+    return (symbol, interval, history.index[-1].value, float(last['Close']), float(last['Volume']), period)
+
+
+# Streaming moving averages of the live intraday charts, shared by every session showing one
+live_indicators = TTLCache(max_bytes=int(os.environ.get('LIVE_CHART_CACHE_MAX_MB', 32)) * 1024 * 1024)
+LIVE_INDICATORS_TTL = 30 * 60
+
+
+def cached_figure(key, build, ttl):
+    def render():
+        with stage('figure'):
+            fig = build()
+        with stage('serialize'):
+            return fig.to_json()
+    cached = figure_cache.get_or_load(key, render, ttl)
+    with stage('serialize'):
+        return json.loads(cached)
+
 app.layout = html.Div([
     html.Div([
         dcc.RadioItems(
@@ -64,9 +147,13 @@ app.layout = html.Div([
             dcc.Dropdown(
                 id='interval_time',
                 options=[
+                    {'label':'1 Minute','value':'1m'},
+                    {'label':'5 Minutes','value':'5m'},
                     {'label':'Hourly','value':'1h'},
+                    {'label':'4 Hourly','value':'4h'},
                     {'label':'Daily','value':'1d'},
                     {'label':'Weekly','value':'1wk'},
+                    {'label':'Monthly','value':'1mo'},
                 ],
                 value='1d',
                 style={'marginRight': '10px','width': '100px','marginLeft':'5px'} 
@@ -94,6 +181,7 @@ app.layout = html.Div([
         dcc.Input(
             id='short-ma-input',
             type='number',
+            debounce=True,
             value=50,  
             style={'margin-right': '10px', 'width': '80px'}
         ),
@@ -101,6 +189,7 @@ app.layout = html.Div([
         dcc.Input(
             id='medium-ma-input',
             type='number',
+            debounce=True,
             value=100,  
             style={'margin-right': '10px', 'width': '80px'}
         ),
@@ -108,6 +197,7 @@ app.layout = html.Div([
         dcc.Input(
             id='long-ma-input',
             type='number',
+            debounce=True,
             value=200,  
             style={'margin-right': '10px', 'width': '80px'}
         ),
@@ -115,6 +205,7 @@ app.layout = html.Div([
         dcc.Input(
             id='Linear-input',
             type='number',
+            debounce=True,
             value=2,  
             style={'margin-right': '10px', 'width': '80px'}
         ),
@@ -122,13 +213,48 @@ app.layout = html.Div([
     style={'textAlign': 'center', 'color': 'white', 'margin-top': '20px','paddingBottom': '20px'}
 ),
 
-    dcc.Interval(
-        id="interval-component",
-        interval=interval_time,
-        n_intervals=0
-    ),
+    dcc.Store(id='price-stream-url'),
+    dcc.Store(id='price-stream-subscribed'),
     html.Label("Price",id="live-price-output"),
-    html.Div(id='output-container-button'),
+    dcc.Store(id='stock-request'),
+    dcc.Store(id='chart-params'),
+    dcc.Store(id='chart-tail'),
+    dcc.Interval(id='intraday-refresh', interval=REFRESH_SECONDS * 1000, disabled=True),
+    html.Div(
+        [html.Div(id=f'{panel}-panel') for panel in PANELS],
+        id='output-container-button',
+        style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center'},
+    ),
+
+    html.Div([
+        html.H3("Screener", style={'textAlign': 'center', 'color': 'white'}),
+        dcc.Input(
+            id='screener-symbols',
+            value='',
+            placeholder='Symbols (comma separated, blank for all)',
+            type='text',
+            style={'width': '400px', 'borderRadius': '10px', 'marginBottom': '10px'}
+        ),
+        dcc.Checklist(
+            id='screener-filters',
+            options=[{'label': label, 'value': key} for key, (label, _) in SCREENER_FILTERS.items()],
+            value=[],
+            inline=True,
+            style={'color': 'white', 'marginBottom': '10px'},
+            inputStyle={'margin-left': '10px', 'margin-right': '4px'}
+        ),
+        html.Button('Run Screener', id='screener-run', style={'border-radius': '10px', 'padding': '10px 20px'}),
+        html.Div(id='screener-status', style={'color': 'white', 'margin': '10px'}),
+        dash_table.DataTable(
+            id='screener-table',
+            columns=[{'name': column, 'id': column} for column in SCREENER_COLUMNS],
+            sort_action='native',
+            filter_action='native',
+            page_size=25,
+            style_header={'backgroundColor': '#222222', 'color': 'white'},
+            style_cell={'backgroundColor': 'black', 'color': 'white', 'textAlign': 'left'}
+        ),
+    ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center', 'padding': '20px'}),
 
 ], style={'backgroundColor': '#000000'})
 
@@ -136,45 +262,70 @@ app.layout = html.Div([
     Output('stock-names', 'children'),
     [Input('text-input', 'value')]
 )
+@instrument('update_stock_name_suggestions')
 def update_stock_name_suggestions(value):
-    suggestions = [stock for stock in stocks_names if value.lower() in stock.lower()]
+    with stage('search'):
+        suggestions = get_ticker_index().search(value or '')
     return [html.Option(value=suggestion) for suggestion in suggestions]
 
+# Prometheus scrape endpoint
+@server.route('/metrics')
+def metrics_endpoint():
+    body, content_type = exposition()
+    return Response(body, content_type=content_type)
+
+@server.route('/stream/price/<symbol>/<exchange>')
+def stream_price(symbol, exchange):
+    if exchange not in EXCHANGE_SESSIONS:
+        abort(404)
+    return Response(
+        stream_with_context(poller.stream(symbol, exchange)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
 @app.callback(
-    Output('live-price-output', 'children'),
-    [Input('submit-val', 'n_clicks'),
-     Input('interval-component', 'n_intervals')],
+    [Output('live-price-output', 'children'),
+     Output('price-stream-url', 'data')],
+    [Input('submit-val', 'n_clicks')],
     [State('text-input', 'value'),
     State('radio-items', 'value'),
 ]
 )
 
-# Stock Live Price
-def update_stock_price(n_clicks, n_intervals, value,radio_value):
-    if ".NS"==radio_value:
-        radio="NSE"
-    elif ".Bo"==radio_value:
-        radio="BOM"
-    else :
-        radio="NASDAQ"
+# Stock Live Price: first quote on submit, later changes arrive over the price stream
+@instrument('update_stock_price')
+@profiling.profiled('update_stock_price')
+def update_stock_price(n_clicks, value,radio_value):
+    radio = exchange_for_suffix(radio_value)
     try:
-        if n_clicks or n_intervals:
-            url = f'https://www.google.com/finance/quote/{value}:{radio}'
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            class1 = "YMlKec fxKbKc"
-            live_price = soup.find(class_=class1).text
-            sf="Price "+live_price
+        if n_clicks:
+            stream_url = f"/stream/price/{url_quote(value, safe='')}/{radio}"
+            with stage('quote'):
+                quote = poller.quote(value, radio)
+            if quote is None:
+                return "Fetching live price...", stream_url
+            if quote['price'] is None:
+                return f"Error fetching live price: {quote['error']}", stream_url
+            sf="Price "+quote['price']
             return html.Div([
                 html.Div(sf, style={'color': 'Green','textAlign': 'center','font-size': '25px' })
-            ])
+            ]), stream_url
     except Exception as e:
-        return f"Error fetching live price: {str(e)}"
+        record_error()
+        return f"Error fetching live price: {str(e)}", None
+    return "Price", None
+
+app.clientside_callback(
+    ClientsideFunction(namespace='live_price', function_name='subscribe'),
+    Output('price-stream-subscribed', 'data'),
+    Input('price-stream-url', 'data'),
+)
 
         
 
 # Stock Information
-def display_stock_info(info, yf_data, period, full_stock_name):
+def display_stock_info(info, earning_date_info, period, historical_data):
     company_name = info.get('shortName', '')
     market_cap = info.get('marketCap', '')
     market_cap_suffixes = {
@@ -184,16 +335,17 @@ def display_stock_info(info, yf_data, period, full_stock_name):
     }
     magnitude = len(str(market_cap))
     suffix = market_cap_suffixes.get((magnitude - 1) // 3 * 3, '')
-    formatted_market_cap = f"{market_cap / 10 ** ((magnitude - 1) // 3 * 3):,.2f} {suffix}" if suffix else f"{market_cap:,.0f}"
+    if not market_cap:
+        formatted_market_cap = 'Not available'
+    else:
+        formatted_market_cap = f"{market_cap / 10 ** ((magnitude - 1) // 3 * 3):,.2f} {suffix}" if suffix else f"{market_cap:,.0f}"
 
-    stock_currency = info.get('financialCurrency')  
+    stock_currency = info.get('financialCurrency', '')  
     sector = info.get('sector', '')
 
-    earning_date_info = yf_data.stock_earning_date()
     next_earning_dates = earning_date_info.get('Earnings Date', [])
     next_earning_date_str = ', '.join([str(date) for date in next_earning_dates]) if next_earning_dates else 'Not available'
 
-    historical_data = yf.download(full_stock_name, period=period)
     if not historical_data.empty:
         first_close = historical_data['Close'].iloc[0]
         last_close = historical_data['Close'].iloc[-1]
@@ -227,14 +379,12 @@ def display_stock_info(info, yf_data, period, full_stock_name):
 
     return stock_info
 
-import numpy as np
-from sklearn.linear_model import LinearRegression
-from datetime import datetime, timedelta
+# Standard deviations of the residuals between the regression line and each channel band
+CHANNEL_SIGMAS = 2
 
-# Candle Chart , Candle Patterns, Moving averages, Linear Regeression
-def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, future_days):
-    title_html = stock_name
-    company_logo_url = f"https://logo.clearbit.com/{stock_name}.com"
+# Moving averages, Linear Regression and its channel, as the traces that sit at positions 1-7 of the candle chart.
+# Kept separate so changing a window or the horizon can patch just these traces.
+def trend_traces(data, short_ma, medium_ma, long_ma, future_days, x_range=None):
     if short_ma ==0:
         short_ma=1
     else:
@@ -249,13 +399,9 @@ def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, fu
         long_ma
     
     
-    data = Talib.calculate_moving_averages(data, short_ma, medium_ma, long_ma)
-    data = Talib.handle_candle_pattern(data)
-
-    X = np.arange(len(data)).reshape(-1, 1)
-    y = data['Close'].values.reshape(-1, 1)
-    reg = LinearRegression().fit(X, y)
-    linear_regression_line = reg.predict(X)
+    with stage('indicators'):
+        data = Talib.calculate_moving_averages(data, short_ma, medium_ma, long_ma)
+        fit = linear_fit(data['Close'].to_numpy())
 
     if future_days ==0:
         future_days=1
@@ -263,118 +409,134 @@ def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, fu
         future_days
 
 
-    future_X = np.arange(len(data), len(data) + future_days).reshape(-1, 1)
-    future_linear_regression_line = reg.predict(future_X)
+    future_linear_regression_line = fit_line(fit, len(data), len(data) + future_days)
+    future_x = future_regression_x(data, future_days)
+    data['Linear Regression'] = fit_line(fit, 0, len(data))
+    data['Upper Band'], data['Lower Band'] = channel(data['Linear Regression'], fit['sigma'], CHANNEL_SIGMAS)
 
-    # std_dev = data['Close'].rolling(window=20).std()
-    # upper_band = linear_regression_line.flatten() + 2 * std_dev
-    # lower_band = linear_regression_line.flatten() - 2 * std_dev
+    # Indicators use the whole frame; only the visible window is drawn, cut down to the chart width
+    view = window(data, x_range)
 
-    candle_trace = go.Candlestick(
-        x=data.index,
-        open=data['Open'],
-        high=data['High'],
-        low=data['Low'],
-        close=data['Close'],
-        name='Candlestick'
-    )
- 
+    short_ma_x, short_ma_y = line(view.index, view['Short MA'])
     short_ma_trace = go.Scatter(
-        x=data.index,
-        y=data['Short MA'],
+        x=short_ma_x,
+        y=short_ma_y,
         mode='lines',
         name=f'Short MA({short_ma})',
         line=dict(color='blue')
     )
     
+    medium_ma_x, medium_ma_y = line(view.index, view['Medium MA'])
     medium_ma_trace = go.Scatter(
-        x=data.index,
-        y=data['Medium MA'],
+        x=medium_ma_x,
+        y=medium_ma_y,
         mode='lines',
         name=f'Medium MA({medium_ma})',
         line=dict(color='green')
     )
 
+    long_ma_x, long_ma_y = line(view.index, view['Long MA'])
     long_ma_trace = go.Scatter(
-        x=data.index,
-        y=data['Long MA'],
+        x=long_ma_x,
+        y=long_ma_y,
         mode='lines',
         name=f'Long MA({long_ma})',
         line=dict(color='red')
     )
     
+    regression_x, regression_y = line(view.index, view['Linear Regression'])
     linear_regression_trace = go.Scatter(
-        x=data.index,
-        y=linear_regression_line.flatten(),
+        x=regression_x,
+        y=regression_y,
         mode='lines',
         name='Linear Regression',
         line=dict(color='orange', dash='dash')
     )
 
     future_linear_regression_trace = go.Scatter(
-        x=[data.index[-1] + timedelta(days=i) for i in range(1, future_days + 1)],
-        y=future_linear_regression_line.flatten(),
+        x=future_x,
+        y=future_linear_regression_line,
         mode='lines',
         name=f'Future Linear Regression ({future_days} days)',
         line=dict(color='Cyan', dash='dash')
     )
 
-    # upper_band_trace = go.Scatter(
-    #     x=data.index,
-    #     y=upper_band,
-    #     mode='lines',
-    #     name='Upper Band',
-    #     line=dict(color='green', dash='dash')
-    # )
+    upper_band_x, upper_band_y = line(view.index, view['Upper Band'])
+    upper_band_trace = go.Scatter(
+        x=upper_band_x,
+        y=upper_band_y,
+        mode='lines',
+        name=f'Upper Band (+{CHANNEL_SIGMAS}σ)',
+        line=dict(color='green', dash='dot')
+    )
+
+    lower_band_x, lower_band_y = line(view.index, view['Lower Band'])
+    lower_band_trace = go.Scatter(
+        x=lower_band_x,
+        y=lower_band_y,
+        mode='lines',
+        name=f'Lower Band (-{CHANNEL_SIGMAS}σ)',
+        line=dict(color='red', dash='dot')
+    )
+    return [short_ma_trace, medium_ma_trace, long_ma_trace, linear_regression_trace, future_linear_regression_trace,
+            upper_band_trace, lower_band_trace]
+
+def future_regression_x(data, future_days):
+    return [data.index[-1] + timedelta(days=i) for i in range(1, future_days + 1)]
+
+# Candle Chart , Candle Patterns, Moving averages, Linear Regeression
+def candle_figure(data, rangebreaks, short_ma, medium_ma, long_ma, future_days, x_range=None):
+    with stage('indicators'):
+        data = Talib.handle_candle_pattern(data)
+    view = window(data, x_range)
+    candles = ohlcv(view)
 
-    # lower_band_trace = go.Scatter(
-    #     x=data.index,
-    #     y=lower_band,
-    #     mode='lines',
-    #     name='Lower Band',
-    #     line=dict(color='red', dash='dash')
-    # )
+    candle_trace = go.Candlestick(
+        x=candles.index,
+        open=candles['Open'],
+        high=candles['High'],
+        low=candles['Low'],
+        close=candles['Close'],
+        name='Candlestick'
+    )
 
     pattern_colors = ['Orange', 'Cyan', 'Fuchsia', 'red', 'SpringGreen', 'yellow', 'Chartreuse', 'magenta']  
+
+    # Pattern traces carry only the bars where the pattern hit. One trace per pattern rather than
+    # a single combined trace, so each description is sent once instead of once per hit.
     start_index = 3
-    
+    pattern_columns = [column for column in view.columns if column.endswith('_result')]
+    hits = view[pattern_columns].notna().to_numpy()
+
     pattern_traces = []
-    color_index = 0
-    
-    for pattern in data.columns:
-        if pattern.endswith('_result'):
-            pattern_name = pattern[start_index:].replace('_result', '').replace('_', ' ').title()
-            color = pattern_colors[color_index % len(pattern_colors)]
-            pattern_key = pattern[:-len('_result')]  
-            pattern_description = candle_patterns[pattern_key]['description']  
-    
-            pattern_trace = go.Scatter(
-                x=data.index,
-                y=data[pattern],
-                mode='markers',
-                name=pattern_name,
-                marker=dict(
-                    color=color,
-                    size=15,
-                ),
-                opacity=0.8,
-                text=pattern_description, 
-            )
-    
-            pattern_traces.append(pattern_trace)
-            color_index += 1
+    for color_index, pattern in enumerate(pattern_columns):
+        pattern_name = pattern[start_index:].replace('_result', '').replace('_', ' ').title()
+        color = pattern_colors[color_index % len(pattern_colors)]
+        pattern_key = pattern[:-len('_result')]  
+        pattern_description = candle_patterns[pattern_key]['description']  
+        hit_index = view.index[hits[:, color_index]]
+
+        pattern_trace = go.Scatter(
+            x=hit_index,
+            y=np.ones(len(hit_index)),
+            mode='markers',
+            name=pattern_name,
+            marker=dict(
+                color=color,
+                size=15,
+            ),
+            opacity=0.8,
+            text=pattern_description, 
+        )
+        pattern_traces.append(pattern_trace)
 
 
+    from plotly.subplots import make_subplots
     fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.05)
 
     fig.add_trace(candle_trace, row=1, col=1)
-    fig.add_trace(short_ma_trace, row=1, col=1)
-    fig.add_trace(medium_ma_trace, row=1, col=1)
-    fig.add_trace(long_ma_trace, row=1, col=1)
-    fig.add_trace(linear_regression_trace, row=1, col=1)
-    fig.add_trace(future_linear_regression_trace, row=1, col=1)
-    # fig.add_trace(upper_band_trace, row=1, col=1)
-    # fig.add_trace(lower_band_trace, row=1, col=1)
+    for trend_trace in trend_traces(data, short_ma, medium_ma, long_ma, future_days, x_range):
+        fig.add_trace(trend_trace, row=1, col=1)
 
     for pattern_trace in pattern_traces:
         fig.add_trace(pattern_trace, row=2, col=1)
@@ -384,7 +546,8 @@ def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, fu
             title=f'<span style="color:{pattern_colors[0]}; font-size: 18px;">&#x2022; Doji </span> <span style="color:{pattern_colors[1]}; font-size: 18px;">&#x2022; Engulfing </span><span style="color:{pattern_colors[2]}; font-size: 18px;">&#x2022; Hammer </span><span style="color:{pattern_colors[3]}; font-size: 18px;">&#x2022; Hanging Man </span><span style="color:{pattern_colors[4]}; font-size: 18px;">&#x2022; Harami </span><span style="color:{pattern_colors[5]}; font-size: 18px;">&#x2022; Inverted Hammer </span><span style="color:{pattern_colors[6]}; font-size: 18px;">&#x2022; Shooting Star</span> ',
 
             rangebreaks=rangebreaks,
-            rangeslider={'visible': False}
+            rangeslider={'visible': False},
+            range=x_range,
         ),
         yaxis=dict(
             title='Price'
@@ -398,8 +561,14 @@ def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, fu
         hovermode='x unified',
         hoverlabel=dict(bgcolor='#FFFFFF', font=dict(color='#333333')),
         template='plotly_dark',
+        uirevision='candle-chart',
    
     )
+    return fig
+
+def Candle_chart(stock_name, fig):
+    title_html = stock_name
+    company_logo_url = f"https://logo.clearbit.com/{stock_name}.com"
 
     company_logo = html.Img(
         src=company_logo_url, 
@@ -419,11 +588,12 @@ def Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma, fu
     return div
 
 #Volume chart
-def sub_plot(data, stock_name, rangebreaks):
+def volume_figure(data, rangebreaks):
+    candles = ohlcv(data)
     volume_trace = go.Bar(
         
-        x=data.index,
-        y=data['Volume'],
+        x=candles.index,
+        y=candles['Volume'],
         name='Volume',
         marker=dict(color='cyan')     
     )
@@ -446,32 +616,25 @@ def sub_plot(data, stock_name, rangebreaks):
 
     fig = go.Figure(data=[volume_trace], layout=layout)
     
+    return fig
+
+def sub_plot(fig):
     return html.Div(
     html.Div([
         html.H3("Volume", style={'textAlign': 'center', 'color': 'white'}),
-        dcc.Graph(id='data-chart', figure=fig)
+        dcc.Graph(id='volume-chart', figure=fig)
     ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
 )
 
 # Rsi( Relative Strength Index) Chart 
-def Rsi( stock_name, rangebreaks,yf_data,period,interval_time):
-    if period=="1D":
-        period="1y"
-    elif period=='5D':
-        period="1y"
-    elif period=="1mo":
-        period="1y"
-    elif period=="3mo":
-        period="1y"
-    elif period=="6mo":
-        period="1y"
-    
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-    rsi = Talib.calculate_rsi(data)
+def rsi_figure(data, rangebreaks):
+    with stage('indicators'):
+        rsi = Talib.calculate_rsi(data)
     
+    rsi_x, rsi_y = line(data.index, rsi)
     rsi_trace = go.Scatter(
-        x=data.index,
-        y=rsi,
+        x=rsi_x,
+        y=rsi_y,
         mode='lines',
         name='RSI',
         line=dict(color='orange'),
@@ -506,43 +669,37 @@ def Rsi( stock_name, rangebreaks,yf_data,period,interval_time):
         template='plotly_dark'
     )
 
+    return fig
+
+def Rsi(fig):
     return html.Div(
         html.Div([
             html.H3("RSI (Relative Strength Index)", style={'textAlign': 'center', 'color': 'white'}),
             
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='rsi-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
     )
 
 
 # Macd(Moving Average Convergence Divergence) Chart
-def macd( stock_name, rangebreaks,period,interval_time,yf_data):
-    if period=="1D":
-        period="1y"
-    elif period=='5D':
-        period="1y"
-    elif period=="1mo":
-        period="1y"
-    elif period=="3mo":
-        period="1y"
-    elif period=="6mo":
-        period="1y"
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-
-    data = Talib.calculate_macd(data)
+def macd_figure(data, rangebreaks):
+    with stage('indicators'):
+        data = Talib.calculate_macd(data)
 
+    macd_x, macd_y = line(data.index, data['MACD'])
     macd_trace = go.Scatter(
-        x=data.index,
-        y=data['MACD'],
+        x=macd_x,
+        y=macd_y,
         mode='lines',
         name='MACD',
         line=dict(color='blue'),
         yaxis='y2'
     )
 
+    signal_x, signal_y = line(data.index, data['Signal'])
     signal_trace = go.Scatter(
-        x=data.index,
-        y=data['Signal'],
+        x=signal_x,
+        y=signal_y,
         mode='lines',
         name='Signal',
         line=dict(color='red'),
@@ -581,52 +738,45 @@ def macd( stock_name, rangebreaks,period,interval_time,yf_data):
         template='plotly_dark'
     )
 
+    return fig
+
+def macd(fig):
     return html.Div(
         html.Div([
             html.H3("MACD (Moving Average Convergence Divergence)", style={'textAlign': 'center', 'color': 'white'}),
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='macd-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
     )
 
 
 # DMI (Directional Movement Index) and ADX (Average Directional Index)
-def dmi_adx( stock_name, rangebreaks,period,interval_time,yf_data):
-    if period=="1D":
-        period="6mo"
-    elif period=='5D':
-        period="6mo"
-    elif period=="1mo":
-        period="14mo"
-    elif period=="3mo":
-        period="1y"
-    elif period=="6mo":
-        period="1y"
-
-
-
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-    Talib.calculate_dmi_and_adx(data)
+def dmi_adx_figure(data, rangebreaks):
+    with stage('indicators'):
+        Talib.calculate_dmi_and_adx(data)
+    plus_di_x, plus_di_y = line(data.index, data['Plus DI'])
     plus_di_trace = go.Scatter(
-        x=data.index,
-        y=data['Plus DI'],
+        x=plus_di_x,
+        y=plus_di_y,
         mode='lines',
         name='Plus DI',
         line=dict(color='green'),
         yaxis='y2'
     )
 
+    minus_di_x, minus_di_y = line(data.index, data['Minus DI'])
     minus_di_trace = go.Scatter(
-        x=data.index,
-        y=data['Minus DI'],
+        x=minus_di_x,
+        y=minus_di_y,
         mode='lines',
         name='Minus DI',
         line=dict(color='red'),
         yaxis='y2'
     )
 
+    adx_x, adx_y = line(data.index, data['ADX'])
     adx_trace = go.Scatter(
-        x=data.index,
-        y=data['ADX'],
+        x=adx_x,
+        y=adx_y,
         mode='lines',
         name='ADX',
         line=dict(color='blue'),
@@ -658,31 +808,25 @@ def dmi_adx( stock_name, rangebreaks,period,interval_time,yf_data):
         template='plotly_dark'
     )
 
+    return fig
+
+def dmi_adx(fig):
     return html.Div(
         html.Div([
             html.H3("DMI (Directional Movement Index) and ADX (Average Directional Index)", style={'textAlign': 'center', 'color': 'white'}),
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='dmi-adx-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
     )
 
 # Atr(Average True Range) chart
-def Atr(stock_name, rangebreaks,period,interval_time,yf_data):
-    if period=="1D":
-        period="6mo"
-    elif period=='5D':
-        period="6mo"
-    elif period=="1mo":
-        period="1y"
-    elif period=="3mo":
-        period="1y"
-    elif period=="6mo":
-        period="1y"
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-    data = Talib.calculate_atr(data)
+def atr_figure(data, rangebreaks):
+    with stage('indicators'):
+        data = Talib.calculate_atr(data)
     
+    atr_x, atr_y = line(data.index, data['ATR'])
     atr_trace = go.Scatter(
-        x=data.index,
-        y=data['ATR'],
+        x=atr_x,
+        y=atr_y,
         mode='lines',
         name='ATR',
         line=dict(color='orange'),
@@ -714,31 +858,25 @@ def Atr(stock_name, rangebreaks,period,interval_time,yf_data):
         template='plotly_dark'
     )
 
+    return fig
+
+def Atr(fig):
     return html.Div(
         html.Div([
             html.H3("ATR (Average True Range)", style={'textAlign': 'center', 'color': 'white'}),
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='atr-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
     )
     
 # Roc(Rate of Change) Chart
-def Roc(stock_name, rangebreaks,period,interval_time,yf_data):
-    if period=="1D":
-        period="6mo"
-    elif period=='5D':
-        period="6mo"
-    elif period=="1mo":
-        period="1y"
-    elif period=="3mo":
-        period="1y"
-    elif period=="6mo":
-        period="1y"
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-    data = Talib.calculate_roc(data)
+def roc_figure(data, rangebreaks):
+    with stage('indicators'):
+        data = Talib.calculate_roc(data)
     
+    roc_x, roc_y = line(data.index, data['ROC'])
     roc_trace = go.Scatter(
-        x=data.index,
-        y=data['ROC'],
+        x=roc_x,
+        y=roc_y,
         mode='lines',
         name='ROC',
         line=dict(color='purple'),
@@ -770,33 +908,26 @@ def Roc(stock_name, rangebreaks,period,interval_time,yf_data):
         template='plotly_dark'
     )
 
+    return fig
+
+def Roc(fig):
     return html.Div(
         html.Div([
             html.H3("ROC (Rate of Change)", style={'textAlign': 'center', 'color': 'white'}),
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='roc-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center','border': '1px solid white'})
     )
     
 
 # bolling bbdas    
-def bollinger_bbdas(data, rangebreaks, period, interval_time, yf_data):
-    if period == "1D":
-        period = "6mo"
-    elif period == '5D':
-        period = "6mo"
-    elif period == "1mo":
-        period = "1y"
-    elif period == "3mo":
-        period = "1y"
-    elif period == "6mo":
-        period = "1y"
-
-    data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-    data = Talib.calculate_bollinger_bands_width(data)
+def bollinger_figure(data, rangebreaks):
+    with stage('indicators'):
+        data = Talib.calculate_bollinger_bands_width(data)
 
+    bb_width_x, bb_width_y = line(data.index, data['BB_Width'])
     bb_width_trace = go.Scatter(
-        x=data.index,
-        y=data['BB_Width'],  
+        x=bb_width_x,
+        y=bb_width_y,  
         mode='lines',
         name='Bollinger Bands Width',
         line=dict(color='purple'),
@@ -828,10 +959,13 @@ def bollinger_bbdas(data, rangebreaks, period, interval_time, yf_data):
         template='plotly_dark'
     )
 
+    return fig
+
+def bollinger_bbdas(fig):
     return html.Div(
         html.Div([
             html.H3("Bollinger Bands Width", style={'textAlign': 'center', 'color': 'white'}),
-            dcc.Graph(id='data-chart', figure=fig)
+            dcc.Graph(id='bollinger-chart', figure=fig)
         ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center', 'border': '1px solid white'})
     )
 
@@ -853,8 +987,11 @@ def create_news_table(news_data):
 
    
 
+# Main Function: a submit only records the request. Every panel has its own callback driven by
+# stock-request, so panels render as they finish and one failing panel does not blank the page.
 @app.callback(
-    Output('output-container-button', 'children'),
+    [Output('stock-request', 'data'),
+     Output('chart-params', 'data')],
     [Input('submit-val', 'n_clicks')],
     [State('text-input', 'value'),
      State('radio-items', 'value'),
@@ -866,80 +1003,346 @@ def create_news_table(news_data):
      State('Linear-input', 'value')
 
     ],
+    prevent_initial_call=True,
 )
+@instrument('stock')
+@profiling.profiled('stock')
+def stock(n_clicks, value, radio_value, period, interval_time, short_ma, medium_ma, long_ma,Linear_input):
+    if not n_clicks or not value:
+        raise PreventUpdate
+    full_stock_name = value + radio_value
+    if full_stock_name[-3:]==".BO":
+        stock_name=full_stock_name[:-3]
+    elif full_stock_name[-3:]==".NS":
+        stock_name=full_stock_name[:-3]
+    else:
+        stock_name=full_stock_name
+
+    request = {
+        'symbol': full_stock_name,
+        'stock_name': stock_name,
+        'period': period,
+        'interval': interval_time,
+        'ma': [short_ma, medium_ma, long_ma],
+        'future_days': Linear_input,
+        'x_range': None,
+    }
+    # Start the history download now; the panel callbacks arriving next join it through the cache
+    fetch_pool.submit(HistoryPlan(period).fetch, Yfinance(full_stock_name), interval_time)
+    return request, request
 
 
-        
+# History of a submitted request from the shared cache/store. Concurrent panels asking for the
+# same request are coalesced by the cache into one upstream download.
+def request_history(request):
+    plan = HistoryPlan(request['period'])
+    with stage('fetch'):
+        if profiling.active():
+            # On the profiled thread, so the profile shows the fetch and store refresh
+            history = plan.fetch(Yfinance(request['symbol']), request['interval'])
+        else:
+            history = fetch_pool.submit(plan.fetch, Yfinance(request['symbol']), request['interval']).result(timeout=FETCH_TIMEOUTS['history'])
+    return plan, history
 
-# Main Function
-def stock(n_clicks, value, radio_value, period, interval_time, short_ma, medium_ma, long_ma,Linear_input):
-    try:
-        if n_clicks:
-            full_stock_name = value + radio_value
-            yf_data = Yfinance(full_stock_name)  
-            info = yf_data.stock_info()
 
-            if full_stock_name[-3:]==".BO":
-                stock_name=full_stock_name[:-3]
-            elif full_stock_name[-3:]==".NS":
-                stock_name=full_stock_name[:-3]
-            else:
-                stock_name=full_stock_name
+def panel_error(e):
+    record_error()
+    return html.Div(f"An error occurred: {str(e)}", style={'color': 'white'})
 
 
-            future_days = Linear_input  
+# Shown instead of a chart when upstream has no bars for the request, e.g. a mistyped ticker
+def no_data(request):
+    return html.Div(f"No price data for {request['symbol']} at the {request['interval']} interval", style={'color': 'white'})
 
-            data = yf_data.fetch_stock_data(period=period, interval=interval_time)
-            rangebreaks = get_range_breaks(data)
-            candle_chart = Candle_chart(data, stock_name, rangebreaks, short_ma, medium_ma, long_ma,future_days)
-            stock_info = display_stock_info(info, yf_data, period, full_stock_name)  
-            Sub_plot = sub_plot(data, stock_name, rangebreaks)
-            rsi = Rsi(stock_name, rangebreaks, yf_data, period, interval_time)
-            Mcd = macd(stock_name, rangebreaks, period, interval_time, yf_data)
-            Rock = Roc(stock_name, rangebreaks, period, interval_time, yf_data)
-            earnings = yf_data.stock_earning_date() 
-            Dmi_Adx = dmi_adx(stock_name, rangebreaks, period, interval_time, yf_data)  
-            atr = Atr(stock_name, rangebreaks, period, interval_time, yf_data)  
-            news = yf_data.stock_news()
-            news_table = create_news_table(news)
-            boling= bollinger_bbdas(data, rangebreaks, period, interval_time, yf_data)
 
+# The full-view candle chart of a request, shared through the figure cache
+def full_candle_figure(request, history, data):
+    rangebreaks = get_range_breaks(history, request['symbol'], request['interval'])
+    key = figure_version(request['symbol'], request['interval'], request['period'], history) + (
+        'candle', *request['ma'], request['future_days'])
+    return cached_figure(key, lambda: candle_figure(data, rangebreaks, *request['ma'], request['future_days']),
+                         history_ttl(request['interval']))
 
 
-            return html.Div([
-                stock_info,
-                candle_chart,
-                Sub_plot,
-                rsi,
-                Mcd,
-                Dmi_Adx,
-                boling,
-                atr,
-                Rock,
-                news_table,
-
-            ], style={'display': 'flex', 'flex-direction': 'column', 'align-items': 'center'})
+@app.callback(
+    [Output('candle-panel', 'children'),
+     Output('chart-tail', 'data')],
+    [Input('stock-request', 'data')],
+    prevent_initial_call=True,
+)
+@instrument('candle_panel')
+@profiling.profiled('candle_panel')
+def candle_panel(request):
+    try:
+        plan, history = request_history(request)
+        if history.empty:
+            return no_data(request), None
+        data = plan.slice()
+        return Candle_chart(request['stock_name'], full_candle_figure(request, history, data)), chart_tail(data)
     except Exception as e:
-        error_message = str(e)
-        return html.Div(f"An error occurred: {error_message}")
-
-#rang breaker
-def get_range_breaks(data):
-    date_series = pd.Series(data.index)
-    gaps = date_series[date_series.diff() > pd.Timedelta(days=1)]
-    rangebreaks = []
-
-    for idx in gaps.index:
-        rangebreaks.append(
-            {
-                "bounds": [
-                    date_series.iloc[idx - 1] + pd.Timedelta(days=1),
-                    date_series.iloc[idx]
-                ]
-            }
-        )
-    
-    return rangebreaks
+        return panel_error(e), None
+
+
+# Indicator panels: panel -> (wrapper, figure builder, HistoryPlan panel whose warm-up slice it draws)
+INDICATOR_PANELS = {
+    'volume': (sub_plot, volume_figure, None),
+    'rsi': (Rsi, rsi_figure, 'rsi'),
+    'macd': (macd, macd_figure, 'macd'),
+    'dmi-adx': (dmi_adx, dmi_adx_figure, 'dmi_adx'),
+    'bollinger': (bollinger_bbdas, bollinger_figure, 'bollinger'),
+    'atr': (Atr, atr_figure, 'atr'),
+    'roc': (Roc, roc_figure, 'roc'),
+}
+
+
+def register_indicator_panel(panel, wrapper, build, plan_panel):
+    @app.callback(
+        Output(f'{panel}-panel', 'children'),
+        [Input('stock-request', 'data')],
+        prevent_initial_call=True,
+    )
+    @instrument(f'{panel}_panel')
+    @profiling.profiled(f'{panel}_panel')
+    def indicator_panel(request):
+        try:
+            plan, history = request_history(request)
+            if history.empty:
+                return no_data(request)
+            rangebreaks = get_range_breaks(history, request['symbol'], request['interval'])
+            key = figure_version(request['symbol'], request['interval'], request['period'], history) + (panel,)
+            return wrapper(cached_figure(key, lambda: build(plan.slice(plan_panel), rangebreaks), history_ttl(request['interval'])))
+        except Exception as e:
+            return panel_error(e)
+    return indicator_panel
+
+
+for _panel, (_wrapper, _build, _plan_panel) in INDICATOR_PANELS.items():
+    register_indicator_panel(_panel, _wrapper, _build, _plan_panel)
+
+
+# Info and news wait on the slowest upstream sources, so they run as background jobs and
+# never hold up a request worker the chart panels need
+@app.callback(
+    Output('info-panel', 'children'),
+    [Input('stock-request', 'data')],
+    background=True,
+    prevent_initial_call=True,
+)
+def info_panel(request):
+    try:
+        yf_data = Yfinance(request['symbol'])
+        info = fetch_pool.submit(yf_data.stock_info)
+        earnings = fetch_pool.submit(yf_data.stock_earning_date)
+        plan, history = request_history(request)
+        return display_stock_info(fetch_result(info, FETCH_TIMEOUTS['info'], {}),
+                                  fetch_result(earnings, FETCH_TIMEOUTS['calendar'], {}),
+                                  request['period'], plan.slice())
+    except Exception as e:
+        return panel_error(e)
+
+
+@app.callback(
+    Output('news-panel', 'children'),
+    [Input('stock-request', 'data')],
+    background=True,
+    prevent_initial_call=True,
+)
+def news_panel(request):
+    news = fetch_result(fetch_pool.submit(Yfinance(request['symbol']).stock_news), FETCH_TIMEOUTS['news'], None)
+    if news is None:
+        return html.Div("News unavailable", style={'color': 'white'})
+    return create_news_table(news)
+
+# Zooming or panning the candle chart redraws just the visible bars at full resolution.
+# History comes from the same cache/store as the submit, so this is normally a local read.
+@app.callback(
+    [Output('data-chart', 'figure'),
+     Output('chart-params', 'data', allow_duplicate=True),
+     Output('chart-tail', 'data', allow_duplicate=True)],
+    [Input('data-chart', 'relayoutData')],
+    [State('chart-params', 'data')],
+    prevent_initial_call=True,
+)
+@instrument('zoom_candle_chart')
+def zoom_candle_chart(relayout_data, chart_params):
+    x_range = visible_range(relayout_data)
+    if x_range is None or not chart_params:
+        raise PreventUpdate
+    plan, history = request_history(chart_params)
+    if history.empty:
+        raise PreventUpdate
+    data = plan.slice()
+    if x_range == 'auto':
+        # Back to the full view, which is the figure the submit already cached
+        return full_candle_figure(chart_params, history, data), dict(chart_params, x_range=None), chart_tail(data)
+    fig = candle_figure(data, get_range_breaks(history, chart_params['symbol'], chart_params['interval']), *chart_params['ma'], chart_params['future_days'], x_range=x_range)
+    return fig, dict(chart_params, x_range=x_range), no_update
+
+# A new MA window or regression horizon only replaces the five trend traces of the chart on screen;
+# the history is the cached frame, and the other panels and the news are left alone
+@app.callback(
+    [Output('data-chart', 'figure', allow_duplicate=True),
+     Output('chart-params', 'data', allow_duplicate=True)],
+    [Input('short-ma-input', 'value'),
+     Input('medium-ma-input', 'value'),
+     Input('long-ma-input', 'value'),
+     Input('Linear-input', 'value')],
+    [State('chart-params', 'data'),
+     State('chart-tail', 'data')],
+    prevent_initial_call=True,
+)
+@instrument('update_trend_traces')
+def update_trend_traces(short_ma, medium_ma, long_ma, future_days, chart_params, tail):
+    if not chart_params or None in (short_ma, medium_ma, long_ma, future_days):
+        raise PreventUpdate
+    if [short_ma, medium_ma, long_ma] == chart_params['ma'] and future_days == chart_params['future_days']:
+        raise PreventUpdate
+    plan, history = request_history(chart_params)
+    if history.empty:
+        raise PreventUpdate
+    # A live chart may be behind the history; the traces must line up with the candles on screen
+    traces = trend_traces(drawn_bars(plan.slice(), tail), short_ma, medium_ma, long_ma, future_days, chart_params.get('x_range'))
+
+    patched_figure = Patch()
+    for position, trace in enumerate(traces, start=1):
+        patched_figure['data'][position] = trace.to_plotly_json()
+    return patched_figure, dict(chart_params, ma=[short_ma, medium_ma, long_ma], future_days=future_days)
+
+# Live refresh only runs for intraday charts, and slows right down while the market is closed
+@app.callback(
+    [Output('intraday-refresh', 'disabled'),
+     Output('intraday-refresh', 'interval')],
+    [Input('stock-request', 'data')],
+    prevent_initial_call=True,
+)
+def toggle_intraday_refresh(request):
+    if request['interval'] not in INTRADAY_INTERVALS:
+        return True, no_update
+    return False, refresh_interval(request['symbol'])
+
+
+# Intraday charts are kept live: every tick patches the bars that arrived, and the revision of the
+# still-forming bar, onto the chart on screen, with the moving averages carried forward by the
+# streaming indicators. A new session, or a chart drawn downsampled, gets a full (cached) redraw
+# instead; a zoomed-in chart is left alone. Each tick also moves the timer between the open and
+# closed market pace when the session has opened or closed since.
+@app.callback(
+    [Output('data-chart', 'figure', allow_duplicate=True),
+     Output('chart-tail', 'data', allow_duplicate=True),
+     Output('intraday-refresh', 'interval', allow_duplicate=True)],
+    [Input('intraday-refresh', 'n_intervals')],
+    [State('chart-params', 'data'),
+     State('chart-tail', 'data'),
+     State('intraday-refresh', 'interval')],
+    prevent_initial_call=True,
+)
+@instrument('extend_candle_chart')
+def extend_candle_chart(n_intervals, chart_params, tail, current_interval):
+    if not chart_params or not tail or chart_params['interval'] not in INTRADAY_INTERVALS:
+        raise PreventUpdate
+    interval = refresh_interval(chart_params['symbol'])
+    interval_update = interval if interval != current_interval else no_update
+    try:
+        fig, tail = patch_candle_chart(chart_params, tail)
+    except PreventUpdate:
+        if interval_update is no_update:
+            raise
+        return no_update, no_update, interval_update
+    return fig, tail, interval_update
+
+
+def patch_candle_chart(chart_params, tail):
+    if chart_params.get('x_range'):
+        raise PreventUpdate
+    plan, history = request_history(chart_params)
+    if history.empty:
+        raise PreventUpdate
+    data = plan.slice()
+    timestamps = data.index.asi8
+    if (timestamps[-1] == tail['last'] and float(data['Close'].iloc[-1]) == tail['close']
+            and float(data['Volume'].iloc[-1]) == tail['volume']):
+        raise PreventUpdate
+    start = tail['count'] - 1
+    if (not full_resolution(data) or timestamps[0] != tail['first'] or start >= len(data)
+            or timestamps[start] != tail['last']):
+        return full_candle_figure(chart_params, history, data), chart_tail(data)
+
+    windows = ma_windows(chart_params['ma'])
+    live = live_indicators.get_or_load((chart_params['symbol'], chart_params['interval'], chart_params['period'], windows),
+                                       lambda: LiveIndicators(windows), LIVE_INDICATORS_TTL)
+    future_days = chart_params['future_days'] or 1
+    with stage('indicators'):
+        averages = live.sync(data)
+        fit = linear_fit(data['Close'].to_numpy())
+        hits, _ = Talib.candle_pattern_matrix(data)
+
+    new = data.iloc[start + 1:]
+    new_x = [timestamp.isoformat() for timestamp in new.index]
+    fig = Patch()
+    for column in ('Open', 'High', 'Low', 'Close'):
+        fig['data'][0][column.lower()][start] = float(data[column].iloc[start])
+        fig['data'][0][column.lower()].extend(new[column].tolist())
+    fig['data'][0]['x'].extend(new_x)
+    for position, field in enumerate(MA_FIELDS, start=1):
+        fig['data'][position]['y'][start] = float(averages[field][start])
+        fig['data'][position]['y'].extend(averages[field][start + 1:].tolist())
+        fig['data'][position]['x'].extend(new_x)
+    # The regression line and its channel move with every bar, so they are replaced rather than extended
+    regression = fit_line(fit, 0, len(data))
+    fig['data'][4]['x'].extend(new_x)
+    fig['data'][4]['y'] = regression.tolist()
+    fig['data'][5]['x'] = future_regression_x(data, future_days)
+    fig['data'][5]['y'] = fit_line(fit, len(data), len(data) + future_days).tolist()
+    for position, band in enumerate(channel(regression, fit['sigma'], CHANNEL_SIGMAS), start=6):
+        fig['data'][position]['x'].extend(new_x)
+        fig['data'][position]['y'] = band.tolist()
+    # The bar that was still forming may have gained or lost a pattern since it was drawn, so every
+    # pattern trace it had, or that it or a newer bar has now, is rebuilt whole (they only hold hits)
+    for column in sorted(set(tail.get('forming', range(hits.shape[1]))) | set(np.flatnonzero(hits[start:].any(axis=0)).tolist())):
+        hit_x = [timestamp.isoformat() for timestamp in data.index[hits[:, column] != 0]]
+        fig['data'][8 + column]['x'] = hit_x
+        fig['data'][8 + column]['y'] = [1.0] * len(hit_x)
+
+    return fig, chart_tail(data)
+
+# Screener over the whole universe (or the symbols typed in), one row per matching symbol.
+# A full scan downloads thousands of symbols, so like info and news it runs as a background job.
+@app.callback(
+    [Output('screener-table', 'data'),
+     Output('screener-status', 'children')],
+    [Input('screener-run', 'n_clicks')],
+    [State('screener-symbols', 'value'),
+     State('screener-filters', 'value'),
+     State('radio-items', 'value'),
+     State('period', 'value'),
+     State('interval_time', 'value'),
+     State('short-ma-input', 'value'),
+     State('medium-ma-input', 'value'),
+     State('long-ma-input', 'value')],
+    background=True,
+    running=[(Output('screener-run', 'disabled'), True, False)],
+    prevent_initial_call=True,
+)
+@instrument('run_screener')
+def run_screener(n_clicks, symbols, filters, radio_value, period, interval_time, short_ma, medium_ma, long_ma):
+    try:
+        names = [name.strip().upper() for name in symbols.split(',') if name.strip()] if symbols else get_ticker_index().names
+        universe = [name + radio_value for name in names]
+        ma_windows = tuple(max(window or 1, 1) for window in (short_ma, medium_ma, long_ma))
+        # Long MA needs its warm-up bars, so screen over the same widened history the panels use
+        table, throughput, failed = screen(universe, HistoryPlan(period).fetch_period, interval_time, filters, ma_windows)
+        status = f"{len(table)} of {len(universe)} symbols matched ({throughput:.1f} symbols/sec)"
+        if failed:
+            status += f", {failed} could not be fetched"
+        return table.round(2).to_dict('records'), status
+    except Exception as e:
+        record_error()
+        return [], f"An error occurred: {str(e)}"
+
+#rang breaker: weekend and session-hour patterns plus the exchange's holidays, shared by every chart of the history
+def get_range_breaks(data, symbol, interval):
+    with stage('rangebreaks'):
+        return range_breaks(data.index, interval, known_exchange_for_symbol(symbol))
 
 if __name__ == '__main__':
     app.run_server(debug=True)
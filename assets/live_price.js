@@ -0,0 +1,33 @@
+// Subscribes the "live-price-output" label to the server's price stream (Server-Sent Events)
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    live_price: {
+        subscribe: function(url) {
+            if (window.livePriceSource) {
+                window.livePriceSource.close();
+                window.livePriceSource = null;
+            }
+            if (!url) {
+                return '';
+            }
+            var quote = {};
+            var source = new EventSource(url);
+            source.onmessage = function(event) {
+                // Each message only carries the fields that changed since the previous one
+                Object.assign(quote, JSON.parse(event.data));
+                if (quote.price) {
+                    window.dash_clientside.set_props('live-price-output', {
+                        children: 'Price ' + quote.price,
+                        style: {'color': 'Green', 'textAlign': 'center', 'font-size': '25px', 'display': 'block'}
+                    });
+                } else if (quote.error) {
+                    window.dash_clientside.set_props('live-price-output', {
+                        children: 'Error fetching live price: ' + quote.error,
+                        style: {}
+                    });
+                }
+            };
+            window.livePriceSource = source;
+            return url;
+        }
+    }
+});
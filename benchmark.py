@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from ta_lib_utility import Talib
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+
+# A case regresses when it is this much slower (or bigger at peak) than the baseline; run-to-run
+# noise on a shared machine reaches about 25%
+DEFAULT_THRESHOLD = 0.5
+
+# Each timing repeats the call at least MIN_RUNS times and until MIN_TIMING_SECONDS are spent,
+# and keeps the best run
+MIN_RUNS = 5
+MIN_TIMING_SECONDS = 0.2
+
+
+# Deterministic OHLCV bars from geometric Brownian motion: closes follow GBM, opens gap from the
+# previous close, highs/lows extend past the body, volume is lognormal and grows with the move size.
+def gbm_ohlcv(rows, seed=0, start_price=100.0, drift=0.0, volatility=0.01):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(drift - volatility ** 2 / 2, volatility, rows)
+    close = start_price * np.exp(np.cumsum(returns))
+    previous = np.concatenate(([start_price], close[:-1]))
+    open_ = previous * np.exp(rng.normal(0, volatility / 4, rows))
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, volatility / 2, rows)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, volatility / 2, rows)))
+    volume = rng.lognormal(11, 0.5, rows) * (1 + np.abs(returns) / volatility)
+    # Minute bars keep a million rows inside pandas' timestamp range
+    index = pd.date_range('2000-01-03 09:15', periods=rows, freq='min', tz='Asia/Kolkata', name='Datetime')
+    return pd.DataFrame({
+        'Open': open_.round(2),
+        'High': high.round(2),
+        'Low': low.round(2),
+        'Close': close.round(2),
+        'Volume': volume.astype(np.int64),
+    }, index=index)
+
+
+# Every Talib indicator and candle pattern, found by name so new ones are benchmarked automatically,
+# plus the engines meant to replace them
+def benchmark_cases():
+    from indicator_kernel import indicators_for
+
+    cases = {}
+    for name in sorted(vars(Talib)):
+        if name.startswith(('calculate_', 'cdl')):
+            cases[name] = getattr(Talib, name)
+    cases['handle_candle_pattern'] = Talib.handle_candle_pattern
+    cases['candle_pattern_matrix'] = Talib.candle_pattern_matrix
+    cases['fused_indicators'] = indicators_for
+    return cases
+
+
+# Best wall time of `case` on a fresh copy of `data` (the copy is not timed; cases may mutate it)
+def time_case(case, data):
+    runs = []
+    while len(runs) < MIN_RUNS or sum(runs) < MIN_TIMING_SECONDS:
+        frame = data.copy()
+        started = time.perf_counter()
+        case(frame)
+        runs.append(time.perf_counter() - started)
+    return min(runs)
+
+
+# Peak bytes allocated while `case` runs, on top of what was already allocated
+def peak_memory(case, data):
+    frame = data.copy()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        case(frame)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes, cases, seed=0):
+    results = {}
+    for rows in sizes:
+        data = gbm_ohlcv(rows, seed)
+        for name, case in cases.items():
+            results[f'{name}@{rows}'] = {'seconds': time_case(case, data), 'peak_bytes': peak_memory(case, data)}
+            print(f"{name:<34} {rows:>9} bars  {results[f'{name}@{rows}']['seconds'] * 1000:10.2f} ms  "
+                  f"{results[f'{name}@{rows}']['peak_bytes'] / 2 ** 20:9.1f} MiB", flush=True)
+    return results
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor() or platform.machine(),
+        'system': platform.system(),
+    }
+
+
+# Cases slower or bigger than baseline * (1 + threshold): (key, metric, baseline, current) each
+def regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    found = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            # Ignore sub-millisecond and sub-megabyte noise
+            floor = 1e-3 if metric == 'seconds' else 2 ** 20
+            if current[metric] > max(previous[metric], floor) * (1 + threshold):
+                found.append((key, metric, previous[metric], current[metric]))
+    return found
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark every Talib indicator and candle pattern on synthetic GBM bars")
+    parser.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES)
+    parser.add_argument('--cases', nargs='*', help="only run these cases (default: all)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.5 = 50%%")
+    parser.add_argument('--save', action='store_true', help="store these results as the new baseline")
+    args = parser.parse_args()
+
+    cases = benchmark_cases()
+    if args.cases:
+        cases = {name: cases[name] for name in args.cases}
+    results = run(args.sizes, cases, args.seed)
+
+    if args.save:
+        with open(args.baseline, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=1, sort_keys=True)
+            f.write('\n')
+        print(f"\nBaseline written to {args.baseline}")
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save to create one")
+        sys.exit(0)
+    with open(args.baseline) as f:
+        stored = json.load(f)
+    if stored['environment'] != environment():
+        print(f"\nNote: baseline was recorded on {stored['environment']}")
+    found = regressions(results, stored['results'], args.threshold)
+    for key, metric, previous, current in found:
+        unit, scale = ('ms', 1000) if metric == 'seconds' else ('MiB', 1 / 2 ** 20)
+        print(f"REGRESSION {key} {metric}: {previous * scale:.2f} -> {current * scale:.2f} {unit} "
+              f"({current / previous - 1:+.0%})")
+    print(f"\n{len(found)} regression(s) beyond {args.threshold:.0%} across {len(results)} measurements")
+    sys.exit(1 if found else 0)
@@ -0,0 +1,158 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+
+# Rough in-memory footprint of a cached value, used for the LRU memory budget
+def estimate_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+# TTL + LRU cache bounded by an approximate memory budget.
+# Concurrent misses for the same key are coalesced ("singleflight"): one caller runs the loader,
+# the others wait for its result instead of issuing their own upstream request.
+# `on_lookup`, if given, is called outside the lock with 'hit', 'miss' or 'coalesced' per get_or_load.
+# A waiting caller gives up on a leader that has not finished within `wait_timeout` seconds (a hung
+# upstream call) and loads the value itself, so one stuck request cannot block everyone behind it.
+class TTLCache:
+    def __init__(self, max_bytes=256 * 1024 * 1024, clock=time.monotonic, on_lookup=None, wait_timeout=60):
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.on_lookup = on_lookup
+        self.wait_timeout = wait_timeout
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    # A forked child (e.g. a background callback job) gets a copy of the lock and of the in-flight
+    # loads, but not the threads that would release or finish them
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def get(self, key):
+        with self._lock:
+            return self._get_locked(key)
+
+    def _get_locked(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, size, value = entry
+        if expires_at <= self.clock():
+            self._remove_locked(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, value, ttl):
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = (self.clock() + ttl, size, value)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+                self.evictions += 1
+
+    def _remove_locked(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def get_or_load(self, key, loader, ttl, cacheable=lambda value: True):
+        with self._lock:
+            entry = self._get_locked(key)
+            if entry is not None:
+                self.hits += 1
+                result = 'hit'
+            else:
+                flight = self._inflight.get(key)
+                if flight is None:
+                    self.misses += 1
+                    flight = self._inflight[key] = _Flight()
+                    result = 'miss'
+                else:
+                    self.coalesced += 1
+                    result = 'coalesced'
+        if self.on_lookup is not None:
+            self.on_lookup(result)
+        if entry is not None:
+            return entry[2]
+        leader = result == 'miss'
+
+        if not leader:
+            if flight.done.wait(self.wait_timeout):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            value = loader()
+            if cacheable(value):
+                self.put(key, value, ttl)
+            return value
+
+        try:
+            flight.value = loader()
+            if cacheable(flight.value):
+                self.put(key, flight.value, ttl)
+            return flight.value
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            flight.done.set()
+
+    def invalidate(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'hit_ratio': (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+# Figures are 1300 px wide: keep about one line point per pixel and one candle per two pixels
+CHART_WIDTH = 1300
+MAX_CANDLES = CHART_WIDTH // 2
+MAX_LINE_POINTS = CHART_WIDTH
+
+
+# Largest-Triangle-Three-Buckets: positions of `threshold` points that preserve the shape of y(x)
+def lttb(x, y, threshold):
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        range_start = int(i * every) + 1
+        range_end = int((i + 1) * every) + 1
+        xs = x[range_start:range_end]
+        ys = y[range_start:range_end]
+        area = np.abs((x[a] - avg_x) * (ys - y[a]) - (x[a] - xs) * (avg_y - y[a]))
+        a = range_start + int(np.argmax(area))
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return selected
+
+
+# (x, y) of a line trace cut down to at most `max_points`; gaps (NaN) are dropped before sampling.
+# Points are spaced by bar position, not time, to match the range-broken x axis.
+def line(index, values, max_points=MAX_LINE_POINTS):
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= max_points:
+        return index, values
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) <= max_points:
+        return index[valid], values[valid]
+    keep = valid[lttb(valid.astype(np.float64), values[valid], max_points)]
+    return index[keep], values[keep]
+
+
+# Merge consecutive bars into at most `max_bars` OHLCV buckets (first open, highest high, lowest
+# low, last close, summed volume). The latest bar is always kept on its own so it stays exact.
+def ohlcv(data, max_bars=MAX_CANDLES):
+    n = len(data)
+    if n <= max_bars:
+        return data[['Open', 'High', 'Low', 'Close', 'Volume']]
+    head = n - 1
+    buckets = max_bars - 1
+    starts = (np.arange(buckets) * head) // buckets
+    ends = np.append(starts[1:], head) - 1
+
+    open_ = data['Open'].to_numpy(dtype=np.float64)
+    high = data['High'].to_numpy(dtype=np.float64)
+    low = data['Low'].to_numpy(dtype=np.float64)
+    close = data['Close'].to_numpy(dtype=np.float64)
+    volume = data['Volume'].to_numpy(dtype=np.float64)
+
+    bucketed = pd.DataFrame(
+        {
+            'Open': np.append(open_[starts], open_[-1]),
+            'High': np.append(np.fmax.reduceat(high[:head], starts), high[-1]),
+            'Low': np.append(np.fmin.reduceat(low[:head], starts), low[-1]),
+            'Close': np.append(close[ends], close[-1]),
+            'Volume': np.append(np.add.reduceat(np.nan_to_num(volume[:head]), starts), volume[-1]),
+        },
+        index=data.index[np.append(starts, head)],
+    )
+    return bucketed
+
+
+# Bars of `data` inside a Plotly x-axis range, for full-resolution redraws after a zoom
+def window(data, x_range):
+    if not x_range:
+        return data
+    tz = data.index.tz
+    start, end = (pd.Timestamp(bound) for bound in x_range)
+    if tz is not None:
+        start, end = start.tz_localize(tz), end.tz_localize(tz)
+    return data.iloc[data.index.searchsorted(start):data.index.searchsorted(end, side='right')]
+
+
+# Visible x range from a Plotly relayoutData event: a [start, end] pair, 'auto' when the user reset
+# the zoom, or None when the event is not about the x axis
+def visible_range(relayout_data):
+    if not relayout_data:
+        return None
+    for axis in ('xaxis', 'xaxis2'):
+        if f'{axis}.range[0]' in relayout_data:
+            return [relayout_data[f'{axis}.range[0]'], relayout_data[f'{axis}.range[1]']]
+        if f'{axis}.range' in relayout_data:
+            return list(relayout_data[f'{axis}.range'])
+        if relayout_data.get(f'{axis}.autorange'):
+            return 'auto'
+    return None
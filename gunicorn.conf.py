@@ -0,0 +1,19 @@
+import os
+
+# gunicorn reads this file from the working directory: `gunicorn app:server`
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8050')
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+
+# Every open tab holds a /stream/price connection (Server-Sent Events, up to an hour) on top of its
+# callbacks. Sync workers serve one request at a time and would be tied up by a few tabs, or killed
+# by the worker timeout mid-stream; gthread keeps each stream on a thread of its own.
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 32))
+
+# With gthread the timeout is the worker's heartbeat, not a limit on one request, so long streams
+# are fine; it still catches a worker that hangs outright
+timeout = 120
+
+# Browsers reuse connections between callback requests
+keepalive = 75
@@ -0,0 +1,78 @@
+import pandas as pd
+
+# Period each indicator panel widens a short time range to, so the indicator has enough warm-up bars
+PANEL_PERIODS = {
+    'rsi': {'1D': '1y', '5D': '1y', '1mo': '1y', '3mo': '1y', '6mo': '1y'},
+    'macd': {'1D': '1y', '5D': '1y', '1mo': '1y', '3mo': '1y', '6mo': '1y'},
+    'dmi_adx': {'1D': '6mo', '5D': '6mo', '1mo': '14mo', '3mo': '1y', '6mo': '1y'},
+    'atr': {'1D': '6mo', '5D': '6mo', '1mo': '1y', '3mo': '1y', '6mo': '1y'},
+    'roc': {'1D': '6mo', '5D': '6mo', '1mo': '1y', '3mo': '1y', '6mo': '1y'},
+    'bollinger': {'1D': '6mo', '5D': '6mo', '1mo': '1y', '3mo': '1y', '6mo': '1y'},
+}
+
+# Periods accepted by yfinance, shortest first
+YF_PERIODS = ['1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'max']
+
+
+# Split a period such as '5D', '14mo' or '2y' into (count, unit); 'Max' gives (None, 'max')
+def parse_period(period):
+    period = period.lower()
+    if period == 'max':
+        return None, 'max'
+    for unit in ('mo', 'd', 'y'):
+        if period.endswith(unit):
+            return int(period[:-len(unit)]), unit
+    raise ValueError(f"Unsupported period: {period}")
+
+
+def period_days(period):
+    count, unit = parse_period(period)
+    if unit == 'max':
+        return float('inf')
+    return count * {'d': 1, 'mo': 31, 'y': 366}[unit]
+
+
+# Smallest yfinance period that covers every period in `periods`
+def fetch_period_for(periods):
+    widest = max(period_days(period) for period in periods)
+    for period in YF_PERIODS:
+        if period_days(period) >= widest:
+            return period
+    return 'max'
+
+
+# Position of the first bar of `index` that falls inside the trailing `period`
+def period_start(index, period):
+    if len(index) == 0:
+        return 0
+    count, unit = parse_period(period)
+    if unit == 'max':
+        return 0
+    if unit == 'd':
+        # Day periods count trading sessions, the way yfinance does
+        days = index.normalize().unique()
+        if count >= len(days):
+            return 0
+        return index.searchsorted(days[-count])
+    offset = pd.DateOffset(months=count) if unit == 'mo' else pd.DateOffset(years=count)
+    return index.searchsorted(index[-1] - offset, side='right')
+
+
+def slice_period(data, period):
+    return data.iloc[period_start(data.index, period):]
+
+
+# Fetch the widest history any panel needs once, then hand each panel its own slice
+class HistoryPlan:
+    def __init__(self, period):
+        self.period = period
+        self.panel_periods = {panel: widen.get(period, period) for panel, widen in PANEL_PERIODS.items()}
+        self.fetch_period = fetch_period_for([period, *self.panel_periods.values()])
+        self.data = None
+
+    def fetch(self, yf_data, interval):
+        self.data = yf_data.fetch_stock_data(period=self.fetch_period, interval=interval)
+        return self.data
+
+    def slice(self, panel=None):
+        return slice_period(self.data, self.panel_periods.get(panel, self.period))
@@ -0,0 +1,65 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Heavy dependencies that are imported at first use and must stay off the worker boot path
+LAZY_MODULES = ['yfinance', 'bs4', 'requests', 'sklearn', 'plotly.subplots']
+
+# Cold `import app` budget for one worker, best of --repeat runs
+DEFAULT_BUDGET_MS = int(os.environ.get('IMPORT_BUDGET_MS', 2000))
+
+
+# Parse `python -X importtime -c "import <module>"`: (self µs, cumulative µs, depth, module) per import
+def import_times(module='app'):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+    return rows
+
+
+def report(rows, top=25):
+    # The requested module finishes importing last, so its cumulative time is the whole import
+    total_us = rows[-1][1]
+    lines = [f"{'self ms':>9} {'cumul ms':>9}  module"]
+    for self_us, cumulative_us, depth, name in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        lines.append(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {'  ' * depth}{name}")
+    return total_us / 1000, '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Report import time of the app and check it against the startup budget")
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--budget-ms', type=int, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--repeat', type=int, default=3, help="cold imports to run; the fastest one is reported")
+    parser.add_argument('--top', type=int, default=25)
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    total_ms, table = min((report(rows, args.top) for rows in runs), key=lambda result: result[0])
+    imported = {name for rows in runs for _, _, _, name in rows}
+    eager = [module for module in LAZY_MODULES if module in imported]
+
+    print(table)
+    print(f"\nimport {args.module}: {total_ms:.0f} ms (budget {args.budget_ms} ms)")
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"over budget by {total_ms - args.budget_ms:.0f} ms")
+    if eager:
+        failures.append(f"imported at startup but should be lazy: {', '.join(eager)}")
+    if failures:
+        print('FAIL: ' + '; '.join(failures))
+        sys.exit(1)
+    print('OK')
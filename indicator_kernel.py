@@ -0,0 +1,227 @@
+import argparse
+import time
+
+import numpy as np
+
+from ta_lib_utility import Talib
+
+# Every dashboard indicator, named like the Talib columns
+INDICATOR_FIELDS = ['TR', 'RSI', 'MACD', 'Signal', 'ROC', 'BB_Width', 'ATR',
+                    'Plus DI', 'Minus DI', 'ADX', 'Short MA', 'Medium MA', 'Long MA']
+
+
+# One record holding a contiguous float64 column per indicator, all in a single buffer.
+# Column-major on purpose: filling a row-major record array field by field is strided and slow.
+def indicator_dtype(rows):
+    return np.dtype([(field, np.float64, (rows,)) for field in INDICATOR_FIELDS])
+
+# Largest exponent the blocked EWM scan lets decay**-k reach before starting a new block
+_SCAN_EXPONENT = 500.0
+
+
+# s[t] = decay * s[t-1] + b[t] with s[-1] = 0, evaluated block by block: inside a block the recurrence
+# is a cumulative sum of b scaled by decay**-k, rescaled by decay**k, plus the decayed carry-in
+def _linear_scan(b, decay):
+    n = len(b)
+    out = np.empty(n)
+    if decay == 0.0:
+        out[:] = b
+        return out
+    block = int(min(max(_SCAN_EXPONENT / -np.log(decay), 1), 8192))
+    steps = np.arange(block + 1, dtype=np.float64)
+    powers = decay ** steps
+    inverse = decay ** -steps[:-1]
+    carry = 0.0
+    for start in range(0, n, block):
+        chunk = b[start:start + block]
+        m = len(chunk)
+        out[start:start + m] = np.cumsum(chunk * inverse[:m]) * powers[:m] + carry * powers[1:m + 1]
+        carry = out[start + m - 1]
+    return out
+
+
+# pandas ewm(alpha=...).mean() for a series that may start with NaNs. With adjust=True interior NaNs
+# decay the old weights without adding new ones (ignore_na=False); adjust=False expects no interior NaNs.
+def _ewm(values, alpha, adjust):
+    out = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return out
+    first = int(np.argmax(valid))
+    x = values[first:]
+    if adjust:
+        weights = valid[first:].astype(np.float64)
+        out[first:] = _linear_scan(np.where(valid[first:], x, 0.0), 1 - alpha) / _linear_scan(weights, 1 - alpha)
+    else:
+        b = alpha * x
+        b[0] = x[0]
+        out[first:] = _linear_scan(b, 1 - alpha)
+    return out
+
+
+# Sum of each trailing `window` values, NaN until the window is full and wherever it holds a NaN.
+# Prefix sums restart every `window` bars, so a window spans at most two blocks and the running
+# totals never grow past about two windows' worth: the error stays near machine precision however
+# long the series is, unlike a single cumulative sum.
+def rolling_sum(values, window):
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    missing = np.isnan(values)
+    blocks = -(-n // window)
+    padded = np.zeros(blocks * window)
+    padded[:n] = np.where(missing, 0.0, values)
+    inclusive = np.cumsum(padded.reshape(blocks, window), axis=1).ravel()
+    exclusive = inclusive - padded
+    # A window starting mid-block takes the rest of that block plus the head of the next one
+    carry = np.repeat(inclusive[window - 1::window], window)[:n - window + 1]
+    carry[::window] = 0.0
+    out[window - 1:] = inclusive[window - 1:n] - exclusive[:n - window + 1] + carry
+    if missing.any():
+        gaps = np.concatenate(([0], np.cumsum(missing)))
+        out[window - 1:][gaps[window:] - gaps[:-window] > 0] = np.nan
+    return out
+
+
+# pandas rolling(window).mean()
+def _rolling_mean(values, window):
+    return rolling_sum(values, window) / window
+
+
+# pandas rolling(window).std() (sample standard deviation), as a two-pass sum of squared
+# deviations from each window's own mean
+def _rolling_std(values, window, rolling_mean):
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+    mean = rolling_mean[window - 1:]
+    squares = np.zeros(n - window + 1)
+    for lag in range(window):
+        deviation = values[window - 1 - lag:n - lag] - mean
+        squares += deviation * deviation
+    out[window - 1:] = np.sqrt(squares / (window - 1))
+    return out
+
+
+def _lag(values, periods):
+    out = np.full(len(values), np.nan)
+    out[periods:] = values[:-periods]
+    return out
+
+
+# Every dashboard indicator in one pass over contiguous float64 arrays. Shared intermediates
+# (previous close, True Range, close delta) are computed once. Rows with a missing price are
+# expected to be dropped beforehand, as the Talib functions' callers do.
+def compute_indicators(high, low, close, ma_windows=(50, 100, 200), rsi_period=14, macd_periods=(12, 26, 9),
+                       roc_period=12, bollinger_period=20, bollinger_devs=(2, 2), dmi_period=14, atr_period=14):
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    result = np.empty((), dtype=indicator_dtype(len(close)))
+    columns = {field: result[field] for field in INDICATOR_FIELDS}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        prev_close = _lag(close, 1)
+        # fmax skips the missing previous close on the first bar, like DataFrame.max(axis=1)
+        true_range = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+        columns['TR'][:] = true_range
+
+        # RSI: NaN deltas count as neither gain nor loss, like Series.where(..., 0)
+        delta = close - prev_close
+        gain = _rolling_mean(np.where(delta > 0, delta, 0.0), rsi_period)
+        loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), rsi_period)
+        columns['RSI'][:] = 100 - (100 / (1 + gain / loss))
+
+        fast, slow, signal = macd_periods
+        macd = _ewm(close, 2 / (fast + 1), adjust=False) - _ewm(close, 2 / (slow + 1), adjust=False)
+        columns['MACD'][:] = macd
+        columns['Signal'][:] = _ewm(macd, 2 / (signal + 1), adjust=False)
+
+        lagged = _lag(close, roc_period)
+        columns['ROC'][:] = ((close - lagged) / lagged) * 100
+
+        rolling_mean = _rolling_mean(close, bollinger_period)
+        rolling_std = _rolling_std(close, bollinger_period, rolling_mean)
+        upper_band = rolling_mean + (rolling_std * bollinger_devs[0])
+        lower_band = rolling_mean - (rolling_std * bollinger_devs[1])
+        columns['BB_Width'][:] = (upper_band - lower_band) / rolling_mean
+
+        atr = _rolling_mean(true_range, atr_period)
+        columns['ATR'][:] = atr
+        dmi_atr = atr if dmi_period == atr_period else _rolling_mean(true_range, dmi_period)
+        plus_dm = high - _lag(high, 1)
+        minus_dm = low - _lag(low, 1)
+        plus_dm[plus_dm < 0] = 0
+        minus_dm[minus_dm > 0] = 0
+        plus_di = 100 * (_ewm(plus_dm, 1 / dmi_period, adjust=True) / dmi_atr)
+        minus_di = np.abs(100 * (_ewm(minus_dm, 1 / dmi_period, adjust=True) / dmi_atr))
+        columns['Plus DI'][:] = plus_di
+        columns['Minus DI'][:] = minus_di
+        dx = (np.abs(plus_di - minus_di) / (plus_di + minus_di)) * 100
+        columns['ADX'][:] = _ewm(dx, 1 / dmi_period, adjust=True)
+
+        for field, ma_window in zip(('Short MA', 'Medium MA', 'Long MA'), ma_windows):
+            columns[field][:] = _rolling_mean(close, ma_window)
+    return result
+
+
+# compute_indicators on a yfinance-style OHLCV frame
+def indicators_for(data, ma_windows=(50, 100, 200)):
+    return compute_indicators(data['High'].to_numpy(dtype=np.float64), data['Low'].to_numpy(dtype=np.float64),
+                              data['Close'].to_numpy(dtype=np.float64), ma_windows)
+
+
+# The Talib functions the kernel replaces, run the way the dashboard runs them
+def talib_indicators(data, ma_windows=(50, 100, 200)):
+    data = data.copy()
+    data['RSI'] = Talib.calculate_rsi(data)
+    Talib.calculate_macd(data)
+    Talib.calculate_roc(data)
+    Talib.calculate_bollinger_bands_width(data)
+    Talib.calculate_atr(data)
+    Talib.calculate_dmi_and_adx(data)
+    Talib.calculate_moving_averages(data, *ma_windows)
+    return data
+
+
+# Largest relative difference between the kernel and Talib per field (NaN positions must agree)
+def max_differences(data, ma_windows=(50, 100, 200)):
+    fused = indicators_for(data, ma_windows)
+    reference = talib_indicators(data, ma_windows)
+    differences = {}
+    for field in INDICATOR_FIELDS[1:]:
+        expected = reference[field].to_numpy(dtype=np.float64)
+        actual = fused[field]
+        if not np.array_equal(np.isnan(expected), np.isnan(actual)):
+            differences[field] = np.inf
+            continue
+        both = ~np.isnan(expected) & ~np.isinf(expected)
+        scale = np.maximum(np.abs(expected[both]), 1.0)
+        differences[field] = float(np.max(np.abs(actual[both] - expected[both]) / scale, initial=0.0))
+    return differences
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Check the fused indicator kernel against Talib and time both")
+    parser.add_argument('--rows', type=int, nargs='*', default=[1_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    from benchmark import gbm_ohlcv
+
+    for rows in args.rows:
+        data = gbm_ohlcv(rows)
+        differences = max_differences(data)
+        timings = {}
+        for name, run in (('talib', talib_indicators), ('fused', indicators_for)):
+            best = np.inf
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                run(data)
+                best = min(best, time.perf_counter() - started)
+            timings[name] = best
+        worst = max(differences, key=differences.get)
+        print(f"{rows:>9} bars  talib {timings['talib'] * 1000:8.1f} ms  fused {timings['fused'] * 1000:8.1f} ms  "
+              f"speedup {timings['talib'] / timings['fused']:5.2f}x  max rel diff {differences[worst]:.1e} ({worst})")
@@ -0,0 +1,95 @@
+import threading
+
+import numpy as np
+
+from downsample import MAX_CANDLES, MAX_LINE_POINTS
+from market_hours import exchange_for_symbol, is_market_open
+from streaming_indicators import MovingAverageStream
+from ta_lib_utility import Talib
+
+# Intervals whose candle chart is kept live: every REFRESH_SECONDS the bars that arrived (and the
+# revision of the still-forming last bar) are patched onto the chart on screen
+INTRADAY_INTERVALS = ['1m', '5m']
+REFRESH_SECONDS = 15
+# Outside market hours only a late revision of the last bar can still arrive
+CLOSED_REFRESH_SECONDS = 15 * 60
+
+MA_FIELDS = ['Short MA', 'Medium MA', 'Long MA']
+
+
+# The trend_traces MA windows for the request's inputs (a window of 0 is drawn as 1)
+def ma_windows(ma):
+    return tuple(window or 1 for window in ma)
+
+
+# Milliseconds between live refreshes of a chart of `symbol`, for the intraday-refresh interval
+def refresh_interval(symbol):
+    seconds = REFRESH_SECONDS if is_market_open(exchange_for_symbol(symbol)) else CLOSED_REFRESH_SECONDS
+    return seconds * 1000
+
+
+# Whether the chart of `data` is drawn one candle and one MA point per bar, so positions in the
+# traces are positions in `data` and new bars can be appended in place
+def full_resolution(data):
+    return len(data) <= min(MAX_CANDLES, MAX_LINE_POINTS)
+
+
+# What the browser has drawn, kept in the chart-tail store: first and last bar (ns since the
+# epoch), bars drawn, the last bar's close and volume, and the candle patterns (columns of
+# candle_pattern_matrix) drawn on the last bar, which may no longer hold once it is revised
+def chart_tail(data):
+    last = data.iloc[-1]
+    hits, _ = Talib.candle_pattern_matrix(data.iloc[-2:])
+    return {
+        'first': int(data.index[0].value),
+        'last': int(data.index[-1].value),
+        'count': len(data),
+        'close': float(last['Close']),
+        'volume': float(last['Volume']),
+        'forming': np.flatnonzero(hits[-1]).tolist(),
+    }
+
+
+# The bars `tail` describes, out of a (possibly longer) newer frame of the same window
+def drawn_bars(data, tail):
+    if not tail or data.empty or int(data.index[0].value) != tail['first']:
+        return data
+    return data.iloc[:tail['count']]
+
+
+# Moving averages of one live chart, fed bar by bar from the streaming indicators. Every session
+# showing the same chart shares one instance, and keeps its own place in it through chart-tail.
+class LiveIndicators:
+    def __init__(self, windows):
+        self.windows = windows
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self.stream = MovingAverageStream(*self.windows)
+        self.timestamps = []
+        self.values = {field: [] for field in MA_FIELDS}
+
+    # Bring the streams up to `data`: the last bar seen is revised, later bars are appended. When
+    # the window no longer starts at the same bar (a new session) the streams start over.
+    # Returns each MA over every bar of `data`.
+    def sync(self, data):
+        timestamps = data.index.asi8
+        bars = data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64)
+        with self._lock:
+            seen = len(self.timestamps)
+            if seen and (len(timestamps) < seen or timestamps[0] != self.timestamps[0]
+                         or timestamps[seen - 1] != self.timestamps[seen - 1]):
+                self._reset()
+                seen = 0
+            for position in range(max(seen - 1, 0), len(timestamps)):
+                revise = position < seen
+                result = self.stream.update(dict(zip(('Open', 'High', 'Low', 'Close'), bars[position])), revise=revise)
+                for field in MA_FIELDS:
+                    if revise:
+                        self.values[field][position] = result[field]
+                    else:
+                        self.values[field].append(result[field])
+                if not revise:
+                    self.timestamps.append(int(timestamps[position]))
+            return {field: np.array(values) for field, values in self.values.items()}
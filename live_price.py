@@ -0,0 +1,134 @@
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from market_hours import is_market_open
+from metrics import upstream
+from providers import provider
+
+# Quote fields pushed to browsers; fetched_at changes every tick and is never sent
+STREAM_FIELDS = ('price', 'error')
+
+
+# One background thread fetches every watched (symbol, exchange) once per tick, however many
+# browser tabs are looking at it; callbacks only read the latest cached quote.
+class LivePricePoller:
+    def __init__(self, open_interval=2, closed_interval=300, idle_timeout=60, workers=8):
+        self.open_interval = open_interval
+        self.closed_interval = closed_interval
+        self.idle_timeout = idle_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='live-price')
+        self._quotes = {}
+        self._watched = {}
+        self._next_due = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+        self._updated = threading.Condition(self._lock)
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def _ensure_started(self):
+        # Started lazily so gunicorn forks before the thread exists
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='live-price-poller', daemon=True)
+            self._thread.start()
+
+    def watch(self, symbol, exchange):
+        key = (symbol, exchange)
+        with self._lock:
+            is_new = key not in self._watched
+            self._watched[key] = time.monotonic()
+            self._ensure_started()
+        if is_new:
+            self._wakeup.set()
+
+    def quote(self, symbol, exchange, wait=5):
+        key = (symbol, exchange)
+        self.watch(symbol, exchange)
+        with self._lock:
+            self._updated.wait_for(lambda: key in self._quotes, timeout=wait)
+            return self._quotes.get(key)
+
+    def poll_interval(self, exchange):
+        return self.open_interval if is_market_open(exchange) else self.closed_interval
+
+    def _fetch(self, key):
+        symbol, exchange = key
+        try:
+            with upstream('quote'):
+                price = provider.quote(symbol, exchange)
+            quote = {'price': price, 'error': None, 'fetched_at': time.time()}
+        except Exception as e:
+            quote = {'price': None, 'error': str(e), 'fetched_at': time.time()}
+        with self._lock:
+            previous = self._quotes.get(key)
+            # Keep showing the last good price through a transient upstream error
+            if quote['error'] and previous and previous['price']:
+                quote = dict(previous, error=quote['error'])
+            self._quotes[key] = quote
+            if previous is None or self._changes(previous, quote):
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._updated.notify_all()
+
+    @staticmethod
+    def _changes(previous, quote):
+        return {field: quote[field] for field in STREAM_FIELDS if previous is None or previous.get(field) != quote[field]}
+
+    # Server-Sent Events for one (symbol, exchange): the full quote first, then only the fields
+    # that changed, with a comment line as keepalive so proxies keep the connection open
+    def stream(self, symbol, exchange, keepalive=15, max_age=60 * 60):
+        key = (symbol, exchange)
+        sent = None
+        version = -1
+        started = time.monotonic()
+        while time.monotonic() - started < max_age:
+            self.watch(symbol, exchange)
+            with self._lock:
+                self._updated.wait_for(lambda: self._versions.get(key, 0) != version and key in self._quotes, timeout=keepalive)
+                quote = self._quotes.get(key)
+                new_version = self._versions.get(key, 0)
+            if quote is None or new_version == version:
+                yield ": keepalive\n\n"
+                continue
+            version = new_version
+            delta = self._changes(sent, quote)
+            sent = quote
+            if delta:
+                yield f"data: {json.dumps(delta)}\n\n"
+
+    def _forget(self, key):
+        self._watched.pop(key, None)
+        self._next_due.pop(key, None)
+        self._quotes.pop(key, None)
+        self._versions.pop(key, None)
+
+    def _due(self, now):
+        with self._lock:
+            for key, last_read in list(self._watched.items()):
+                if now - last_read > self.idle_timeout:
+                    self._forget(key)
+            due = []
+            for key in [key for key in self._watched if self._next_due.get(key, 0) <= now]:
+                try:
+                    # Market hours are decided per tick and per exchange, not once at startup
+                    self._next_due[key] = now + self.poll_interval(key[1])
+                except Exception as e:
+                    # One bad key (e.g. an unknown exchange) must not stop the thread every watcher shares
+                    print(f"Dropping live price {key}: {e!r}", file=sys.stderr)
+                    self._forget(key)
+                    continue
+                due.append(key)
+            return due
+
+    def _run(self):
+        while True:
+            due = self._due(time.monotonic())
+            if due:
+                list(self._executor.map(self._fetch, due))
+            self._wakeup.wait(timeout=self.open_interval)
+            self._wakeup.clear()
+
+
+poller = LivePricePoller()
@@ -0,0 +1,258 @@
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from market_hours import EXCHANGE_SESSIONS, exchange_for_suffix
+from providers import save_recording
+
+# Panels a submit fills through ordinary callbacks; info and news are background jobs polled
+# separately and never hold a request worker, so they are left out of the latency figures
+CHART_PANELS = ['candle', 'volume', 'rsi', 'macd', 'dmi-adx', 'bollinger', 'atr', 'roc']
+
+DEFAULT_SYMBOLS = ['RELIANCE', 'TCS', 'INFY', 'HDFCBANK', 'ICICIBANK', 'SBIN', 'ITC', 'LT']
+
+
+def _callback(output, outputs, inputs, state=()):
+    return {
+        'output': output,
+        'outputs': outputs,
+        'inputs': inputs,
+        'changedPropIds': [f"{inputs[0]['id']}.{inputs[0]['property']}"],
+        'state': list(state),
+    }
+
+
+# The requests a browser sends when the Submit button is clicked
+def submit_payloads(n_clicks, value, suffix, period, interval, ma=(50, 100, 200), future_days=2):
+    click = [{'id': 'submit-val', 'property': 'n_clicks', 'value': n_clicks}]
+    text = {'id': 'text-input', 'property': 'value', 'value': value}
+    radio = {'id': 'radio-items', 'property': 'value', 'value': suffix}
+    stock = _callback(
+        '..stock-request.data...chart-params.data..',
+        [{'id': 'stock-request', 'property': 'data'}, {'id': 'chart-params', 'property': 'data'}],
+        click,
+        [text, radio,
+         {'id': 'period', 'property': 'value', 'value': period},
+         {'id': 'interval_time', 'property': 'value', 'value': interval},
+         {'id': 'short-ma-input', 'property': 'value', 'value': ma[0]},
+         {'id': 'medium-ma-input', 'property': 'value', 'value': ma[1]},
+         {'id': 'long-ma-input', 'property': 'value', 'value': ma[2]},
+         {'id': 'Linear-input', 'property': 'value', 'value': future_days}],
+    )
+    price = _callback(
+        '..live-price-output.children...price-stream-url.data..',
+        [{'id': 'live-price-output', 'property': 'children'}, {'id': 'price-stream-url', 'property': 'data'}],
+        click,
+        [text, radio],
+    )
+    return stock, price
+
+
+# The requests the stock-request store fires once the submit callback has answered
+def panel_payload(panel, request):
+    inputs = [{'id': 'stock-request', 'property': 'data', 'value': request}]
+    if panel == 'candle':
+        # The candle panel also records what it drew for the live intraday refresh
+        return _callback(
+            '..candle-panel.children...chart-tail.data..',
+            [{'id': 'candle-panel', 'property': 'children'}, {'id': 'chart-tail', 'property': 'data'}],
+            inputs,
+        )
+    return _callback(f'{panel}-panel.children', {'id': f'{panel}-panel', 'property': 'children'}, inputs)
+
+
+# Deterministic recordings for `symbols`, so a load test needs no network at all:
+# daily, hourly and weekly GBM bars on exchange sessions plus canned info/calendar/news/quote
+def synthesize(directory, symbols, suffix='.NS', days=2500, seed=0):
+    from benchmark import gbm_ohlcv
+
+    exchange = exchange_for_suffix(suffix)
+    session = EXCHANGE_SESSIONS[exchange]
+    end = pd.Timestamp.now(tz=session['tz']).normalize()
+    sessions = pd.bdate_range(end=end, periods=days, tz=session['tz'])
+    for number, symbol in enumerate(symbols):
+        opens = sessions + pd.Timedelta(hours=session['open'].hour, minutes=session['open'].minute)
+        hourly = (opens[-500:].values[:, None] + np.arange(7) * np.timedelta64(1, 'h')).ravel()
+        intervals = {
+            '1d': sessions,
+            '1h': pd.DatetimeIndex(hourly).tz_localize('UTC').tz_convert(session['tz']),
+            '1wk': pd.date_range(end=end, periods=days // 5, freq='W-MON', tz=session['tz']),
+        }
+        for interval, index in intervals.items():
+            data = gbm_ohlcv(len(index), seed=seed + number, volatility=0.02 if interval == '1d' else 0.005)
+            data.index = index.rename('Datetime' if interval == '1h' else 'Date')
+            save_recording(directory, symbol + suffix, f"history_{interval}", data)
+        save_recording(directory, symbol + suffix, 'info', {
+            'shortName': symbol, 'marketCap': 10 ** 12, 'sector': 'Synthetic', 'industry': 'Synthetic',
+            'fiftyTwoWeekHigh': float(data['High'].max()), 'fiftyTwoWeekLow': float(data['Low'].min()),
+        })
+        save_recording(directory, symbol + suffix, 'calendar', {})
+        save_recording(directory, symbol + suffix, 'news', [])
+        save_recording(directory, symbol, f"quote_{exchange}", f"₹{data['Close'].iloc[-1]:,.2f}")
+
+
+def start_server(port, workers, threads, environ):
+    # Worker class, timeout and keep-alive come from gunicorn.conf.py, as in production
+    command = [sys.executable, '-m', 'gunicorn', 'app:server', '--bind', f'127.0.0.1:{port}',
+               '--workers', str(workers), '--threads', str(threads), '--log-level', 'warning']
+    process = subprocess.Popen(command, cwd=os.path.dirname(os.path.abspath(__file__)), env=environ)
+    return process
+
+
+def wait_until_up(session, url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if session.get(url + '/_dash-layout', timeout=2).ok:
+                return
+        except Exception:
+            pass
+        time.sleep(0.25)
+    raise TimeoutError(f"{url} did not come up within {timeout}s")
+
+
+class LoadTest:
+    def __init__(self, url, symbols, suffix, periods, intervals, concurrency, seed=0):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.url = url + '/_dash-update-component'
+        self.symbols = symbols
+        self.suffix = suffix
+        self.periods = periods
+        self.intervals = intervals
+        self.session = requests.Session()
+        # Every virtual user keeps a submit and its panels in flight at once
+        pool = concurrency * (len(CHART_PANELS) + 2)
+        self.session.mount('http://', HTTPAdapter(pool_connections=pool, pool_maxsize=pool))
+        self._panel_pool = ThreadPoolExecutor(max_workers=pool, thread_name_prefix='load-panel')
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+
+    def _record(self, name, seconds, ok):
+        with self._lock:
+            self.latencies.setdefault(name, []).append(seconds)
+            if not ok:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def _post(self, name, payload):
+        started = time.perf_counter()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=120)
+            # A panel that caught an exception still answers 200, with panel_error's message
+            ok = response.ok and 'An error occurred' not in response.text
+            body = response.json() if ok else None
+            if not ok:
+                print(f"{name}: HTTP {response.status_code} {response.text[:200]}", file=sys.stderr)
+        except Exception as e:
+            ok, body = False, None
+            print(f"{name}: {e}", file=sys.stderr)
+        self._record(name, time.perf_counter() - started, ok)
+        return body
+
+    # One Submit click: the submit and live-price callbacks, then every chart panel in parallel.
+    # The submit's latency runs until the last panel has answered, as the user sees it.
+    def submit(self, n_clicks):
+        with self._lock:
+            symbol = self._random.choice(self.symbols)
+            period = self._random.choice(self.periods)
+            interval = self._random.choice(self.intervals)
+        stock, price = submit_payloads(n_clicks, symbol, self.suffix, period, interval)
+        started = time.perf_counter()
+        price_future = self._panel_pool.submit(self._post, 'update_stock_price', price)
+        body = self._post('stock', stock)
+        ok = body is not None
+        if ok:
+            request = body['response']['stock-request']['data']
+            panels = [self._panel_pool.submit(self._post, f'{panel}_panel', panel_payload(panel, request))
+                      for panel in CHART_PANELS]
+            ok = all(future.result() is not None for future in panels)
+        price_future.result()
+        self._record('submit', time.perf_counter() - started, ok)
+
+    def run(self, submits, concurrency):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='load-user') as users:
+            list(users.map(self.submit, range(1, submits + 1)))
+        return time.perf_counter() - started
+
+
+def report(latencies, errors, elapsed):
+    lines = [f"{'callback':<22} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+    for name in ['submit'] + sorted(name for name in latencies if name != 'submit'):
+        seconds = np.array(latencies.get(name, [])) * 1000
+        if not len(seconds):
+            continue
+        p50, p95, p99 = np.percentile(seconds, [50, 95, 99])
+        lines.append(f"{name:<22} {len(seconds):>6} {errors.get(name, 0):>6} {p50:9.1f} {p95:9.1f} {p99:9.1f} {seconds.max():9.1f}")
+    submits = len(latencies.get('submit', []))
+    lines.append(f"\n{submits} submits in {elapsed:.1f} s: {submits / elapsed:.2f} submits/s, "
+                 f"{sum(map(len, latencies.values())) - submits} callback requests, {sum(errors.values()) - errors.get('submit', 0)} failed")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load-test the dashboard under gunicorn against recorded (replayed) upstream data")
+    parser.add_argument('--url', help="test a server that is already running instead of starting gunicorn")
+    parser.add_argument('--replay-dir', help="recordings to serve (default: synthesize a fresh set)")
+    parser.add_argument('--latency-ms', type=float, default=150, help="synthetic upstream delay per call")
+    parser.add_argument('--jitter-ms', type=float, default=50)
+    parser.add_argument('--workers', type=int, default=4, help="gunicorn worker processes")
+    parser.add_argument('--threads', type=int, default=8, help="threads per gunicorn worker")
+    parser.add_argument('--port', type=int, default=8051)
+    parser.add_argument('--symbols', nargs='*', default=DEFAULT_SYMBOLS)
+    parser.add_argument('--suffix', default='.NS')
+    parser.add_argument('--periods', nargs='*', default=['1mo', '6mo', '1y', '5y'])
+    parser.add_argument('--intervals', nargs='*', default=['1d'])
+    parser.add_argument('--concurrency', type=int, default=8, help="virtual users submitting at once")
+    parser.add_argument('--submits', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=None, help="unmeasured submits first (default: one per symbol)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    scratch = tempfile.TemporaryDirectory(prefix='load-test-')
+    server = None
+    url = args.url
+    if url is None:
+        replay_dir = args.replay_dir
+        if replay_dir is None:
+            replay_dir = os.path.join(scratch.name, 'replay')
+            synthesize(replay_dir, args.symbols, args.suffix, seed=args.seed)
+        environ = dict(
+            os.environ,
+            DATA_PROVIDER='replay',
+            REPLAY_DIR=replay_dir,
+            REPLAY_LATENCY_MS=str(args.latency_ms),
+            REPLAY_JITTER_MS=str(args.jitter_ms),
+            # A fresh store and job queue, so earlier runs do not warm this one
+            OHLCV_STORE_DIR=os.path.join(scratch.name, 'store'),
+            DASH_JOB_STORE_DIR=os.path.join(scratch.name, 'jobs'),
+        )
+        server = start_server(args.port, args.workers, args.threads, environ)
+        url = f'http://127.0.0.1:{args.port}'
+
+    try:
+        test = LoadTest(url, args.symbols, args.suffix, args.periods, args.intervals, args.concurrency, args.seed)
+        wait_until_up(test.session, url)
+        warmup = len(args.symbols) if args.warmup is None else args.warmup
+        if warmup:
+            test.run(warmup, args.concurrency)
+            test.latencies, test.errors = {}, {}
+        elapsed = test.run(args.submits, args.concurrency)
+        print(report(test.latencies, test.errors, elapsed))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+        scratch.cleanup()
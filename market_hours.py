@@ -0,0 +1,36 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+# Regular trading session of each exchange the app quotes, in exchange-local time
+EXCHANGE_SESSIONS = {
+    'NSE': {'tz': 'Asia/Kolkata', 'open': datetime.time(9, 15), 'close': datetime.time(15, 30)},
+    'BOM': {'tz': 'Asia/Kolkata', 'open': datetime.time(9, 15), 'close': datetime.time(15, 30)},
+    'NASDAQ': {'tz': 'America/New_York', 'open': datetime.time(9, 30), 'close': datetime.time(16, 0)},
+}
+
+# Ticker suffix chosen with the radio buttons -> exchange code used by Google Finance
+SUFFIX_EXCHANGES = {'.NS': 'NSE', '.Bo': 'BOM', '.BO': 'BOM', '': 'NASDAQ'}
+
+
+def exchange_for_suffix(suffix):
+    return SUFFIX_EXCHANGES.get(suffix, 'NASDAQ')
+
+
+# Exchange of a full ticker such as 'TCS.NS'
+def exchange_for_symbol(symbol):
+    _, dot, suffix = symbol.rpartition('.')
+    return exchange_for_suffix('.' + suffix.upper()) if dot else 'NASDAQ'
+
+
+# Exchange of a full ticker whose session is known here, else None ('7203.T', 'BMW.DE', ...),
+# where exchange_for_symbol would fall back to NASDAQ
+def known_exchange_for_symbol(symbol):
+    _, dot, suffix = symbol.rpartition('.')
+    return SUFFIX_EXCHANGES.get('.' + suffix.upper() if dot else '')
+
+
+def is_market_open(exchange, now=None):
+    session = EXCHANGE_SESSIONS[exchange]
+    tz = ZoneInfo(session['tz'])
+    local_now = now.astimezone(tz) if now is not None else datetime.datetime.now(tz)
+    return local_now.weekday() < 5 and session['open'] <= local_now.time() <= session['close']
@@ -0,0 +1,138 @@
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from dash.exceptions import PreventUpdate
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+
+# Under gunicorn every worker keeps its own counters. Set PROMETHEUS_MULTIPROC_DIR (an empty
+# directory, before the workers start) to have /metrics add up all workers instead of answering
+# for whichever one served the scrape.
+MULTIPROCESS = bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+# Seconds; callbacks range from sub-millisecond cache hits to multi-second cold downloads
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+CALLBACK_SECONDS = Histogram('dash_callback_seconds', "Wall time of a Dash callback", ['callback'], buckets=LATENCY_BUCKETS)
+CALLBACK_ERRORS = Counter('dash_callback_errors_total', "Callbacks that failed or rendered an error panel", ['callback'])
+STAGE_SECONDS = Histogram('dash_callback_stage_seconds', "Wall time of one stage of a Dash callback, excluding nested stages",
+                          ['callback', 'stage'], buckets=LATENCY_BUCKETS)
+REQUEST_SECONDS = Histogram('dash_request_seconds', "Wall time of a Dash callback request, including JSON (de)serialization",
+                            ['output'], buckets=LATENCY_BUCKETS)
+UPSTREAM_SECONDS = Histogram('upstream_request_seconds', "Wall time of one call to the data provider", ['call'], buckets=LATENCY_BUCKETS)
+UPSTREAM_ERRORS = Counter('upstream_request_errors_total', "Data provider calls that raised", ['call'])
+# Hit ratio: sum by (cache) (rate(cache_lookups_total{result!="miss"}[5m])) / sum by (cache) (rate(cache_lookups_total[5m]))
+CACHE_LOOKUPS = Counter('cache_lookups_total', "TTLCache lookups by outcome (hit, miss, coalesced)", ['cache', 'result'])
+
+_callback = contextvars.ContextVar('metrics_callback', default=None)
+_stage = contextvars.ContextVar('metrics_stage', default=None)
+
+
+class _Stage:
+    def __init__(self):
+        self.nested = 0.0
+
+
+# Time a block as `name` within the current callback. A stage's own time excludes stages nested
+# in it, so the stages of one callback add up to its busy time instead of double counting.
+@contextmanager
+def stage(name):
+    callback = _callback.get()
+    if callback is None:
+        yield
+        return
+    parent = _stage.get()
+    current = _Stage()
+    token = _stage.set(current)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        _stage.reset(token)
+        if parent is not None:
+            parent.nested += elapsed
+        STAGE_SECONDS.labels(callback, name).observe(elapsed - current.nested)
+
+
+# Time every call of a Dash callback; stages inside it are labelled with `name`
+def instrument(name):
+    def decorate(function):
+        seconds = CALLBACK_SECONDS.labels(name)
+        errors = CALLBACK_ERRORS.labels(name)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            token = _callback.set(name)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except PreventUpdate:
+                raise
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                seconds.observe(time.perf_counter() - started)
+                _callback.reset(token)
+        return wrapper
+    return decorate
+
+
+# For callbacks that catch their own exceptions and render an error panel instead
+def record_error():
+    callback = _callback.get()
+    if callback is not None:
+        CALLBACK_ERRORS.labels(callback).inc()
+
+
+@contextmanager
+def upstream(call):
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        UPSTREAM_ERRORS.labels(call).inc()
+        raise
+    finally:
+        UPSTREAM_SECONDS.labels(call).observe(time.perf_counter() - started)
+
+
+# TTLCache on_lookup hook counting the outcomes of one named cache
+def cache_lookups(cache):
+    counters = {result: CACHE_LOOKUPS.labels(cache, result) for result in ('hit', 'miss', 'coalesced')}
+    return lambda result: counters[result].inc()
+
+
+# Time whole callback requests on the Flask server, so Dash's own request parsing and response
+# serialization show up next to the callback's time. `callback_map` is the Dash app's: the output
+# label comes from the client, so only outputs of registered callbacks are used as label values.
+def instrument_server(server, callback_map):
+    from flask import g, request
+
+    @server.before_request
+    def start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @server.after_request
+    def observe_request(response):
+        started = g.pop('metrics_started', None)
+        if started is not None and request.path.endswith('/_dash-update-component'):
+            body = request.get_json(silent=True)
+            output = body.get('output') if isinstance(body, dict) else None
+            known = isinstance(output, str) and output in callback_map
+            REQUEST_SECONDS.labels(output if known else 'unknown').observe(time.perf_counter() - started)
+        return response
+
+
+# Body and content type of a Prometheus scrape
+def exposition():
+    if MULTIPROCESS:
+        from prometheus_client import multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
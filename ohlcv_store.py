@@ -0,0 +1,229 @@
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from history_plan import parse_period, period_days, period_start
+
+STORE_DIR = os.environ.get('OHLCV_STORE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.ohlcv_store'))
+
+COLUMNS = {
+    'ts': np.int64,
+    'Open': np.float64,
+    'High': np.float64,
+    'Low': np.float64,
+    'Close': np.float64,
+    'Volume': np.int64,
+}
+
+# First download for a (symbol, interval); yfinance only serves limited intraday history
+INITIAL_PERIODS = {'1m': '7d', '2m': '60d', '5m': '60d', '15m': '60d', '30m': '60d', '90m': '60d', '1h': '2y', '60m': '2y'}
+
+# Closes of the overlapping bar may differ by the 2-decimal rounding; anything more means yfinance re-adjusted history
+ADJUSTMENT_TOLERANCE = 0.011
+
+
+class _FileLock:
+    # Cross-process lock built on O_EXCL file creation, so it also works on Windows
+    def __init__(self, path, timeout=30, stale_after=120):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    pass
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+# One directory per (symbol, interval) holding one raw binary file per column.
+# Bars are only ever appended, apart from rewriting the last two (still forming) bars in place;
+# meta.json is replaced atomically and its row count is what readers trust.
+class OhlcvStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+
+    def _dir(self, symbol, interval):
+        return os.path.join(self.root, symbol.replace(os.sep, '_'), interval)
+
+    def _column_path(self, directory, column, generation):
+        return os.path.join(directory, f"{column}.{generation}.bin")
+
+    def _read_meta(self, directory):
+        try:
+            with open(os.path.join(directory, 'meta.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, directory, meta):
+        tmp = os.path.join(directory, f"meta.json.{os.getpid()}.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(directory, 'meta.json'))
+
+    def _column(self, directory, meta, column, start=0):
+        rows = meta['rows']
+        if rows == 0:
+            return np.empty(0, dtype=COLUMNS[column])
+        values = np.memmap(self._column_path(directory, column, meta['generation']), dtype=COLUMNS[column], mode='r', shape=(rows,))
+        return np.array(values[start:])
+
+    # Intervals with at least one stored bar for `symbol`
+    def intervals(self, symbol):
+        directory = os.path.join(self.root, symbol.replace(os.sep, '_'))
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+        return [name for name in names if (self._read_meta(os.path.join(directory, name)) or {}).get('rows')]
+
+    # How far back the stored history of `interval` reaches: at least its first download
+    def coverage(self, interval):
+        return INITIAL_PERIODS.get(interval, 'max')
+
+    def last_timestamp(self, symbol, interval):
+        meta = self._read_meta(self._dir(symbol, interval))
+        if not meta or not meta['rows']:
+            return None
+        return pd.Timestamp(meta['last_ts'], tz='UTC').tz_convert(meta['tz'])
+
+    # Return the stored bars inside the trailing `period`, or None if nothing is stored yet
+    def read(self, symbol, interval, period='max'):
+        directory = self._dir(symbol, interval)
+        meta = self._read_meta(directory)
+        if meta is None:
+            return None
+        rows = meta['rows']
+        ts = np.memmap(self._column_path(directory, 'ts', meta['generation']), dtype=np.int64, mode='r', shape=(rows,)) if rows else np.empty(0, dtype=np.int64)
+
+        start = 0
+        if rows and parse_period(period)[1] != 'max':
+            # Binary search to a lower bound that surely covers the period, then trim it exactly
+            count, unit = parse_period(period)
+            lookback_days = count * 2 + 7 if unit == 'd' else period_days(period)
+            start = int(np.searchsorted(ts, ts[-1] - int(lookback_days * 86400e9)))
+            candidate = pd.DatetimeIndex(np.array(ts[start:]).view('datetime64[ns]'), tz='UTC').tz_convert(meta['tz'])
+            start += period_start(candidate, period)
+
+        index = pd.DatetimeIndex(np.array(ts[start:]).view('datetime64[ns]'), tz='UTC').tz_convert(meta['tz'])
+        data = pd.DataFrame(
+            {column: self._column(directory, meta, column, start) for column in COLUMNS if column != 'ts'},
+            index=index.rename(meta.get('index_name', 'Date')),
+            copy=False,
+        )
+        return data
+
+    # Bring the store up to date, asking upstream only for the bars after the last stored one.
+    # `download(period=..., start=...)` must return a yfinance-style history frame.
+    def refresh(self, symbol, interval, download):
+        directory = self._dir(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        with _FileLock(os.path.join(directory, 'lock')):
+            stored = self._refresh(directory, interval, download)
+        if not stored:
+            self._remove_empty(directory)
+
+    # Returns whether anything is stored for the (symbol, interval) afterwards
+    def _refresh(self, directory, interval, download):
+        meta = self._read_meta(directory)
+        if meta is None or meta['rows'] < 2:
+            data = download(period=INITIAL_PERIODS.get(interval, 'max'), start=None)
+            if data.empty:
+                # Unknown or mistyped ticker: yfinance answers with an empty frame (not even a
+                # DatetimeIndex). Nothing is written, so read() keeps returning None for it.
+                return meta is not None
+            self._rewrite(directory, meta, data)
+            return True
+
+        # Refetch from the second to last bar: the last one may still be forming, the one before
+        # it is final, so a changed close there means yfinance re-adjusted (dividend/split) history
+        ts = np.memmap(self._column_path(directory, 'ts', meta['generation']), dtype=np.int64, mode='r', shape=(meta['rows'],))
+        anchor = int(ts[-2])
+        del ts
+        tail = download(period=None, start=pd.Timestamp(anchor, tz='UTC').to_pydatetime())
+        if tail.empty:
+            return True
+        tail = tail.sort_index()
+        tail = tail[~tail.index.duplicated(keep='last')].dropna(subset=['Open', 'High', 'Low', 'Close'])
+        if tail.empty:
+            return True
+        tail_ts = self._timestamps(tail)
+        anchor_close = self._column(directory, meta, 'Close', meta['rows'] - 2)[0]
+        if tail_ts[0] != anchor or abs(tail['Close'].iloc[0] - anchor_close) > ADJUSTMENT_TOLERANCE:
+            data = download(period=INITIAL_PERIODS.get(interval, 'max'), start=None)
+            if not data.empty:
+                self._rewrite(directory, meta, data)
+            return True
+        self._append(directory, meta, tail, tail_ts, meta['rows'] - 2)
+        return True
+
+    # Drop the directories refresh() created for a symbol that has no bars at all
+    def _remove_empty(self, directory):
+        for path in (directory, os.path.dirname(directory)):
+            try:
+                os.rmdir(path)
+            except OSError:
+                return
+
+    def _timestamps(self, data):
+        index = data.index if data.index.tz is not None else data.index.tz_localize('UTC')
+        return index.tz_convert('UTC').tz_localize(None).values.astype('datetime64[ns]').view(np.int64)
+
+    def _values(self, data, column):
+        values = data[column]
+        if column == 'Volume':
+            values = values.fillna(0)
+        return values.to_numpy(dtype=COLUMNS[column])
+
+    def _append(self, directory, meta, data, ts, position):
+        columns = {'ts': ts, **{column: self._values(data, column) for column in COLUMNS if column != 'ts'}}
+        for column, values in columns.items():
+            with open(self._column_path(directory, column, meta['generation']), 'r+b') as f:
+                f.seek(position * np.dtype(COLUMNS[column]).itemsize)
+                f.write(np.ascontiguousarray(values, dtype=COLUMNS[column]).tobytes())
+        meta = dict(meta, rows=position + len(data), last_ts=int(ts[-1]))
+        self._write_meta(directory, meta)
+
+    def _rewrite(self, directory, meta, data):
+        data = data.sort_index()
+        data = data[~data.index.duplicated(keep='last')].dropna(subset=['Open', 'High', 'Low', 'Close'])
+        generation = meta['generation'] + 1 if meta else 0
+        ts = self._timestamps(data)
+        for column, dtype in COLUMNS.items():
+            values = ts if column == 'ts' else self._values(data, column)
+            with open(self._column_path(directory, column, generation), 'wb') as f:
+                f.write(np.ascontiguousarray(values, dtype=dtype).tobytes())
+        self._write_meta(directory, {
+            'generation': generation,
+            'rows': len(data),
+            'last_ts': int(ts[-1]) if len(ts) else None,
+            'tz': str(data.index.tz or 'UTC'),
+            'index_name': data.index.name or 'Date',
+        })
+        # Readers holding the previous meta may still be reading its generation; drop the one before it
+        for column in COLUMNS:
+            try:
+                os.remove(self._column_path(directory, column, generation - 2))
+            except OSError:
+                pass
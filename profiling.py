@@ -0,0 +1,155 @@
+import contextvars
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from functools import wraps
+
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.profiles'))
+
+# Profiling is off unless the server sets PROFILE_TOKEN; a request then asks for a profile by
+# presenting the same token, so nobody without it can slow requests down or fill the disk
+PROFILE_TOKEN = os.environ.get('PROFILE_TOKEN', '')
+
+# Share of callback requests profiled without being asked, e.g. 0.001 for one in a thousand
+SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+
+# Seconds between stack samples. The sampler needs the GIL to look, so a busy callback is in
+# practice sampled about every sys.getswitchinterval() (5 ms by default).
+SAMPLE_INTERVAL = float(os.environ.get('PROFILE_SAMPLE_INTERVAL', 0.001))
+
+# Profiles kept in PROFILE_DIR; the oldest are deleted past this
+MAX_PROFILES = int(os.environ.get('PROFILE_MAX_FILES', 200))
+
+# Ask for a profile with `X-Profile: <token>` on the request, `?profile=<token>` on a callback
+# request, or by opening the page with `?profile=<token>` once, which sets this cookie for the
+# browser's later callbacks
+PROFILE_HEADER = 'X-Profile'
+PROFILE_COOKIE = 'profile'
+
+_active = contextvars.ContextVar('profiling_active', default=False)
+
+
+def _matches(value):
+    return bool(PROFILE_TOKEN) and value is not None and hmac.compare_digest(value, PROFILE_TOKEN)
+
+
+def _requested():
+    if not PROFILE_TOKEN:
+        return False
+    from flask import has_request_context, request
+    if not has_request_context():
+        return False
+    return (_matches(request.headers.get(PROFILE_HEADER)) or _matches(request.args.get('profile'))
+            or _matches(request.cookies.get(PROFILE_COOKIE)))
+
+
+# Whether the current call is being profiled. Work a profiled call would normally hand to a
+# thread pool should run inline instead, so the stack samples see it.
+def active():
+    return _active.get()
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+# Samples the stack of one thread until stopped; counts are keyed by the collapsed stack,
+# root first, which is what flamegraph.pl and speedscope read
+class StackSampler:
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+            if names:
+                self.stacks[';'.join(reversed(names))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _write(name, elapsed, stacks):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    path = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{name}-{os.getpid()}-{threading.get_ident()}"
+                                     f"-{elapsed * 1000:.0f}ms.collapsed")
+    with open(path, 'w') as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+    return path
+
+
+# Keep only the newest MAX_PROFILES profiles
+def _prune():
+    entries = []
+    for entry in os.scandir(PROFILE_DIR):
+        try:
+            entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            pass
+    entries.sort()
+    for _, path in entries[:max(len(entries) - MAX_PROFILES, 0)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# Profile a Dash callback when the request asks for it (or falls in the sample): the callback
+# thread's sampled call stacks as collapsed stacks, written under PROFILE_DIR. Calls that are not
+# profiled only pay for the check.
+def profiled(name):
+    def decorate(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not (_requested() or (SAMPLE_RATE and random.random() < SAMPLE_RATE)):
+                return function(*args, **kwargs)
+            sampler = StackSampler(threading.get_ident())
+            token = _active.set(True)
+            started = time.perf_counter()
+            try:
+                with sampler:
+                    return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                _active.reset(token)
+                try:
+                    _write(name, elapsed, sampler.stacks)
+                    _prune()
+                except OSError as e:
+                    # A profile that cannot be saved must not fail the request it profiled
+                    print(f"Could not write {name} profile: {e}", file=sys.stderr)
+        return wrapper
+    return decorate
+
+
+# Opening any page with ?profile=<token> (or ?profile=0) turns profiling on (or off) for that browser
+def install(server):
+    from flask import request
+
+    @server.after_request
+    def profile_cookie(response):
+        flag = request.args.get('profile')
+        if _matches(flag):
+            response.set_cookie(PROFILE_COOKIE, flag, httponly=True, samesite='Strict')
+        elif flag == '0':
+            response.delete_cookie(PROFILE_COOKIE)
+        return response
@@ -0,0 +1,227 @@
+import os
+import pickle
+import random
+import re
+import threading
+import time
+
+import pandas as pd
+
+from history_plan import period_start
+
+QUOTE_URL = 'https://www.google.com/finance/quote/{symbol}:{exchange}'
+PRICE_CLASS = "YMlKec fxKbKc"
+PRICE_PATTERN = re.compile(r'class="' + PRICE_CLASS + r'"[^>]*>([^<]+)<')
+
+# Connections kept open to the quote site; one per live-price fetch thread
+QUOTE_POOL_SIZE = 8
+
+REPLAY_DIR = os.environ.get('REPLAY_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.replay'))
+
+
+def parse_price(html_text):
+    match = PRICE_PATTERN.search(html_text)
+    if match:
+        return match.group(1)
+    # Markup changed shape: fall back to a real parse, restricted to the price element
+    from bs4 import BeautifulSoup, SoupStrainer
+    soup = BeautifulSoup(html_text, 'html.parser', parse_only=SoupStrainer(class_=PRICE_CLASS))
+    element = soup.find(class_=PRICE_CLASS)
+    if element is None:
+        raise ValueError("price not found on quote page")
+    return element.text
+
+
+# Every upstream call the app makes goes through one provider:
+#   history(symbol, interval, period=None, start=None) -> yfinance-style OHLCV frame
+#   download(symbols, period, interval) -> yf.download-style frame grouped by ticker
+#   info(symbol), calendar(symbol), news(symbol) -> what the yfinance Ticker properties return
+#   quote(symbol, exchange) -> last price as the quote page shows it
+class YahooProvider:
+    def __init__(self, pool_size=QUOTE_POOL_SIZE):
+        self.pool_size = pool_size
+        self._session = None
+        self._lock = threading.Lock()
+
+    # yfinance and requests (and bs4 under them) are imported on the first upstream call rather
+    # than at worker boot; cache and store hits never need them
+    def _ticker(self, symbol):
+        import yfinance as yf
+        return yf.Ticker(symbol)
+
+    def history(self, symbol, interval, period=None, start=None):
+        return self._ticker(symbol).history(period=period, start=start, interval=interval, rounding=2)
+
+    def download(self, symbols, period, interval):
+        import yfinance as yf
+        return yf.download(symbols, period=period, interval=interval, group_by='ticker',
+                           auto_adjust=True, threads=True, progress=False)
+
+    def info(self, symbol):
+        return self._ticker(symbol).info
+
+    def calendar(self, symbol):
+        return self._ticker(symbol).calendar
+
+    def news(self, symbol):
+        return self._ticker(symbol).news
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                self._session.mount('https://', adapter)
+            return self._session
+
+    def quote(self, symbol, exchange):
+        response = self.session.get(QUOTE_URL.format(symbol=symbol, exchange=exchange), timeout=5)
+        response.raise_for_status()
+        return parse_price(response.text)
+
+
+def _recording_path(directory, symbol, name):
+    return os.path.join(directory, symbol.replace(os.sep, '_'), f"{name}.pkl")
+
+
+def _load_recording(directory, symbol, name):
+    try:
+        with open(_recording_path(directory, symbol, name), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        raise LookupError(f"No recorded {name} for {symbol} in {directory}") from None
+
+
+def save_recording(directory, symbol, name, value):
+    path = _recording_path(directory, symbol, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump(value, f)
+    os.replace(tmp, path)
+
+
+# Passes every call through to `upstream` and saves the response for ReplayProvider. History is
+# recorded as the widest frame seen per (symbol, interval), so shorter periods replay as slices of it.
+class RecordingProvider:
+    def __init__(self, upstream, directory=REPLAY_DIR):
+        self.upstream = upstream
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def history(self, symbol, interval, period=None, start=None):
+        data = self.upstream.history(symbol, interval, period=period, start=start)
+        if not data.empty:
+            with self._lock:
+                try:
+                    recorded = pd.concat([_load_recording(self.directory, symbol, f"history_{interval}"), data])
+                    recorded = recorded[~recorded.index.duplicated(keep='last')].sort_index()
+                except LookupError:
+                    recorded = data
+                save_recording(self.directory, symbol, f"history_{interval}", recorded)
+        return data
+
+    def download(self, symbols, period, interval):
+        return self.upstream.download(symbols, period, interval)
+
+    def _record(self, symbol, name, value):
+        save_recording(self.directory, symbol, name, value)
+        return value
+
+    def info(self, symbol):
+        return self._record(symbol, 'info', self.upstream.info(symbol))
+
+    def calendar(self, symbol):
+        return self._record(symbol, 'calendar', self.upstream.calendar(symbol))
+
+    def news(self, symbol):
+        return self._record(symbol, 'news', self.upstream.news(symbol))
+
+    def quote(self, symbol, exchange):
+        return self._record(symbol, f"quote_{exchange}", self.upstream.quote(symbol, exchange))
+
+
+# Serves recorded responses without touching the network, after a synthetic delay of
+# `latency` ± `jitter` seconds per call, so the app can be load-tested offline
+class ReplayProvider:
+    def __init__(self, directory=REPLAY_DIR, latency=0.0, jitter=0.0, seed=None):
+        self.directory = directory
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._histories = {}
+        self._lock = threading.Lock()
+
+    def _delay(self):
+        with self._lock:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _recorded_history(self, symbol, interval):
+        key = (symbol, interval)
+        if key not in self._histories:
+            self._histories[key] = _load_recording(self.directory, symbol, f"history_{interval}")
+        return self._histories[key]
+
+    def history(self, symbol, interval, period=None, start=None):
+        self._delay()
+        try:
+            data = self._recorded_history(symbol, interval)
+        except LookupError:
+            # yfinance answers an unknown symbol with an empty frame too
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        if start is not None:
+            return data.loc[data.index >= pd.Timestamp(start)]
+        return data.iloc[period_start(data.index, period or 'max'):]
+
+    def download(self, symbols, period, interval):
+        self._delay()
+        frames = {}
+        for symbol in symbols:
+            try:
+                data = self._recorded_history(symbol, interval)
+            except LookupError:
+                continue
+            frames[symbol] = data.iloc[period_start(data.index, period):]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+    def info(self, symbol):
+        self._delay()
+        return _load_recording(self.directory, symbol, 'info')
+
+    def calendar(self, symbol):
+        self._delay()
+        return _load_recording(self.directory, symbol, 'calendar')
+
+    def news(self, symbol):
+        self._delay()
+        return _load_recording(self.directory, symbol, 'news')
+
+    def quote(self, symbol, exchange):
+        self._delay()
+        return _load_recording(self.directory, symbol, f"quote_{exchange}")
+
+
+# DATA_PROVIDER picks the backend for the whole process: 'yahoo' (default), 'record' (yahoo,
+# saving every response under REPLAY_DIR) or 'replay' (recorded responses after
+# REPLAY_LATENCY_MS ± REPLAY_JITTER_MS of synthetic delay)
+def provider_from_env(environ=os.environ):
+    name = environ.get('DATA_PROVIDER', 'yahoo')
+    directory = environ.get('REPLAY_DIR', REPLAY_DIR)
+    if name == 'yahoo':
+        return YahooProvider()
+    if name == 'record':
+        return RecordingProvider(YahooProvider(), directory)
+    if name == 'replay':
+        return ReplayProvider(directory, latency=float(environ.get('REPLAY_LATENCY_MS', 0)) / 1000,
+                              jitter=float(environ.get('REPLAY_JITTER_MS', 0)) / 1000)
+    raise ValueError(f"Unknown DATA_PROVIDER: {name}")
+
+
+provider = provider_from_env()
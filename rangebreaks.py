@@ -0,0 +1,87 @@
+import numpy as np
+
+from cache import TTLCache
+from market_hours import EXCHANGE_SESSIONS
+from metrics import cache_lookups
+from resample import INTRADAY_MINUTES
+
+# Every chart of a request is drawn from the same history, and every symbol of an exchange shares
+# its calendar, so breaks are computed once per exchange and date range and reused by all of them.
+# The bar count is part of the key so a history that grew (or has gaps of its own) is not mixed up.
+breaks_cache = TTLCache(max_bytes=8 * 1024 * 1024, on_lookup=cache_lookups('rangebreaks'))
+BREAKS_TTL = 6 * 60 * 60
+
+# Share of days with bars up to which a weekday still counts as closed, or the bars outside the
+# session as one-off sessions. Such rare bars (NSE's Saturday budget session, the evening Muhurat
+# session) end up hidden under the pattern, which keeps the breaks O(holidays) for every history.
+RARE_SHARE = 0.05
+
+
+def _session_minutes(time):
+    return time.hour * 60 + time.minute
+
+
+# Weekdays (Monday is 0) as 'day of week' patterns, one per cyclic run of closed weekdays
+def _weekday_patterns(closed):
+    patterns = []
+    for day in range(7):
+        if closed[day] and not closed[day - 1]:
+            stop = day
+            while closed[(stop + 1) % 7]:
+                stop += 1
+            # Plotly counts weekdays from Sunday
+            patterns.append({'bounds': [(day + 1) % 7, (stop + 2) % 7], 'pattern': 'day of week'})
+    return patterns
+
+
+# Plotly draws a date axis in the wall time the dates carry, so breaks are in that wall time too:
+# the weekdays the symbol does not trade (weekends) and the hours outside its session as patterns,
+# and the remaining days without a single bar (exchange holidays, or gaps in the history) as one
+# list of dates. A weekday counts as closed, and a session as regular, when bars outside them are
+# rare (RARE_SHARE). The session is EXCHANGE_SESSIONS' for a known exchange whose bars rarely leave
+# it, else the span the bars themselves cover.
+def _calendar_breaks(index, interval, exchange):
+    if len(index) == 0 or not (interval in INTRADAY_MINUTES or interval == '1d'):
+        # Weekly and monthly bars are the calendar unit themselves
+        return []
+    wall = (index.tz_localize(None) if index.tz is not None else index).values
+    days = wall.astype('datetime64[D]')
+    trading = np.unique(days)
+    calendar = np.arange(trading[0], trading[-1] + np.timedelta64(1, 'D'))
+    has_bars = np.isin(calendar, trading)
+
+    # 1970-01-01 was a Thursday; Monday is 0
+    weekday = (calendar.astype(np.int64) + 3) % 7
+    seen = np.bincount(weekday, minlength=7)
+    traded = np.bincount(weekday[has_bars], minlength=7)
+    closed = (seen > 0) & (traded <= RARE_SHARE * seen)
+    if closed.all():
+        # Too sparse a history to tell a weekly rhythm from its gaps
+        closed[:] = False
+    breaks = _weekday_patterns(closed)
+
+    if interval in INTRADAY_MINUTES:
+        minutes = (wall - days).astype('timedelta64[m]').astype(np.int64)
+        session = EXCHANGE_SESSIONS.get(exchange)
+        regular = False
+        if session is not None and str(index.tz) == session['tz']:
+            open_minute, close_minute = _session_minutes(session['open']), _session_minutes(session['close'])
+            outside = (minutes < open_minute) | (minutes >= close_minute)
+            regular = len(np.unique(days[outside])) <= RARE_SHARE * len(trading)
+        if not regular:
+            open_minute, close_minute = minutes.min(), min(minutes.max() + INTRADAY_MINUTES[interval], 24 * 60)
+        if open_minute > 0 or close_minute < 24 * 60:
+            breaks.append({'bounds': [close_minute / 60, open_minute / 60], 'pattern': 'hour'})
+
+    holidays = calendar[~has_bars & ~closed[weekday]]
+    if len(holidays):
+        breaks.append({'values': np.datetime_as_string(holidays).tolist()})
+    return breaks
+
+
+# Rangebreaks for a chart of `index` (bars of `interval` on `exchange`)
+def range_breaks(index, interval, exchange):
+    if len(index) == 0:
+        return []
+    key = (exchange, interval, index[0].value, index[-1].value, len(index))
+    return breaks_cache.get_or_load(key, lambda: _calendar_breaks(index, interval, exchange), BREAKS_TTL)
@@ -0,0 +1,35 @@
+import numpy as np
+
+
+# Least-squares line of `values` on bar position 0..n-1, in closed form.
+# Returns slope and intercept (value at bar 0), R² and sigma, the standard deviation of the residuals.
+def linear_fit(values):
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if n < 2:
+        level = float(y[0]) if n else np.nan
+        return {'slope': 0.0 if n else np.nan, 'intercept': level, 'r_squared': np.nan, 'sigma': 0.0 if n else np.nan}
+    x_mean = (n - 1) / 2
+    y_mean = y.mean()
+    deviation = y - y_mean
+    sxx = n * (n * n - 1) / 12
+    sxy = float(np.dot(np.arange(n) - x_mean, deviation))
+    syy = float(np.dot(deviation, deviation))
+    slope = sxy / sxx
+    sse = max(syy - slope * sxy, 0.0)
+    return {
+        'slope': slope,
+        'intercept': y_mean - slope * x_mean,
+        'r_squared': 1 - sse / syy if syy else np.nan,
+        'sigma': float(np.sqrt(sse / n)),
+    }
+
+
+# Fitted values at bar positions start..stop-1; positions past the data extrapolate the line
+def fit_line(fit, start, stop):
+    return fit['intercept'] + fit['slope'] * np.arange(start, stop, dtype=np.float64)
+
+
+# Regression channel: the fitted line shifted by ±k standard deviations of the residuals
+def channel(line, sigma, k=2):
+    return line + k * sigma, line - k * sigma
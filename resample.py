@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from history_plan import period_days
+from market_hours import EXCHANGE_SESSIONS
+
+# Bar intervals, finest first
+INTERVALS = ['1m', '2m', '5m', '15m', '30m', '1h', '4h', '1d', '1wk', '1mo']
+
+# Length of each intraday interval in minutes
+INTRADAY_MINUTES = {'1m': 1, '2m': 2, '5m': 5, '15m': 15, '30m': 30, '1h': 60, '4h': 240}
+
+# Interval to fetch when nothing finer is stored: 4h is not served upstream at all, and weekly
+# and monthly bars are exact aggregates of daily ones, so they never need a download of their own
+BASE_INTERVALS = {'4h': '1h', '1wk': '1d', '1mo': '1d'}
+
+
+# Whether bars of `target` are whole groups of `source` bars
+def can_derive(source, target):
+    if source not in INTERVALS or target not in INTERVALS or INTERVALS.index(source) >= INTERVALS.index(target):
+        return False
+    if target in INTRADAY_MINUTES:
+        return INTRADAY_MINUTES[target] % INTRADAY_MINUTES[source] == 0
+    # Weeks straddle month ends
+    return not (source == '1wk' and target == '1mo')
+
+
+# Interval to read for `interval` over `period`, given the intervals already stored for the symbol:
+# the interval itself if stored, else the coarsest stored finer interval whose history reaches back
+# far enough, else the base interval to download. `coverage(interval)` is how far back (a period)
+# a stored interval's history goes.
+def source_interval(interval, period, stored, coverage):
+    if interval in stored:
+        return interval
+    candidates = [source for source in stored
+                  if can_derive(source, interval) and period_days(period) <= period_days(coverage(source))]
+    if candidates:
+        return max(candidates, key=INTERVALS.index)
+    return BASE_INTERVALS.get(interval, interval)
+
+
+# Start of the `interval` bucket of every timestamp, as wall time (datetime64[ns]) in the index's
+# own time zone, which for upstream bars is the exchange's. Intraday buckets are counted from the
+# session open, like upstream's own hourly bars (09:15, 10:15, ... on NSE/BSE), so 4h bars there
+# start at 09:15 and 13:15. The open is taken from EXCHANGE_SESSIONS when `exchange` is known
+# (and the bars are in its zone), else from the first bar of each day.
+def bucket_starts(index, interval, exchange=None):
+    wall = (index.tz_localize(None) if index.tz is not None else index).values
+    days = wall.astype('datetime64[D]')
+    if interval in INTRADAY_MINUTES:
+        minutes = (wall - days).astype('timedelta64[m]').astype(np.int64)
+        session = EXCHANGE_SESSIONS.get(exchange)
+        if session is not None and str(index.tz) == session['tz']:
+            open_minute = session['open'].hour * 60 + session['open'].minute
+        else:
+            first = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+            open_minute = np.repeat(minutes[first], np.diff(np.append(first, len(days))))
+        size = INTRADAY_MINUTES[interval]
+        bucket = open_minute + (minutes - open_minute) // size * size
+        return days + bucket.astype('timedelta64[m]')
+    if interval == '1d':
+        return days.astype('datetime64[ns]')
+    if interval == '1wk':
+        # 1970-01-01 was a Thursday; weeks start on Monday, as upstream labels them
+        weekday = (days.astype(np.int64) + 3) % 7
+        return (days - weekday.astype('timedelta64[D]')).astype('datetime64[ns]')
+    if interval == '1mo':
+        return wall.astype('datetime64[M]').astype('datetime64[ns]')
+    raise ValueError(f"Unsupported interval: {interval}")
+
+
+# Aggregate sorted OHLCV bars into coarser `interval` bars, grouped in the bars' own time zone:
+# first open, highest high, lowest low, last close and summed volume of each bucket.
+# `exchange` (None when not known) only anchors intraday buckets at its session open.
+def resample(data, interval, exchange=None):
+    name = 'Datetime' if interval in INTRADAY_MINUTES else 'Date'
+    if data.empty:
+        return data[['Open', 'High', 'Low', 'Close', 'Volume']].iloc[:0].rename_axis(name)
+    labels = bucket_starts(data.index, interval, exchange)
+    starts = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1])))
+    ends = np.concatenate((starts[1:], [len(labels)])) - 1
+    index = pd.DatetimeIndex(labels[starts])
+    if data.index.tz is not None:
+        index = index.tz_localize(data.index.tz, nonexistent='shift_forward', ambiguous=False)
+    return pd.DataFrame({
+        'Open': data['Open'].to_numpy()[starts],
+        'High': np.maximum.reduceat(data['High'].to_numpy(), starts),
+        'Low': np.minimum.reduceat(data['Low'].to_numpy(), starts),
+        'Close': data['Close'].to_numpy()[ends],
+        'Volume': np.add.reduceat(data['Volume'].fillna(0).to_numpy(), starts),
+    }, index=index.rename(name))
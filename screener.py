@@ -0,0 +1,133 @@
+import argparse
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from candles import candle_patterns
+from indicator_kernel import indicators_for
+from market_hours import known_exchange_for_symbol
+from providers import provider
+from regression import linear_fit
+from resample import BASE_INTERVALS, resample
+from ta_lib_utility import Talib
+
+# Symbols per multi-ticker download; each batch is fetched and analysed on one screening thread
+BATCH_SIZE = 50
+
+# Batches run on threads of the process calling screen(): a batch mostly waits on its download,
+# and the dashboard runs the screener as a background job in a process of its own per scan, where
+# a process pool could never be reused and would be forked from a threaded parent
+SCREEN_THREADS = 8
+
+# Bars in the regression fit whose slope and R² are screened
+REGRESSION_WINDOW = 100
+
+SCREENER_COLUMNS = ['Symbol', 'Close', 'RSI', 'MACD', 'Signal', 'ROC', 'BB_Width', 'ATR',
+                    'Plus DI', 'Minus DI', 'ADX', 'Short MA', 'Medium MA', 'Long MA', 'Slope', 'R2', 'Patterns']
+
+# Filter key -> (label, condition on the result table)
+SCREENER_FILTERS = {
+    'rsi_oversold': ('RSI < 30', lambda table: table['RSI'] < 30),
+    'rsi_overbought': ('RSI > 70', lambda table: table['RSI'] > 70),
+    'above_long_ma': ('Close above Long MA', lambda table: table['Close'] > table['Long MA']),
+    'below_long_ma': ('Close below Long MA', lambda table: table['Close'] < table['Long MA']),
+    'macd_above_signal': ('MACD above Signal', lambda table: table['MACD'] > table['Signal']),
+    'strong_trend': ('ADX > 25', lambda table: table['ADX'] > 25),
+    'rising_channel': ('Rising regression channel (R² > 0.5)', lambda table: (table['Slope'] > 0) & (table['R2'] > 0.5)),
+    'falling_channel': ('Falling regression channel (R² > 0.5)', lambda table: (table['Slope'] < 0) & (table['R2'] > 0.5)),
+}
+for _pattern_name, _pattern in candle_patterns.items():
+    SCREENER_FILTERS[_pattern_name.lower()] = (
+        f"{_pattern['name']} today",
+        lambda table, name=_pattern_name: table[name] == 1,
+    )
+
+# Latest value of every dashboard indicator and today's candle patterns for one symbol
+def analyse_symbol(symbol, data, short_ma=50, medium_ma=100, long_ma=200):
+    data = data.dropna(subset=['Open', 'High', 'Low', 'Close'])
+    if data.empty:
+        return None
+    indicators = indicators_for(data, (short_ma, medium_ma, long_ma))
+    hits, pattern_names = Talib.candle_pattern_matrix(data.iloc[-2:])
+
+    fit = linear_fit(data['Close'].to_numpy()[-REGRESSION_WINDOW:])
+
+    row = {column: float(indicators[column][-1]) for column in SCREENER_COLUMNS[2:-3]}
+    row['Close'] = float(data['Close'].iloc[-1])
+    row['Slope'] = fit['slope']
+    row['R2'] = fit['r_squared']
+    row['Symbol'] = symbol
+    row.update({name: int(hits[-1, column]) for column, name in enumerate(pattern_names)})
+    row['Patterns'] = ', '.join(candle_patterns[name]['name'] for column, name in enumerate(pattern_names) if hits[-1, column])
+    return row
+
+
+def _screen_batch(symbols, period, interval, ma_windows):
+    # Intervals upstream does not serve (or that are exact aggregates) are built from their base
+    fetch_interval = BASE_INTERVALS.get(interval, interval)
+    frames = provider.download(symbols, period, fetch_interval)
+    rows = []
+    for symbol in symbols:
+        if isinstance(frames.columns, pd.MultiIndex):
+            if symbol not in frames.columns.get_level_values(0):
+                continue
+            data = frames[symbol]
+        else:
+            data = frames
+        if fetch_interval != interval:
+            data = resample(data.dropna(subset=['Open', 'High', 'Low', 'Close']), interval, known_exchange_for_symbol(symbol))
+        row = analyse_symbol(symbol, data, *ma_windows)
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+# Screen `symbols` in parallel batches; returns (matching rows as a DataFrame, symbols per second,
+# symbols whose batch failed)
+def screen(symbols, period='1y', interval='1d', filters=(), ma_windows=(50, 100, 200), batch_size=BATCH_SIZE):
+    started = time.perf_counter()
+    symbols = list(dict.fromkeys(symbols))
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+    rows = []
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(min(SCREEN_THREADS, len(batches)), 1), thread_name_prefix='screener') as pool:
+        futures = {pool.submit(_screen_batch, batch, period, interval, ma_windows): batch for batch in batches}
+        for future in as_completed(futures):
+            try:
+                rows.extend(future.result())
+            except Exception:
+                # One failed batch (rate limit, bad symbol) should not sink the whole scan
+                failed += len(futures[future])
+                print(f"Screener batch of {len(futures[future])} symbols failed:", file=sys.stderr)
+                traceback.print_exc()
+    table = pd.DataFrame(rows, columns=SCREENER_COLUMNS + list(candle_patterns))
+
+    mask = np.ones(len(table), dtype=bool)
+    for key in filters:
+        mask &= SCREENER_FILTERS[key][1](table).to_numpy(dtype=bool)
+    table = table[mask].sort_values('Symbol').reset_index(drop=True)
+
+    elapsed = time.perf_counter() - started
+    throughput = len(symbols) / elapsed if elapsed else 0.0
+    return table, throughput, failed
+
+
+if __name__ == '__main__':
+    from stocks_names import stocks_names
+
+    parser = argparse.ArgumentParser(description="Screen the stock universe on technical indicators and candle patterns")
+    parser.add_argument('--suffix', default='.NS', help="exchange suffix appended to each symbol")
+    parser.add_argument('--period', default='1y')
+    parser.add_argument('--interval', default='1d')
+    parser.add_argument('--filters', nargs='*', default=[], choices=sorted(SCREENER_FILTERS))
+    parser.add_argument('--limit', type=int, default=None, help="only screen the first N symbols")
+    args = parser.parse_args()
+
+    universe = [name + args.suffix for name in sorted(set(stocks_names))][:args.limit]
+    result, symbols_per_second, failed = screen(universe, args.period, args.interval, args.filters)
+    print(result[SCREENER_COLUMNS].to_string(index=False))
+    print(f"{len(universe)} symbols screened at {symbols_per_second:.1f} symbols/sec, {len(result)} matched, {failed} failed")
@@ -1,8 +1,12 @@
+import os
+
+# The symbol universe: one symbol per line, deduplicated and sorted, regenerated from the NSE bhav copy with
 # import nselib
 # from nselib import capital_market
 # bhav_copy_data = capital_market.bhav_copy_with_delivery('12-04-2024')
-# symbol_names = bhav_copy_data['SYMBOL'].tolist()
-# print(symbol_names)
-
+# symbol_names = sorted(set(bhav_copy_data['SYMBOL']), key=str.lower)
+# open('stocks_names.txt', 'w').write('\n'.join(symbol_names) + '\n')
+STOCKS_NAMES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stocks_names.txt')
 
-stocks_names=['1018GS2026', '20MICRONS', '21STCENMGM', '360ONE', '3IINFOLTD', '3MINDIA', '3PLAND', '522GS2025', '5PAISA', '618GS2024', '63MOONS', '654GS2032', '667GS2035', '667GS2050', '669GS2024', '676GS2061', '68GS2060', '695GS2061', '699GS2026', '706GS2028', '710GS2029', '716GS2050', '717GS2030', '718GS2033', '718GS2037', '71GS2034', '725GS2063', '726GS2032', '726GS2033', '732GS2030', '733GS2026', '736GS2052', '737GS2028', '738GS2027', '73GS2053', '746GS2073', '74GS2062', '754GS2036', '759GS2026', '817GS2044', '824GS2027', '828GS2027', '828GS2032', '883GS2041', '92GS2030', 'A2ZINFRA', 'AAATECH', 'AAKASH', 'AAREYDRUGS', 'AARON', 'AARTECH', 'AARTIDRUGS', 'AARTIIND', 'AARTIPHARM', 'AARTISURF', 'AARTISURF', 'AARVEEDEN', 'AARVI', 'AATMAJ', 'AAVAS', 'ABAN', 'ABB', 'ABBOTINDIA', 'ABCAPITAL', 'ABFRL', 'ABINFRA', 'ABMINTLLTD', 'ABSLAMC', 'ABSLBANETF', 'ABSLLIQUID', 'ABSLNN50ET', 'ACC', 'ACCELYA', 'ACCENTMIC', 'ACCORD', 'ACCURACY', 'ACE', 'ACEINTEG', 'ACI', 'ACL', 'ACLGATI', 'ACSAL', 'ADANIENSOL', 'ADANIENT', 'ADANIGREEN', 'ADANIPORTS', 'ADANIPOWER', 'ADFFOODS', 'ADL', 'ADORWELD', 'ADROITINFO', 'ADROITPP', 'ADSL', 'ADVANIHOTR', 'ADVENZYMES', 'AEGISCHEM', 'AEROFLEX', 'AETHER', 'AFFLE', 'AGARIND', 'AGARWALFT', 'AGI', 'AGNI', 'AGRITECH', 'AGROPHOS', 'AGSTRA', 'AGUL', 'AHL', 'AHLADA', 'AHLEAST', 'AHLUCONT', 'AIAENG', 'AIRAN', 'AIROLAM', 'AIRTELPP', 'AISL', 'AJANTPHARM', 'AJMERA', 'AJOONI', 'AKANKSHA', 'AKASH', 'AKG', 'AKI', 'AKSHAR', 'AKSHARCHEM', 'AKSHOPTFBR', 'AKZOINDIA', 'ALANKIT', 'ALBERTDAVD', 'ALEMBICLTD', 'ALICON', 'ALKALI', 'ALKEM', 'ALKYLAMINE', 'ALLCARGO', 'ALLETEC', 'ALLSEC', 'ALMONDZ', 'ALOKINDS', 'ALPA', 'ALPEXSOLAR', 'ALPHA', 'ALPHAETF', 'ALPHAGEO', 'ALPL30IETF', 'ALPSINDUS', 'ALUWIND', 'AMBER', 'AMBICAAGAR', 'AMBIKCO', 'AMBUJACEM', 'AMDIND', 'AMEYA', 'AMIORG', 'AMJLAND', 'AMNPLST', 'AMRUTANJAN', 'ANANDRATHI', 'ANANTRAJ', 'ANDHRAPAP', 'ANDHRSUGAR', 'ANGELONE', 'ANIKINDS', 'ANKITMETAL', 'ANLON', 'ANMOL', 'ANNAPURNA', 'ANTGRAPHIC', 'ANUP', 'ANURAS', 'APARINDS', 'APCL', 'APCOTEXIND', 'APEX', 'APLAPOLLO', 'APLLTD', 'APOLLO', 'APOLLOHOSP', 'APOLLOPIPE', 'APOLLOTYRE', 'APOLSINHOT', 'APS', 'APTECHT', 'APTUS', 'ARABIAN', 'ARCHIDPLY', 'ARCHIES', 'ARE&M', 'ARENTERP', 'ARHAM', 'ARIES', 'ARIHANTACA', 'ARIHANTCAP', 'ARIHANTSUP', 'ARISTO', 'ARMANFIN', 'AROGRANITE', 'ARROWGREEN', 'ARSHIYA', 'ARSSINFRA', 'ARTEMISMED', 'ARTNIRMAN', 'ARVEE', 'ARVIND', 'ARVINDFASN', 'ARVSMART', 'ASAHIINDIA', 'ASAHISONG', 'ASAL', 'ASALCBR', 'ASCOM', 'ASHAPURMIN', 'ASHIANA', 'ASHIMASYN', 'ASHOKA', 'ASHOKAMET', 'ASHOKLEY', 'ASIANENE', 'ASIANHOTNR', 'ASIANPAINT', 'ASIANTILES', 'ASKAUTOLTD', 'ASMS', 'ASPINWALL', 'ASPIRE', 'ASTEC', 'ASTERDM', 'ASTRAL', 'ASTRAMICRO', 'ASTRAZEN', 'ASTRON', 'ATALREAL', 'ATAM', 'ATFL', 'ATGL', 'ATL', 'ATLANTAA', 'ATMASTCO', 'ATUL', 'ATULAUTO', 'AUBANK', 'AURDIS', 'AURIONPRO', 'AUROIMPEX', 'AUROPHARMA', 'AURUM', 'AUSOMENT', 'AUTOAXLES', 'AUTOBEES', 'AUTOIETF', 'AUTOIND', 'AVADHSUGAR', 'AVALON', 'AVANTIFEED', 'AVG', 'AVONMORE', 'AVPINFRA', 'AVROIND', 'AVTNPL', 'AWHCL', 'AWL', 'AXISBANK', 'AXISBNKETF', 'AXISBPSETF', 'AXISCADES', 'AXISCETF', 'AXISGOLD', 'AXISHCETF', 'AXISILVER', 'AXISNIFTY', 'AXISTECETF', 'AXITA', 'AXSENSEX', 'AYMSYNTEX', 'AZAD', 'BABAFP', 'BAFNAPH', 'BAGFILMS', 'BAHETI', 'BAIDFIN', 'BAJAJ-AUTO', 'BAJAJCON', 'BAJAJELEC', 'BAJAJFINSV', 'BAJAJHCARE', 'BAJAJHIND', 'BAJAJHLDNG', 'BAJEL', 'BAJFINANCE', 'BALAJITELE', 'BALAMINES', 'BALAXI', 'BALKRISHNA', 'BALKRISIND', 'BALMLAWRIE', 'BALPHARMA', 'BALRAMCHIN', 'BANARBEADS', 'BANARISUG', 'BANCOINDIA', 'BANDHANBNK', 'BANG', 'BANKA', 'BANKBARODA', 'BANKBEES', 'BANKBETF', 'BANKETF', 'BANKETFADD', 'BANKIETF', 'BANKINDIA', 'BANKNIFTY1', 'BANSWRAS', 'BARBEQUE', 'BASF', 'BASILIC', 'BASML', 'BATAINDIA', 'BAWEJA', 'BAYERCROP', 'BBETF0432', 'BBL', 'BBNPPGOLD', 'BBOX', 'BBTC', 'BBTCL', 'BCG', 'BCLIND', 'BCONCEPTS', 'BDL', 'BEARDSELL', 'BECTORFOOD', 'BEDMUTHA', 'BEL', 'BEML', 'BEPL', 'BERGEPAINT', 'BESTAGRO', 'BETA', 'BEWLTD', 'BFINVEST', 'BFSI', 'BFUTILITIE', 'BGRENERGY', 'BHAGCHEM', 'BHAGERIA', 'BHAGYANGR', 'BHANDARI', 'BHARATFORG', 'BHARATGEAR', 'BHARATRAS', 'BHARATWIRE', 'BHARTIARTL', 'BHARTIHEXA', 'BHEL', 'BHINVIT', 'BIGBLOC', 'BIKAJI', 'BIL', 'BINANIIND', 'BIOCON', 'BIOFILCHEM', 'BIRET', 'BIRLACABLE', 'BIRLACORPN', 'BIRLAMONEY', 'BKMINDST', 'BLAL', 'BLBLIMITED', 'BLISSGVS', 'BLKASHYAP', 'BLS', 'BLSE', 'BLUECHIP', 'BLUEDART', 'BLUEJET', 'BLUEPEBBLE', 'BLUESTARCO', 'BMETRICS', 'BODALCHEM', 'BOHRAIND', 'BOMDYEING', 'BOROLTD', 'BORORENEW', 'BOSCHLTD', 'BPCL', 'BPL', 'BRIGADE', 'BRIGHT', 'BRITANNIA', 'BRITANNIA', 'BRNL', 'BROOKS', 'BSE', 'BSE500IETF', 'BSHSL', 'BSL', 'BSLGOLDETF', 'BSLNIFTY', 'BSLSENETFG', 'BSOFT', 'BTML', 'BURNPUR', 'BUTTERFLY', 'BVCL', 'BYKE', 'CADSYS', 'CALSOFT', 'CAMLINFINE', 'CAMPUS', 'CAMS', 'CANARYS', 'CANBK', 'CANFINHOME', 'CANTABIL', 'CAPACITE', 'CAPITALSFB', 'CAPLIPOINT', 'CAPTRUST', 'CARBORUNIV', 'CAREERP', 'CARERATING', 'CARTRADE', 'CARYSIL', 'CASTROLIND', 'CBAZAAR', 'CCHHL', 'CCL', 'CDSL', 'CEATLTD', 'CELEBRITY', 'CELLECOR', 'CELLO', 'CELLPOINT', 'CENTENKA', 'CENTEXT', 'CENTRALBK', 'CENTRUM', 'CENTUM', 'CENTURYPLY', 'CENTURYTEX', 'CERA', 'CEREBRAINT', 'CESC', 'CGCL', 'CGPOWER', 'CGRAPHICS', 'CHALET', 'CHAMBLFERT', 'CHAVDA', 'CHEMBOND', 'CHEMCON', 'CHEMFAB', 'CHEMPLASTS', 'CHENNPETRO', 'CHEVIOT', 'CHOICEIN', 'CHOLAFIN', 'CHOLAFIN', 'CHOLAFIN', 'CHOLAFIN', 'CHOLAHLDNG', 'CIEINDIA', 'CIGNITITEC', 'CINELINE', 'CINEVISTA', 'CIPLA', 'CLEAN', 'CLEDUCATE', 'CLOUD', 'CLSEL', 'CLSL', 'CMMIPL', 'CMNL', 'CMRSL', 'CMSINFO', 'COALINDIA', 'COASTCORP', 'COCHINSHIP', 'COFFEEDAY', 'COFORGE', 'COLPAL', 'COMMITTED', 'COMMOIETF', 'COMPUSOFT', 'COMSYN', 'CONCOR', 'CONCORDBIO', 'CONFIPET', 'CONS', 'CONSOFINVT', 'CONSUMBEES', 'CONSUMIETF', 'CONTROLPR', 'COOLCAPS', 'CORALFINAC', 'CORDSCABLE', 'COROMANDEL', 'COSMOFIRST', 'COUNCODOS', 'CPS', 'CPSEETF', 'CRAFTSMAN', 'CRAYONS', 'CREATIVE', 'CREATIVEYE', 'CREDITACC', 'CREDITACC', 'CREDITACC', 'CREST', 'CRISIL', 'CROMPTON', 'CROWN', 'CSBBANK', 'CSLFINANCE', 'CTE', 'CUB', 'CUBEXTUB', 'CUMMINSIND', 'CUPID', 'CYBERMEDIA', 'CYBERTECH', 'CYIENT', 'CYIENTDLM', 'DABUR', 'DALBHARAT', 'DALMIASUG', 'DAMODARIND', 'DANGEE', 'DATAMATICS', 'DATAPATTNS', 'DAVANGERE', 'DBCORP', 'DBL', 'DBOL', 'DBREALTY', 'DBSTOCKBRO', 'DCAL', 'DCBBANK', 'DCI', 'DCM', 'DCMFINSERV', 'DCMNVL', 'DCMSHRIRAM', 'DCMSRIND', 'DCW', 'DCXINDIA', 'DECCANCE', 'DEEM', 'DEEPAKFERT', 'DEEPAKNTR', 'DEEPENR', 'DEEPINDS', 'DELAPLEX', 'DELHIVERY', 'DELPHIFX', 'DELTACORP', 'DELTAMAGNT', 'DEN', 'DENEERS', 'DENORA', 'DENTALKART', 'DESTINY', 'DEVIT', 'DEVYANI', 'DGCONTENT', 'DHAMPURSUG', 'DHANBANK', 'DHANI', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANILOANS', 'DHANUKA', 'DHARMAJ', 'DHRUV', 'DHTL', 'DHUNINV', 'DIACABS', 'DIAMINESQ', 'DIAMONDYD', 'DICIND', 'DIGIDRIVE', 'DIGIKORE', 'DIGISPICE', 'DIGJAMLMTD', 'DIL', 'DISHTV', 'DIVGIITTS', 'DIVISLAB', 'DIVOPPBEES', 'DIXON', 'DJML', 'DLF', 'DLINKINDIA', 'DMART', 'DMCC', 'DNAMEDIA', 'DODLA', 'DOLATALGO', 'DOLLAR', 'DOLLEX', 'DOLPHIN', 'DOMS', 'DONEAR', 'DPABHUSHAN', 'DPSCLTD', 'DPWIRES', 'DRCSYSTEMS', 'DREAMFOLKS', 'DREDGECORP', 'DRONE', 'DRREDDY', 'DRSDILIP', 'DSSL', 'DTIL', 'DUCOL', 'DUCON', 'DUGLOBAL', 'DVL', 'DWARKESH', 'DYCL', 'DYNAMATECH', 'DYNAMIC', 'DYNPRO', 'E2E', 'EASEMYTRIP', 'EBBETF0425', 'EBBETF0430', 'EBBETF0431', 'EBBETF0433', 'ECLERX', 'ECLFINANCE', 'ECLFINANCE', 'ECLFINANCE', 'ECLFINANCE', 'EDELWEISS', 'EDUCOMP', 'EFACTOR', 'EFORCE', 'EGOLD', 'EICHERMOT', 'EIDPARRY', 'EIFFL', 'EIHAHOTELS', 'EIHOTEL', 'EIMCOELECO', 'EKC', 'ELDEHSG', 'ELECON', 'ELECTCAST', 'ELECTHERM', 'ELGIEQUIP', 'ELGIRUBCO', 'ELIN', 'EMAMILTD', 'EMAMIPAP', 'EMAMIREAL', 'EMBASSY', 'EMIL', 'EMKAY', 'EMKAYTOOLS', 'EMMBI', 'EMSLIMITED', 'EMUDHRA', 'ENDURANCE', 'ENERGYDEV', 'ENFUSE', 'ENGINERSIN', 'ENIL', 'ENSER', 'ENTERO', 'EPACK', 'EPIGRAL', 'EPL', 'EQUAL50ADD', 'EQUIPPP', 'EQUITASBNK', 'ERFLNCDI', 'ERIS', 'EROSMEDIA', 'ESABINDIA', 'ESAFSFB', 'ESCONET', 'ESCORTS', 'ESFL', 'ESG', 'ESILVER', 'ESSARSHPNG', 'ESSENTIA', 'ESTER', 'ETHOSLTD', 'EUROBOND', 'EUROTEXIND', 'EVEREADY', 'EVERESTIND', 'EXCEL', 'EXCELINDUS', 'EXICOM', 'EXIDEIND', 'EXPLEOSOL', 'EXXARO', 'FACT', 'FAIRCHEMOR', 'FAZE3Q', 'FCL', 'FCONSUMER', 'FCSSOFT', 'FDC', 'FEDERALBNK', 'FEDFINA', 'FEL', 'FELDVR', 'FELIX', 'FIBERWEB', 'FIEMIND', 'FILATEX', 'FINCABLES', 'FINEORG', 'FINIETF', 'FINOPB', 'FINPIPE', 'FIVESTAR', 'FLAIR', 'FLEXITUFF', 'FLFL', 'FLUOROCHEM', 'FMCGIETF', 'FMGOETZE', 'FMNL', 'FOCE', 'FOCUS', 'FONEBOX', 'FOODSIN', 'FORCEMOT', 'FORTIS', 'FOSECOIND', 'FROG', 'FSC', 'FSL', 'FUSION', 'GABRIEL', 'GAEL', 'GAIL', 'GALAXYSURF', 'GALLANTT', 'GANDHAR', 'GANDHITUBE', 'GANECOS', 'GANESHBE', 'GANESHHOUC', 'GANGAFORGE', 'GANGESSECU', 'GARFIBRES', 'GATECH', 'GATECHDVR', 'GATEWAY', 'GAYAHWS', 'GEECEE', 'GEEKAYWIRE', 'GENCON', 'GENESYS', 'GENSOL', 'GENUSPAPER', 'GENUSPOWER', 'GEOJITFSL', 'GEPIL', 'GESHIP', 'GET&D', 'GFLLIMITED', 'GHCL', 'GHCLTEXTIL', 'GICHSGFIN', 'GICL', 'GICRE', 'GILLANDERS', 'GILLETTE', 'GILT5YBEES', 'GINNIFILA', 'GIPCL', 'GIRIRAJ', 'GKWLIMITED', 'GLAND', 'GLAXO', 'GLENMARK', 'GLFL', 'GLOBAL', 'GLOBALPET', 'GLOBALVECT', 'GLOBE', 'GLOBUSSPR', 'GLS', 'GMBREW', 'GMDCLTD', 'GMMPFAUDLR', 'GMRINFRA', 'GMRP&UI', 'GNA', 'GNFC', 'GOACARBON', 'GOCLCORP', 'GOCOLORS', 'GODFRYPHLP', 'GODHA', 'GODREJAGRO', 'GODREJCP', 'GODREJIND', 'GODREJPROP', 'GOENKA', 'GOKEX', 'GOKUL', 'GOKULAGRO', 'GOLDBEES', 'GOLDCASE', 'GOLDETF', 'GOLDETFADD', 'GOLDIAM', 'GOLDIETF', 'GOLDSHARE', 'GOLDSTAR', 'GOLDTECH', 'GOODLUCK', 'GOPAL', 'GOYALALUM', 'GOYALSALT', 'GPIL', 'GPPL', 'GPTHEALTH', 'GPTINFRA', 'GRANULES', 'GRAPHISAD', 'GRAPHITE', 'GRASIM', 'GRASIMPP', 'GRAVITA', 'GRCL', 'GREAVESCOT', 'GREENCHEF', 'GREENLAM', 'GREENPANEL', 'GREENPLY', 'GREENPOWER', 'GRINDWELL', 'GRINFRA', 'GRMOVER', 'GROBTEA', 'GRPLTD', 'GRSE', 'GRWRHITECH', 'GSEC10IETF', 'GSEC10YEAR', 'GSEC5IETF', 'GSFC', 'GSLSU', 'GSPL', 'GSS', 'GSTL', 'GTL', 'GTLINFRA', 'GTPL', 'GUFICBIO', 'GUJALKALI', 'GUJAPOLLO', 'GUJGASLTD', 'GUJRAFFIA', 'GULFOILLUB', 'GULFPETRO', 'GULPOLY', 'GVKPIL', 'GVPTECH', 'HAL', 'HAPPSTMNDS', 'HAPPYFORGE', 'HARDWYN', 'HARIOMPIPE', 'HARRMALAYA', 'HARSHA', 'HATHWAY', 'HATSUN', 'HAVELLS', 'HAVISHA', 'HBLPOWER', 'HBSL', 'HCC', 'HCG', 'HCL-INSYS', 'HCLTECH', 'HDFCAMC', 'HDFCBANK', 'HDFCBSE500', 'HDFCGOLD', 'HDFCGROWTH', 'HDFCLIFE', 'HDFCLIQUID', 'HDFCLOWVOL', 'HDFCMID150', 'HDFCMOMENT', 'HDFCNEXT50', 'HDFCNIF100', 'HDFCNIFBAN', 'HDFCNIFIT', 'HDFCNIFTY', 'HDFCPSUBK', 'HDFCPVTBAN', 'HDFCQUAL', 'HDFCSENSEX', 'HDFCSILVER', 'HDFCSML250', 'HDFCVALUE', 'HDIL', 'HEADSUP', 'HEALTHADD', 'HEALTHIETF', 'HEALTHY', 'HECPROJECT', 'HEG', 'HEIDELBERG', 'HEMIPROP', 'HERANBA', 'HERCULES', 'HERITGFOOD', 'HEROMOTOCO', 'HESTERBIO', 'HEUBACHIND', 'HEXATRADEX', 'HFCL', 'HGINFRA', 'HGS', 'HIGREEN', 'HIKAL', 'HIL', 'HILTON', 'HIMATSEIDE', 'HINDALCO', 'HINDCOMPOS', 'HINDCON', 'HINDCOPPER', 'HINDMOTORS', 'HINDOILEXP', 'HINDPETRO', 'HINDUNILVR', 'HINDWAREAP', 'HINDZINC', 'HIRECT', 'HISARMETAL', 'HITECH', 'HITECHCORP', 'HITECHGEAR', 'HLEGLAS', 'HLVLTD', 'HMAAGRO', 'HMT', 'HMVL', 'HNDFDS', 'HNGSNGBEES', 'HOLMARC', 'HOMEFIRST', 'HOMESFY', 'HONASA', 'HONAUT', 'HONDAPOWER', 'HOVS', 'HPAL', 'HPIL', 'HPL', 'HRHNEXT', 'HSCL', 'HTMEDIA', 'HUBTOWN', 'HUDCO', 'HUDCO', 'HUDCO', 'HUDCO', 'HUDCO', 'HUDCO', 'HUDCO', 'HUHTAMAKI', 'HYBRIDFIN', 'IBLFL', 'IBREALEST', 'IBUCCREDIT', 'IBUCCREDIT', 'IBUCCREDIT', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULHSGFIN', 'IBULPP', 'ICDSLTD', 'ICEMAKE', 'ICICIB22', 'ICICIBANK', 'ICICIGI', 'ICICIPRULI', 'ICIL', 'ICRA', 'IDBI', 'IDEA', 'IDEAFORGE', 'IDFC', 'IDFCFIRSTB', 'IDFNIFTYET', 'IEL', 'IEX', 'IFBAGRO', 'IFBIND', 'IFCI', 'IFCI', 'IFCI', 'IFGLEXPOR', 'IGARASHI', 'IGL', 'IGPL', 'IIFCL', 'IIFCL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFL', 'IIFLSEC', 'IIHFL', 'IIHFL', 'IIHFL', 'IITL', 'IKIO', 'IL&FSENGG', 'IL&FSTRANS', 'IMAGICAA', 'IMFA', 'IMPAL', 'IMPEXFERRO', 'INCREDIBLE', 'INDBANK', 'INDHOTEL', 'INDIACEM', 'INDIAGLYCO', 'INDIAMART', 'INDIANB', 'INDIANCARD', 'INDIANHUME', 'INDIASHLTR', 'INDIFRA', 'INDIGO', 'INDIGOPNTS', 'INDIGRID', 'INDIGRID', 'INDIGRID', 'INDIGRID', 'INDNIPPON', 'INDOAMIN', 'INDOBORAX', 'INDOCO', 'INDORAMA', 'INDOSTAR', 'INDOTECH', 'INDOTHAI', 'INDOWIND', 'INDRAMEDCO', 'INDSWFTLAB', 'INDSWFTLTD', 'INDTERRAIN', 'INDUSINDBK', 'INDUSTOWER', 'INFIBEAM', 'INFINIUM', 'INFOBEAN', 'INFOLLION', 'INFRABEES', 'INFRAIETF', 'INFY', 'INGERRAND', 'INM', 'INNOVACAP', 'INNOVANA', 'INNOVATIVE', 'INOXGREEN', 'INOXINDIA', 'INOXWIND', 'INSECTICID', 'INTELLECT', 'INTENTECH', 'INTLCONV', 'INVENTURE', 'IOB', 'IOC', 'IOLCP', 'IONEXCHANG', 'IPCALAB', 'IPL', 'IPSL', 'IRB', 'IRBINVIT', 'IRCON', 'IRCTC', 'IREDA', 'IREDA', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRFC', 'IRIS', 'IRISDOREME', 'IRMENERGY', 'ISEC', 'ISFT', 'ISGEC', 'ISHAN', 'ISMTLTD', 'IT', 'ITALIANE', 'ITBEES', 'ITC', 'ITDC', 'ITDCEM', 'ITETF', 'ITETFADD', 'ITI', 'ITIETF', 'IVC', 'IVP', 'IVZINGOLD', 'IVZINNIFTY', 'IWEL', 'IZMO', 'J&KBANK', 'JAGRAN', 'JAGSNPHARM', 'JAIBALAJI', 'JAICORPLTD', 'JAINAM', 'JAIPURKURT', 'JALAN', 'JAMNAAUTO', 'JASH', 'JAYAGROGN', 'JAYBARMARU', 'JAYNECOIND', 'JAYSREETEA', 'JBCHEPHARM', 'JBMA', 'JCHAC', 'JETAIRWAYS', 'JETFREIGHT', 'JFLLIFE', 'JGCHEM', 'JHS', 'JINDALPHOT', 'JINDALPOLY', 'JINDALSAW', 'JINDALSTEL', 'JINDRILL', 'JINDWORLD', 'JIOFIN', 'JISLDVREQS', 'JISLJALEQS', 'JITFINFRA', 'JIWANRAM', 'JKCEMENT', 'JKIL', 'JKLAKSHMI', 'JKPAPER', 'JKTYRE', 'JLHL', 'JMA', 'JMFINANCIL', 'JOCIL', 'JPASSOCIAT', 'JPOLYINVST', 'JPPOWER', 'JSFB', 'JSL', 'JSLL', 'JSWENERGY', 'JSWHL', 'JSWINFRA', 'JSWSTEEL', 'JTEKTINDIA', 'JTLIND', 'JUBLFOOD', 'JUBLINDS', 'JUBLINGREA', 'JUBLPHARMA', 'JUNIORBEES', 'JUNIPER', 'JUSTDIAL', 'JWL', 'JYOTHYLAB', 'JYOTICNC', 'JYOTISTRUC', 'K2INFRA', 'KABRAEXTRU', 'KAJARIACER', 'KAKATCEM', 'KALAMANDIR', 'KALYANIFRG', 'KALYANKJIL', 'KAMATHOTEL', 'KAMDHENU', 'KAMOPAINTS', 'KANANIIND', 'KANORICHEM', 'KANPRPLA', 'KANSAINER', 'KAPSTON', 'KARMAENG', 'KARNIKA', 'KARURVYSYA', 'KAUSHALYA', 'KAVVERITEL', 'KAYA', 'KAYNES', 'KBCGLOBAL', 'KCEIL', 'KCK', 'KCP', 'KCPSUGIND', 'KDDL', 'KDL', 'KEC', 'KECL', 'KEEPLEARN', 'KEI', 'KEL', 'KELLTONTEC', 'KERNEX', 'KESORAMIND', 'KEYFINSERV', 'KFINTECH', 'KHADIM', 'KHAICHEM', 'KHAITANLTD', 'KHANDSE', 'KHFM', 'KICL', 'KILITCH', 'KIMS', 'KINGFA', 'KIOCL', 'KIRIINDUS', 'KIRLOSBROS', 'KIRLOSENG', 'KIRLOSIND', 'KIRLPNU', 'KITEX', 'KKCL', 'KLL', 'KMSUGAR', 'KNAGRI', 'KNRCON', 'KODYTECH', 'KOHINOOR', 'KOKUYOCMLN', 'KOLTEPATIL', 'KONSTELEC', 'KONTOR', 'KOPRAN', 'KORE', 'KOTAKBANK', 'KOTAKGOLD', 'KOTAKSILVE', 'KOTARISUG', 'KOTHARIPET', 'KOTHARIPRO', 'KOTYARK', 'KPIGREEN', 'KPIL', 'KPITTECH', 'KPRMILL', 'KRBL', 'KREBSBIO', 'KRIDHANINF', 'KRISHANA', 'KRISHCA', 'KRISHIVAL', 'KRISHNADEF', 'KRITI', 'KRITIKA', 'KRITINUT', 'KRSNAA', 'KRYSTAL', 'KSB', 'KSCL', 'KSHITIJPOL', 'KSL', 'KSOLVES', 'KTKBANK', 'KTL', 'KUANTUM', 'L&TFH', 'LAGNAM', 'LAL', 'LALPATHLAB', 'LAMBODHARA', 'LANCORHOL', 'LANDMARK', 'LAOPALA', 'LASA', 'LATENTVIEW', 'LATTEYS', 'LAURUSLABS', 'LAWSIKHO', 'LAXMICOT', 'LAXMIMACH', 'LCCINFOTEC', 'LEMERITE', 'LEMONTREE', 'LEXUS', 'LFIC', 'LGBBROSLTD', 'LGBFORGE', 'LGHL', 'LIBAS', 'LIBERTSHOE', 'LICHSGFIN', 'LICI', 'LICMFGOLD', 'LICNETFGSC', 'LICNETFN50', 'LICNETFSEN', 'LICNFNHGP', 'LICNMID100', 'LIKHITHA', 'LINC', 'LINCOLN', 'LINDEINDIA', 'LIQUID', 'LIQUID1', 'LIQUIDADD', 'LIQUIDBEES', 'LIQUIDCASE', 'LIQUIDETF', 'LIQUIDIETF', 'LIQUIDSBI', 'LLOYDS', 'LLOYDSENGG', 'LLOYDSME', 'LODHA', 'LOKESHMACH', 'LORDSCHLO', 'LOTUSEYE', 'LOVABLE', 'LOWVOL', 'LOWVOL1', 'LOWVOLIETF', 'LOYALTEX', 'LPDC', 'LT', 'LTFOODS', 'LTGILTBEES', 'LTIM', 'LTTS', 'LUMAXIND', 'LUMAXTECH', 'LUPIN', 'LUXIND', 'LXCHEM', 'LYKALABS', 'LYPSAGEMS', 'M&M', 'M&MFIN', 'M&MFIN', 'MAANALU', 'MACPOWER', 'MADHAV', 'MADHAVBAUG', 'MADHUCON', 'MADHUSUDAN', 'MADRASFERT', 'MAFANG', 'MAGADSUGAR', 'MAGNUM', 'MAGSON', 'MAHABANK', 'MAHAPEXLTD', 'MAHASTEEL', 'MAHEPC', 'MAHESHWARI', 'MAHICKRA', 'MAHKTECH', 'MAHLIFE', 'MAHLOG', 'MAHSCOOTER', 'MAHSEAMLES', 'MAITHANALL', 'MAKEINDIA', 'MAL', 'MALLCOM', 'MALUPAPER', 'MANAKALUCO', 'MANAKCOAT', 'MANAKSIA', 'MANAKSTEEL', 'MANALIPETC', 'MANAPPURAM', 'MANGALAM', 'MANGCHEFER', 'MANGLMCEM', 'MANINDS', 'MANINFRA', 'MANKIND', 'MANOMAY', 'MANORAMA', 'MANORG', 'MANUGRAPH', 'MANYAVAR', 'MAPMYINDIA', 'MARALOVER', 'MARATHON', 'MARCO', 'MARICO', 'MARINE', 'MARINETRAN', 'MARKSANS', 'MARSHALL', 'MARUTI', 'MASFIN', 'MASKINVEST', 'MASPTOP50', 'MASTEK', 'MATRIMONY', 'MAWANASUG', 'MAXESTATES', 'MAXHEALTH', 'MAXIND', 'MAXPOSURE', 'MAYURUNIQ', 'MAZDA', 'MAZDOCK', 'MBAPL', 'MBECL', 'MBLINFRA', 'MCDOWELL-N', 'MCL', 'MCLEODRUSS', 'MCON', 'MCX', 'MDL', 'MEDANTA', 'MEDIASSIST', 'MEDICAMEQ', 'MEDICO', 'MEDPLUS', 'MEGAFLEX', 'MEGASOFT', 'MEGASTAR', 'MEGATHERM', 'MELSTAR', 'MENONBE', 'MEP', 'METALFORGE', 'METROBRAND', 'METROPOLIS', 'MFSL', 'MGEL', 'MGL', 'MHHL', 'MHLXMIRU', 'MHRIL', 'MICEL', 'MICROPRO', 'MID150BEES', 'MIDCAP', 'MIDCAPETF', 'MIDCAPIETF', 'MIDHANI', 'MIDQ50ADD', 'MIDSELIETF', 'MILTON', 'MINDACORP', 'MINDSPACE', 'MINDTECK', 'MIRCELECTR', 'MIRZAINT', 'MITCON', 'MITTAL', 'MKPL', 'MMFL', 'MMP', 'MMTC', 'MNC', 'MODIRUBBER', 'MODISONLTD', 'MODTHREAD', 'MOGSEC', 'MOHEALTH', 'MOHITIND', 'MOIL', 'MOKSH', 'MOL', 'MOLDTECH', 'MOLDTKPAC', 'MOLOWVOL', 'MOM100', 'MOM30IETF', 'MOM50', 'MOMENTUM', 'MOMOMENTUM', 'MON100', 'MONARCH', 'MONIFTY500', 'MONOPHARMA', 'MONQ50', 'MONTECARLO', 'MOQUALITY', 'MOREALTY', 'MOREPENLAB', 'MOS', 'MOSMALL250', 'MOTHERSON', 'MOTILALOFS', 'MOTISONS', 'MOTOGENFIN', 'MOVALUE', 'MOXSH', 'MPHASIS', 'MPSLTD', 'MRF', 'MRO-TEK', 'MRPL', 'MSPL', 'MSTCLTD', 'MSUMI', 'MTARTECH', 'MTEDUCARE', 'MTNL', 'MUFIN', 'MUFTI', 'MUKANDLTD', 'MUKKA', 'MUKTAARTS', 'MUNJALAU', 'MUNJALSHOW', 'MURUDCERA', 'MUTHOOTCAP', 'MUTHOOTFIN', 'MUTHOOTMF', 'MVGJL', 'MVKAGRO', 'MWL', 'NABARD', 'NACLIND', 'NAGAFERT', 'NAGREEKCAP', 'NAGREEKEXP', 'NAHARCAP', 'NAHARINDUS', 'NAHARPOLY', 'NAHARSPING', 'NAM-INDIA', 'NAMAN', 'NARMADA', 'NATCOPHARM', 'NATHBIOGEN', 'NATIONALUM', 'NAUKRI', 'NAVA', 'NAVINFLUOR', 'NAVINIFTY', 'NAVKARCORP', 'NAVNETEDUL', 'NAZARA', 'NBCC', 'NBIFIN', 'NCC', 'NCLIND', 'NDGL', 'NDL', 'NDLVENTURE', 'NDRAUTO', 'NDTV', 'NECCLTD', 'NECLIFE', 'NELCAST', 'NELCO', 'NEOGEN', 'NESCO', 'NESTLEIND', 'NETF', 'NETWEB', 'NETWORK18', 'NEULANDLAB', 'NEWGEN', 'NEWJAISA', 'NEXT50', 'NEXT50IETF', 'NEXTMEDIA', 'NFL', 'NGIL', 'NGLFINE', 'NH', 'NHAI', 'NHAI', 'NHAI', 'NHAI', 'NHAI', 'NHAI', 'NHAI', 'NHAI', 'NHBTF2014', 'NHBTF2023', 'NHIT', 'NHIT', 'NHIT', 'NHPC', 'NHPC', 'NHPC', 'NIACL', 'NIBL', 'NIDAN', 'NIDO', 'NIF100BEES', 'NIF100IETF', 'NIF10GETF', 'NIF5GETF', 'NIFITETF', 'NIFMID150', 'NIFTY1', 'NIFTY50ADD', 'NIFTYBEES', 'NIFTYBETF', 'NIFTYETF', 'NIFTYIETF', 'NIFTYQLITY', 'NIITLTD', 'NIITMTS', 'NILAINFRA', 'NILASPACES', 'NILKAMAL', 'NINSYS', 'NIPPOBATRY', 'NIRAJ', 'NIRMAN', 'NITCO', 'NITINSPIN', 'NITIRAJ', 'NKIND', 'NLCINDIA', 'NMDC', 'NOCIL', 'NOIDATOLL', 'NORBTEAEXP', 'NOVAAGRI', 'NPBET', 'NPST', 'NRAIL', 'NRBBEARING', 'NRL', 'NSIL', 'NSLNISP', 'NTPC', 'NTPC', 'NTPC', 'NTPC', 'NUCLEUS', 'NURECA', 'NUVAMA', 'NUVOCO', 'NV20', 'NV20BEES', 'NV20IETF', 'NXST', 'NYKAA', 'OAL', 'OBCL', 'OBEROIRLTY', 'OCCL', 'OFSS', 'OIL', 'OILCOUNTUB', 'OLECTRA', 'OLIL', 'OMAXAUTO', 'OMAXE', 'OMFURN', 'OMINFRAL', 'OMKARCHEM', 'ONDOOR', 'ONELIFECAP', 'ONEPOINT', 'ONGC', 'ONMOBILE', 'ONWARDTEC', 'OPTIEMUS', 'ORBTEXP', 'ORCHPHARMA', 'ORIANA', 'ORICONENT', 'ORIENTALTL', 'ORIENTBELL', 'ORIENTCEM', 'ORIENTCER', 'ORIENTELEC', 'ORIENTHOT', 'ORIENTLTD', 'ORIENTPPR', 'ORISSAMINE', 'ORTINLAB', 'OSIAHYPER', 'OSWALAGRO', 'OSWALGREEN', 'OSWALSEEDS', 'OWAIS', 'PAGEIND', 'PAISALO', 'PAKKA', 'PALASHSECU', 'PALREDTEC', 'PANACEABIO', 'PANACHE', 'PANAMAPET', 'PANSARI', 'PAR', 'PARACABLES', 'PARADEEP', 'PARAGMILK', 'PARAGON', 'PARAS', 'PARASPETRO', 'PARKHOTELS', 'PARSVNATH', 'PARTYCRUS', 'PASHUPATI', 'PASUPTAC', 'PATANJALI', 'PATELENG', 'PATINTLOG', 'PAVNAIND', 'PAYTM', 'PCBL', 'PCJEWELLER', 'PDMJEPAPER', 'PDSL', 'PEARLPOLY', 'PEL', 'PEL', 'PENIND', 'PENINLAND', 'PENTAGON', 'PERFECT', 'PERSISTENT', 'PETRONET', 'PFC', 'PFC', 'PFC', 'PFC', 'PFC', 'PFIZER', 'PFOCUS', 'PFS', 'PGEL', 'PGHH', 'PGHL', 'PGIL', 'PGINVIT', 'PHANTOMFX', 'PHARMABEES', 'PHOENIXLTD', 'PIDILITIND', 'PIGL', 'PIIND', 'PILANIINVS', 'PILITA', 'PIONEEREMB', 'PITTIENG', 'PIXTRANS', 'PKTEA', 'PLADAINFO', 'PLASTIBLEN', 'PLATIND', 'PLAZACABLE', 'PNB', 'PNBGILTS', 'PNBHOUSING', 'PNC', 'PNCINFRA', 'POCL', 'PODDARHOUS', 'PODDARMENT', 'POKARNA', 'POLICYBZR', 'POLYCAB', 'POLYMED', 'POLYPLEX', 'POLYSIL', 'PONNIERODE', 'POONAWALLA', 'POONAWALLA', 'POWERGRID', 'POWERINDIA', 'POWERMECH', 'PPAP', 'PPL', 'PPLPHARMA', 'PRAENG', 'PRAJIND', 'PRAKASH', 'PRAKASHSTL', 'PRAMARA', 'PRATHAM', 'PRAXIS', 'PRECAM', 'PRECISION', 'PRECOT', 'PRECWIRE', 'PREMEXPLN', 'PREMIER', 'PREMIERPOL', 'PRESSTONIC', 'PRESTIGE', 'PRICOLLTD', 'PRIMESECU', 'PRINCEPIPE', 'PRITI', 'PRITIKA', 'PRITIKAUTO', 'PRIVISCL', 'PROLIFE', 'PROPEQUITY', 'PROV', 'PROZONER', 'PRSMJOHNSN', 'PRUDENT', 'PRUDMOULI', 'PSB', 'PSPPROJECT', 'PSUBANK', 'PSUBANKADD', 'PSUBNKBEES', 'PSUBNKIETF', 'PTC', 'PTCIL', 'PTL', 'PULZ', 'PUNJABCHEM', 'PURVA', 'PURVFLEXI', 'PVP', 'PVRINOX', 'PVSL', 'PVTBANIETF', 'PVTBANKADD', 'PYRAMID', 'QFIL', 'QGOLDHALF', 'QMSMEDI', 'QNIFTY', 'QUAL30IETF', 'QUESS', 'QUICKHEAL', 'QUICKTOUCH', 'RACE', 'RADAAN', 'RADHIKAJWE', 'RADIANTCMS', 'RADICO', 'RADIOCITY', 'RADIOCITY', 'RADIOWALLA', 'RAILTEL', 'RAIN', 'RAINBOW', 'RAJESHEXPO', 'RAJMET', 'RAJRATAN', 'RAJRILTD', 'RAJSREESUG', 'RAJTV', 'RALLIS', 'RAMANEWS', 'RAMAPHO', 'RAMASTEEL', 'RAMCOCEM', 'RAMCOIND', 'RAMCOSYS', 'RAMKY', 'RAMRAT', 'RANASUG', 'RANEENGINE', 'RANEHOLDIN', 'RATEGAIN', 'RATNAMANI', 'RATNAVEER', 'RAYMOND', 'RBA', 'RBL', 'RBLBANK', 'RBMINFRA', 'RBZJEWEL', 'RCDL', 'RCF', 'RCOM', 'RECLTD', 'RECLTD', 'RECLTD', 'RECLTD', 'RECLTD', 'REDINGTON', 'REDTAPE', 'REFEX', 'REGENCERAM', 'RELAXO', 'RELCHEMQ', 'RELIANCE', 'RELIGARE', 'RELINFRA', 'REMSONSIND', 'REMUS', 'RENUKA', 'REPCOHOME', 'REPL', 'REPRO', 'RESPONIND', 'REXPIPES', 'RGL', 'RHFL', 'RHIM', 'RHL', 'RICHA', 'RICOAUTO', 'RIIL', 'RILINFRA', 'RISHABH', 'RITCO', 'RITES', 'RKDL', 'RKEC', 'RKFORGE', 'RKSWAMY', 'RMDRIP', 'RML', 'ROCKINGDCE', 'ROHLTD', 'ROLEXRINGS', 'ROLLT', 'ROML', 'ROSSARI', 'ROSSELLIND', 'ROTO', 'ROUTE', 'ROXHITECH', 'RPGLIFE', 'RPOWER', 'RPPINFRA', 'RPPL', 'RPSGVENT', 'RPTECH', 'RRKABEL', 'RSSOFTWARE', 'RSWM', 'RSYSTEMS', 'RTNINDIA', 'RTNPOWER', 'RUBYMILLS', 'RUCHINFRA', 'RUCHIRA', 'RUPA', 'RUSHIL', 'RUSTOMJEE', 'RVHL', 'RVNL', 'S&SPOWER', 'SAAKSHI', 'SABAR', 'SABEVENTS', 'SABTNL', 'SADBHAV', 'SADBHIN', 'SADHAV', 'SADHNANIQ', 'SAFARI', 'SAGARDEEP', 'SAGCEM', 'SAH', 'SAHANA', 'SAHYADRI', 'SAIFL', 'SAIL', 'SAKAR', 'SAKHTISUG', 'SAKSOFT', 'SAKUMA', 'SALASAR', 'SALONA', 'SALSTEEL', 'SALZERELEC', 'SAMBHAAV', 'SAMHI', 'SAMPANN', 'SANCO', 'SANDESH', 'SANDHAR', 'SANDUMA', 'SANGAMIND', 'SANGANI', 'SANGHIIND', 'SANGHVIMOV', 'SANGINITA', 'SANOFI', 'SANSERA', 'SAPPHIRE', 'SARDAEN', 'SAREGAMA', 'SARLAPOLY', 'SARTELE', 'SARVESHWAR', 'SASKEN', 'SASTASUNDR', 'SATIA', 'SATIN', 'SATINDLTD', 'SAURASHCEM', 'SBC', 'SBCL', 'SBFC', 'SBGLP', 'SBICARD', 'SBIETFCON', 'SBIETFIT', 'SBIETFPB', 'SBIETFQLTY', 'SBILIFE', 'SBIN', 'SCHAEFFLER', 'SCHAND', 'SCHNEIDER', 'SCI', 'SCILAL', 'SCML', 'SCPL', 'SDBL', 'SDL24BEES', 'SDL26BEES', 'SEAMECLTD', 'SECMARK', 'SECURCRED', 'SECURKLOUD', 'SEJALLTD', 'SEL', 'SELAN', 'SELMC', 'SEMAC', 'SENCO', 'SENSEXADD', 'SENSEXETF', 'SENSEXIETF', 'SEPC', 'SEQUENT', 'SERVOTECH', 'SESHAPAPER', 'SETCO', 'SETF10GILT', 'SETFGOLD', 'SETFNIF50', 'SETFNIFBK', 'SETFNN50', 'SEYAIND', 'SFL', 'SGBAPR28I', 'SGBAUG24', 'SGBAUG27', 'SGBAUG28V', 'SGBAUG29V', 'SGBAUG30', 'SGBD29VIII', 'SGBDC27VII', 'SGBDE30III', 'SGBDE31III', 'SGBDEC2512', 'SGBDEC2513', 'SGBDEC26', 'SGBFEB27', 'SGBFEB28IX', 'SGBFEB29XI', 'SGBFEB32IV', 'SGBJ28VIII', 'SGBJAN27', 'SGBJAN29IX', 'SGBJAN29X', 'SGBJAN30IX', 'SGBJU29III', 'SGBJUL25', 'SGBJUL27', 'SGBJUL28IV', 'SGBJUL29IV', 'SGBJUN27', 'SGBJUN28', 'SGBJUN29II', 'SGBJUN30', 'SGBJUN31I', 'SGBMAR25', 'SGBMAR28X', 'SGBMAR30X', 'SGBMAR31IV', 'SGBMAY25', 'SGBMAY26', 'SGBMAY28', 'SGBMAY29I', 'SGBMR29XII', 'SGBN28VIII', 'SGBNOV24', 'SGBNOV25', 'SGBNOV258', 'SGBNOV25IX', 'SGBNOV25VI', 'SGBNV29VII', 'SGBOC28VII', 'SGBOCT25', 'SGBOCT25V', 'SGBOCT26', 'SGBOCT27', 'SGBOCT27VI', 'SGBSEP24', 'SGBSEP27', 'SGBSEP28VI', 'SGBSEP29VI', 'SGBSEP31II', 'SGIL', 'SGL', 'SHAH', 'SHAHALLOYS', 'SHAILY', 'SHAKTIPUMP', 'SHALBY', 'SHALPAINTS', 'SHANKARA', 'SHANTHALA', 'SHANTI', 'SHANTIGEAR', 'SHARDACROP', 'SHARDAMOTR', 'SHAREINDIA', 'SHAREINDIA', 'SHARIABEES', 'SHEETAL', 'SHEMAROO', 'SHERA', 'SHILPAMED', 'SHIVALIK', 'SHIVAMAUTO', 'SHIVAMILLS', 'SHIVATEX', 'SHK', 'SHOPERSTOP', 'SHRADHA', 'SHREDIGCEM', 'SHREECEM', 'SHREEKARNI', 'SHREEOSFM', 'SHREEPUSHK', 'SHREERAMA', 'SHRENIK', 'SHREYANIND', 'SHREYAS', 'SHRIPISTON', 'SHRIRAMFIN', 'SHRIRAMFIN', 'SHRIRAMPPS', 'SHRITECH', 'SHUBHLAXMI', 'SHYAMCENT', 'SHYAMMETL', 'SHYAMTEL', 'SICALLOG', 'SIDDHIKA', 'SIEMENS', 'SIGACHI', 'SIGIND', 'SIGMA', 'SIGNATURE', 'SIGNORIA', 'SIGNPOST', 'SIKKO', 'SIL', 'SILGO', 'SILINV', 'SILLYMONKS', 'SILVER', 'SILVERADD', 'SILVERBEES', 'SILVERETF', 'SILVERIETF', 'SILVERTUC', 'SILVRETF', 'SIMBHALS', 'SIMPLEXINF', 'SINCLAIR', 'SINDHUTRAD', 'SINTERCOM', 'SIRCA', 'SIS', 'SIYSIL', 'SJLOGISTIC', 'SJS', 'SJVN', 'SKFINDIA', 'SKIPPER', 'SKIPPERPP', 'SKMEGGPROD', 'SKP', 'SKYGOLD', 'SMALLCAP', 'SMARTLINK', 'SMCGLOBAL', 'SMLISUZU', 'SMLT', 'SMSLIFE', 'SMSPHARMA', 'SNOWMAN', 'SOBHA', 'SOFTTECH', 'SOLARA', 'SOLARINDS', 'SOLEX', 'SOMANYCERA', 'SOMATEX', 'SOMICONVEY', 'SONACOMS', 'SONAMAC', 'SONAMLTD', 'SONATSOFTW', 'SONUINFRA', 'SOTL', 'SOUTHBANK', 'SOUTHWEST', 'SPAL', 'SPANDANA', 'SPARC', 'SPCENET', 'SPECIALITY', 'SPECTRUM', 'SPECTSTM', 'SPENCERS', 'SPIC', 'SPLIL', 'SPLPETRO', 'SPMLINFRA', 'SPORTKING', 'SPYL', 'SREEL', 'SRF', 'SRGHFL', 'SRHHYPOLTD', 'SRIVASAVI', 'SRM', 'SRPL', 'SSFL', 'SSWL', 'STAR', 'STARCEMENT', 'STARHEALTH', 'STARPAPER', 'STARTECK', 'STCINDIA', 'STEELCAS', 'STEELCITY', 'STEELXIND', 'STEL', 'STERTOOLS', 'STLTECH', 'STOVEKRAFT', 'STYLAMIND', 'STYRENIX', 'SUBEXLTD', 'SUBROS', 'SUDARSCHEM', 'SUKHJITS', 'SULA', 'SUMEETINDS', 'SUMICHEM', 'SUMIT', 'SUMMITSEC', 'SUNCLAY', 'SUNDARAM', 'SUNDARMFIN', 'SUNDARMHLD', 'SUNDRMBRAK', 'SUNDRMFAST', 'SUNFLAG', 'SUNPHARMA', 'SUNREST', 'SUNTECK', 'SUNTV', 'SUPERHOUSE', 'SUPERSPIN', 'SUPRAJIT', 'SUPREMEENG', 'SUPREMEIND', 'SUPREMEINF', 'SUPREMEPWR', 'SUPRIYA', 'SURAJEST', 'SURANASOL', 'SURANAT&P', 'SURANI', 'SURYALAXMI', 'SURYAROSNI', 'SURYODAY', 'SUTLEJTEX', 'SUULD', 'SUVEN', 'SUVENPHAR', 'SUVIDHAA', 'SUZLON', 'SVLL', 'SVPGLOB', 'SWANENERGY', 'SWARAJ', 'SWARAJENG', 'SWASTIK', 'SWELECTES', 'SWSOLAR', 'SYMPHONY', 'SYNCOMF', 'SYNGENE', 'SYNOPTICS', 'SYRMA', 'SYSTANGO', 'TAC', 'TAINWALCHM', 'TAJGVK', 'TAKE', 'TALBROAUTO', 'TANLA', 'TARACHAND', 'TARAPUR', 'TARC', 'TARMAT', 'TARSONS', 'TASTYBITE', 'TATACAP', 'TATACAP', 'TATACAP', 'TATACAPHSG', 'TATACAPHSG', 'TATACAPHSG', 'TATACAPHSG', 'TATACHEM', 'TATACOMM', 'TATACONSUM', 'TATAELXSI', 'TATAGOLD', 'TATAINVEST', 'TATAMOTORS', 'TATAMTRDVR', 'TATAPOWER', 'TATASTEEL', 'TATATECH', 'TATSILV', 'TATVA', 'TBZ', 'TCI', 'TCIEXP', 'TCL', 'TCLCONS', 'TCNSBRANDS', 'TCPLPACK', 'TCS', 'TDPOWERSYS', 'TEAMLEASE', 'TECH', 'TECHIN', 'TECHLABS', 'TECHM', 'TECHNOE', 'TECILCHEM', 'TEGA', 'TEJASNET', 'TEMBO', 'TERASOFT', 'TEXINFRA', 'TEXMOPIPES', 'TEXRAIL', 'TFCILTD', 'TFL', 'TGBHOTELS', 'THANGAMAYL', 'THEINVEST', 'THEJO', 'THEMISMED', 'THERMAX', 'THOMASCOOK', 'THOMASCOTT', 'THYROCARE', 'TI', 'TIDEWATER', 'TIIL', 'TIINDIA', 'TIJARIA', 'TIL', 'TIMESGTY', 'TIMETECHNO', 'TIMKEN', 'TIPSFILMS', 'TIPSINDLTD', 'TIRUMALCHM', 'TIRUPATIFL', 'TITAGARH', 'TITAN', 'TMB', 'TNIDETF', 'TNPETRO', 'TNPL', 'TNTELE', 'TOKYOPLAST', 'TORNTPHARM', 'TORNTPOWER', 'TOTAL', 'TOUCHWOOD', 'TPHQ', 'TPLPLASTEH', 'TRACXN', 'TRANSTEEL', 'TRANSWIND', 'TREEHOUSE', 'TREJHARA', 'TREL', 'TRENT', 'TRF', 'TRIDENT', 'TRIDHYA', 'TRIGYN', 'TRIL', 'TRITURBINE', 'TRIVENI', 'TRU', 'TRUST', 'TTKHLTCARE', 'TTKPRESTIG', 'TTL', 'TTML', 'TV18BRDCST', 'TVSELECT', 'TVSHLTD', 'TVSMOTOR', 'TVSSCS', 'TVSSRICHAK', 'TVTODAY', 'TVVISION', 'UBL', 'UCAL', 'UCOBANK', 'UDS', 'UFLEX', 'UFO', 'UGARSUGAR', 'UGROCAP', 'UGROCAP', 'UGROCAP', 'UGROCAP', 'UGROCAP', 'UJJIVAN', 'UJJIVANSFB', 'ULTRACEMCO', 'UMA', 'UMAEXPORTS', 'UMANGDAIRY', 'UMESLTD', 'UNICHEMLAB', 'UNIDT', 'UNIENTER', 'UNIHEALTH', 'UNIINFO', 'UNIONBANK', 'UNIPARTS', 'UNITECH', 'UNITEDPOLY', 'UNITEDTEA', 'UNIVASTU', 'UNIVCABLES', 'UNIVPHOTO', 'UNOMINDA', 'UPL', 'URAVI', 'URBAN', 'URJA', 'USHAMART', 'USK', 'UTIAMC', 'UTIBANKETF', 'UTINEXT50', 'UTINIFTETF', 'UTISENSETF', 'UTISXN50', 'UTKARSHBNK', 'UTTAMSUGAR', 'V2RETAIL', 'VADILALIND', 'VAIBHAVGBL', 'VAISHALI', 'VAKRANGEE', 'VALIANTLAB', 'VALIANTORG', 'VARDHACRLC', 'VARDMNPOLY', 'VARROC', 'VASA', 'VASCONEQ', 'VASWANI', 'VBL', 'VEDL', 'VEEKAYEM', 'VENKEYS', 'VENUSPIPES', 'VENUSREM', 'VERANDA', 'VERTEXPLUS', 'VERTOZ', 'VESUVIUS', 'VETO', 'VGUARD', 'VHL', 'VHLTD', 'VIAZ', 'VIDHIING', 'VIJAYA', 'VIJIFIN', 'VIKASECO', 'VIKASLIFE', 'VIMTALABS', 'VINATIORGA', 'VINDHYATEL', 'VINEETLAB', 'VINNY', 'VINSYS', 'VINYAS', 'VINYLINDIA', 'VIPCLOTHNG', 'VIPIND', 'VIPULLTD', 'VIRINCHI', 'VISAKAIND', 'VISHNU', 'VISHNUINFR', 'VISHWARAJ', 'VISHWAS', 'VITAL', 'VIVIANA', 'VIVIDHA', 'VLEGOV', 'VLSFINANCE', 'VMARCIND', 'VMART', 'VOLTAMP', 'VOLTAS', 'VPRPL', 'VR', 'VRLLOG', 'VSCL', 'VSSL', 'VSTIND', 'VSTL', 'VSTTILLERS', 'VTL', 'WABAG', 'WALCHANNAG', 'WALPAR', 'WANBURY', 'WEALTH', 'WEBELSOLAR', 'WEIZMANIND', 'WEL', 'WELCORP', 'WELENT', 'WELINV', 'WELSPUNLIV', 'WENDT', 'WESTLIFE', 'WEWIN', 'WHEELS', 'WHIRLPOOL', 'WILLAMAGOR', 'WINDLAS', 'WINDMACHIN', 'WINSOME', 'WIPL', 'WIPRO', 'WOCKPHARMA', 'WOMANCART', 'WONDERLA', 'WORTH', 'WSI', 'WSTCSTPAPR', 'WTICAB', 'XCHANGING', 'XELPMOC', 'XPROINDIA', 'YAARI', 'YASHO', 'YASHOPTICS', 'YATHARTH', 'YATRA', 'YCCL', 'YESBANK', 'YUDIZ', 'YUKEN', 'ZAGGLE', 'ZEAL', 'ZEEL', 'ZEELEARN', 'ZEEMEDIA', 'ZENITHDRUG', 'ZENITHEXPO', 'ZENITHSTL', 'ZENSARTECH', 'ZENTEC', 'ZFCVINDIA', 'ZIMLAB', 'ZODIAC', 'ZODIACLOTH', 'ZOMATO', 'ZOTA', 'ZUARI', 'ZUARIIND', 'ZYDUSLIFE', 'ZYDUSWELL']
\ No newline at end of file
+with open(STOCKS_NAMES_FILE) as f:
+    stocks_names = f.read().split()
@@ -0,0 +1,438 @@
+import math
+from collections import deque
+
+import numpy as np
+
+# Streaming counterparts of the Talib indicators: each takes one bar at a time (or a revision of
+# the last bar) and updates in constant time. The rolling and EWM recurrences follow pandas'
+# own window kernels step for step, so values match the batch versions in ta_lib_utility.
+
+
+def _divide(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+def _is_nan(value):
+    return value != value
+
+
+class _RollingMean:
+    # pandas roll_mean: Kahan-compensated running sum with separate add/remove compensation
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.started = False
+        self.nobs = 0
+        self.neg_ct = 0
+        self.sum_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.same_count = 0
+        self.prev_value = math.nan
+        self._evicted = None
+        self._saved = None
+
+    def _scalars(self):
+        return (self.started, self.nobs, self.neg_ct, self.sum_x, self.compensation_add,
+                self.compensation_remove, self.same_count, self.prev_value)
+
+    def save(self):
+        self._saved = self._scalars()
+        self._evicted = None
+
+    def restore(self):
+        self.values.pop()
+        if self._evicted is not None:
+            self.values.appendleft(self._evicted)
+        (self.started, self.nobs, self.neg_ct, self.sum_x, self.compensation_add,
+         self.compensation_remove, self.same_count, self.prev_value) = self._saved
+
+    def _add(self, value):
+        if _is_nan(value):
+            return
+        self.nobs += 1
+        y = value - self.compensation_add
+        t = self.sum_x + y
+        self.compensation_add = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct += 1
+        if value == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = value
+
+    def _remove(self, value):
+        if _is_nan(value):
+            return
+        self.nobs -= 1
+        y = -value - self.compensation_remove
+        t = self.sum_x + y
+        self.compensation_remove = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, value) < 0:
+            self.neg_ct -= 1
+
+    def push(self, value):
+        value = float(value)
+        if not self.started or self.window == 1:
+            # pandas recomputes from scratch on the first window, and on every window of size 1
+            self.values.clear()
+            self.started = True
+            self.nobs = self.neg_ct = 0
+            self.sum_x = self.compensation_add = self.compensation_remove = 0.0
+            self.same_count = 0
+            self.prev_value = value
+        elif len(self.values) == self.window:
+            self._evicted = self.values.popleft()
+            self._remove(self._evicted)
+        self.values.append(value)
+        self._add(value)
+        return self.value()
+
+    def value(self):
+        if self.nobs >= self.window and self.nobs > 0:
+            result = self.sum_x / self.nobs
+            if self.same_count >= self.nobs:
+                result = self.prev_value
+            elif self.neg_ct == 0 and result < 0:
+                result = 0.0
+            elif self.neg_ct == self.nobs and result > 0:
+                result = 0.0
+            return result
+        return math.nan
+
+
+class _RollingStd:
+    # pandas roll_var (Welford with compensation, ddof=1) followed by a square root
+    def __init__(self, window, ddof=1):
+        self.window = window
+        self.ddof = ddof
+        self.values = deque()
+        self.started = False
+        self.nobs = 0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.same_count = 0
+        self.prev_value = math.nan
+        self._evicted = None
+        self._saved = None
+
+    def _scalars(self):
+        return (self.started, self.nobs, self.mean_x, self.ssqdm_x, self.compensation_add,
+                self.compensation_remove, self.same_count, self.prev_value)
+
+    def save(self):
+        self._saved = self._scalars()
+        self._evicted = None
+
+    def restore(self):
+        self.values.pop()
+        if self._evicted is not None:
+            self.values.appendleft(self._evicted)
+        (self.started, self.nobs, self.mean_x, self.ssqdm_x, self.compensation_add,
+         self.compensation_remove, self.same_count, self.prev_value) = self._saved
+
+    def _add(self, value):
+        if _is_nan(value):
+            return
+        if value == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = value
+        self.nobs += 1
+        prev_mean = self.mean_x - self.compensation_add
+        y = value - self.compensation_add
+        t = y - self.mean_x
+        self.compensation_add = t + self.mean_x - y
+        self.mean_x = self.mean_x + t / self.nobs if self.nobs else 0.0
+        self.ssqdm_x = self.ssqdm_x + (value - prev_mean) * (value - self.mean_x)
+
+    def _remove(self, value):
+        if _is_nan(value):
+            return
+        self.nobs -= 1
+        if self.nobs:
+            prev_mean = self.mean_x - self.compensation_remove
+            y = value - self.compensation_remove
+            t = y - self.mean_x
+            self.compensation_remove = t + self.mean_x - y
+            self.mean_x = self.mean_x - t / self.nobs
+            self.ssqdm_x = self.ssqdm_x - (value - prev_mean) * (value - self.mean_x)
+        else:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+
+    def push(self, value):
+        value = float(value)
+        if not self.started or self.window == 1:
+            self.values.clear()
+            self.started = True
+            self.nobs = 0
+            self.mean_x = self.ssqdm_x = self.compensation_add = self.compensation_remove = 0.0
+            self.same_count = 0
+            self.prev_value = value
+        elif len(self.values) == self.window:
+            self._evicted = self.values.popleft()
+            self._remove(self._evicted)
+        self.values.append(value)
+        self._add(value)
+        return self.value()
+
+    def value(self):
+        if self.nobs >= self.window and self.nobs > self.ddof:
+            if self.nobs == 1 or self.same_count >= self.nobs:
+                return 0.0
+            return math.sqrt(max(self.ssqdm_x / (self.nobs - self.ddof), 0.0))
+        return math.nan
+
+
+class _Ewm:
+    # pandas ewm(...).mean() with ignore_na=False; `adjust` as in pandas
+    def __init__(self, span=None, alpha=None, adjust=True):
+        com = (span - 1) / 2.0 if span is not None else (1 - alpha) / alpha
+        self.alpha = 1.0 / (1.0 + com)
+        self.old_wt_factor = 1.0 - self.alpha
+        self.new_wt = 1.0 if adjust else self.alpha
+        self.adjust = adjust
+        self.started = False
+        self.weighted = math.nan
+        self.old_wt = 1.0
+        self.nobs = 0
+        self._saved = None
+
+    def save(self):
+        self._saved = (self.started, self.weighted, self.old_wt, self.nobs)
+
+    def restore(self):
+        self.started, self.weighted, self.old_wt, self.nobs = self._saved
+
+    def push(self, value):
+        value = float(value)
+        is_observation = not _is_nan(value)
+        if not self.started:
+            self.started = True
+            self.weighted = value
+            self.nobs = int(is_observation)
+            self.old_wt = 1.0
+            return self.value()
+        self.nobs += is_observation
+        if not _is_nan(self.weighted):
+            self.old_wt *= self.old_wt_factor
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = self.old_wt * self.weighted + self.new_wt * value
+                    self.weighted /= (self.old_wt + self.new_wt)
+                if self.adjust:
+                    self.old_wt += self.new_wt
+                else:
+                    self.old_wt = 1.0
+        elif is_observation:
+            self.weighted = value
+        return self.value()
+
+    def value(self):
+        return self.weighted if self.nobs >= 1 else math.nan
+
+
+class _Lag:
+    # Value from `period` bars ago (NaN until there is one), like Series.shift(period)
+    def __init__(self, period):
+        self.period = period
+        self.values = deque(maxlen=period + 1)
+        self._evicted = None
+
+    def save(self):
+        self._evicted = self.values[0] if len(self.values) == self.values.maxlen else None
+
+    def restore(self):
+        self.values.pop()
+        if self._evicted is not None:
+            self.values.appendleft(self._evicted)
+
+    def push(self, value):
+        self.values.append(value)
+        return self.values[0] if len(self.values) == self.values.maxlen else math.nan
+
+
+# Base class: `update(bar)` appends a bar, `update(bar, revise=True)` replaces the last one.
+# Subclasses list their window primitives in `_parts` and their own scalar state in `_fields`.
+class StreamingIndicator:
+    _fields = ()
+
+    def __init__(self):
+        self._parts = []
+        self._saved = None
+        self.last = None
+
+    def update(self, bar, revise=False):
+        if revise:
+            if self._saved is None:
+                raise ValueError("No bar to revise yet")
+            self._restore()
+        self._save()
+        self.last = self._step(bar)
+        return self.last
+
+    def _save(self):
+        for part in self._parts:
+            part.save()
+        self._saved = tuple(getattr(self, field) for field in self._fields)
+
+    def _restore(self):
+        for part in self._parts:
+            part.restore()
+        for field, value in zip(self._fields, self._saved):
+            setattr(self, field, value)
+
+    def _step(self, bar):
+        raise NotImplementedError
+
+    @classmethod
+    def from_history(cls, data, **params):
+        indicator = cls(**params)
+        for bar in data[['Open', 'High', 'Low', 'Close']].itertuples(index=False):
+            indicator.update(bar._asdict())
+        return indicator
+
+
+# Talib.calculate_rsi
+class RsiStream(StreamingIndicator):
+    _fields = ('prev_close',)
+
+    def __init__(self, periods=14):
+        super().__init__()
+        self.prev_close = math.nan
+        self.gain = _RollingMean(periods)
+        self.loss = _RollingMean(periods)
+        self._parts = [self.gain, self.loss]
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        delta = close - self.prev_close
+        self.prev_close = close
+        gain = self.gain.push(delta if delta > 0 else 0.0)
+        # -(delta.where(delta < 0, 0)) gives -0.0 for rises, which pandas counts as a negative value
+        loss = self.loss.push(-(delta if delta < 0 else 0.0))
+        rs = _divide(gain, loss)
+        return {'RSI': 100 - _divide(100, 1 + rs)}
+
+
+# Talib.calculate_macd
+class MacdStream(StreamingIndicator):
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        super().__init__()
+        self.fast = _Ewm(span=fast_period, adjust=False)
+        self.slow = _Ewm(span=slow_period, adjust=False)
+        self.signal = _Ewm(span=signal_period, adjust=False)
+        self._parts = [self.fast, self.slow, self.signal]
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        macd = self.fast.push(close) - self.slow.push(close)
+        return {'MACD': macd, 'Signal': self.signal.push(macd)}
+
+
+# Talib.calculate_roc
+class RocStream(StreamingIndicator):
+    def __init__(self, period=12):
+        super().__init__()
+        self.closes = _Lag(period)
+        self._parts = [self.closes]
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        previous = self.closes.push(close)
+        return {'ROC': _divide(close - previous, previous) * 100}
+
+
+# Talib.calculate_bollinger_bands_width
+class BollingerWidthStream(StreamingIndicator):
+    def __init__(self, period=20, nbdevup=2, nbdevdn=2):
+        super().__init__()
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self.mean = _RollingMean(period)
+        self.std = _RollingStd(period)
+        self._parts = [self.mean, self.std]
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        rolling_mean = self.mean.push(close)
+        rolling_std = self.std.push(close)
+        upper_band = rolling_mean + (rolling_std * self.nbdevup)
+        lower_band = rolling_mean - (rolling_std * self.nbdevdn)
+        return {'BB_Width': _divide(upper_band - lower_band, rolling_mean)}
+
+
+def _true_range(high, low, prev_close):
+    # DataFrame.max(axis=1) skips the missing previous close on the first bar
+    ranges = [high - low, abs(high - prev_close), abs(low - prev_close)]
+    ranges = [value for value in ranges if not _is_nan(value)]
+    return max(ranges) if ranges else math.nan
+
+
+# Talib.calculate_atr
+class AtrStream(StreamingIndicator):
+    _fields = ('prev_close',)
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.prev_close = math.nan
+        self.atr = _RollingMean(period)
+        self._parts = [self.atr]
+
+    def _step(self, bar):
+        high, low, close = float(bar['High']), float(bar['Low']), float(bar['Close'])
+        tr = _true_range(high, low, self.prev_close)
+        self.prev_close = close
+        return {'ATR': self.atr.push(tr)}
+
+
+# Talib.calculate_dmi_and_adx
+class DmiAdxStream(StreamingIndicator):
+    _fields = ('prev_high', 'prev_low', 'prev_close')
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.prev_high = self.prev_low = self.prev_close = math.nan
+        self.atr = _RollingMean(period)
+        self.plus_dm = _Ewm(alpha=1 / period)
+        self.minus_dm = _Ewm(alpha=1 / period)
+        self.adx = _Ewm(alpha=1 / period)
+        self._parts = [self.atr, self.plus_dm, self.minus_dm, self.adx]
+
+    def _step(self, bar):
+        high, low, close = float(bar['High']), float(bar['Low']), float(bar['Close'])
+        plus_dm = high - self.prev_high
+        minus_dm = low - self.prev_low
+        if plus_dm < 0:
+            plus_dm = 0.0
+        if minus_dm > 0:
+            minus_dm = 0.0
+        atr = self.atr.push(_true_range(high, low, self.prev_close))
+        self.prev_high, self.prev_low, self.prev_close = high, low, close
+
+        plus_di = 100 * _divide(self.plus_dm.push(plus_dm), atr)
+        minus_di = abs(100 * _divide(self.minus_dm.push(minus_dm), atr))
+        dx = _divide(abs(plus_di - minus_di), plus_di + minus_di) * 100
+        return {'Plus DI': plus_di, 'Minus DI': minus_di, 'ADX': self.adx.push(dx)}
+
+
+# Talib.calculate_moving_averages
+class MovingAverageStream(StreamingIndicator):
+    def __init__(self, short_window=50, medium_window=100, long_window=200):
+        super().__init__()
+        self.short = _RollingMean(short_window)
+        self.medium = _RollingMean(medium_window)
+        self.long = _RollingMean(long_window)
+        self._parts = [self.short, self.medium, self.long]
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        return {'Short MA': self.short.push(close), 'Medium MA': self.medium.push(close), 'Long MA': self.long.push(close)}
@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-import yfinance as yf
 from candles import candle_patterns
 
 class Talib:
@@ -88,16 +87,53 @@ class Talib:
 
     @staticmethod
     def handle_candle_pattern(data):
-        for pattern_name, pattern_data in candle_patterns.items():
-            pattern_function = getattr(Talib, pattern_name.lower(), None)
-            if pattern_function:
-                result = pattern_function(data)
-                result_filtered = np.where(result != 0, result, np.nan)
-                data[pattern_name + '_result'] = result_filtered
-                data[pattern_name + '_description'] = pattern_data['description']
-        data.dropna(how='all', inplace=True)
+        hits, pattern_names = Talib.candle_pattern_matrix(data)
+        for column, pattern_name in enumerate(pattern_names):
+            data[pattern_name + '_result'] = np.where(hits[:, column] != 0, 1.0, np.nan)
+        # Only rebuild the frame when there actually is an all-empty row to drop
+        if data.isna().all(axis=1).any():
+            data.dropna(how='all', inplace=True)
         return data
 
+    # Candle geometry shared by every pattern, computed once from NumPy arrays
+    @staticmethod
+    def candle_geometry(data):
+        open_ = data['Open'].to_numpy(dtype=np.float64)
+        high = data['High'].to_numpy(dtype=np.float64)
+        low = data['Low'].to_numpy(dtype=np.float64)
+        close = data['Close'].to_numpy(dtype=np.float64)
+        prev_open = np.concatenate(([np.nan], open_[:-1]))
+        prev_close = np.concatenate(([np.nan], close[:-1]))
+        # fmin/fmax skip a missing Open or Close the same way DataFrame.min/max(axis=1) do
+        top = np.fmax(open_, close)
+        bottom = np.fmin(open_, close)
+        return {
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'prev_open': prev_open,
+            'prev_close': prev_close,
+            'body': np.abs(close - open_),
+            'prev_body': np.abs(prev_close - prev_open),
+            'range': high - low,
+            'top': top,
+            'bottom': bottom,
+            'bearish': close < open_,
+            'bullish': close > open_,
+        }
+
+    # Evaluate every pattern in candle_patterns in one pass; returns an (n_bars, n_patterns) int8
+    # hit matrix and the pattern names for its columns
+    @staticmethod
+    def candle_pattern_matrix(data):
+        g = Talib.candle_geometry(data)
+        pattern_names = [name for name in candle_patterns if name in CANDLE_RULES]
+        hits = np.zeros((len(data), len(pattern_names)), dtype=np.int8)
+        for column, pattern_name in enumerate(pattern_names):
+            hits[:, column] = CANDLE_RULES[pattern_name](g)
+        return hits, pattern_names
+
     @staticmethod
     def cdldoji(data):
         open_close_diff = abs(data['Open'] - data['Close'])
@@ -155,4 +191,14 @@ class Talib:
         return shooting_star.astype(int)
 
 
-
+# Same conditions as the cdl* methods above, written against the shared candle geometry
+CANDLE_RULES = {
+    'CDLDOJI': lambda g: g['body'] <= 0.1 * g['range'],
+    'CDLENGULFING': lambda g: (g['bullish'] & (g['open'] < g['prev_close']) & (g['close'] > g['prev_open'])) |
+                              (g['bearish'] & (g['open'] > g['prev_close']) & (g['close'] < g['prev_open'])),
+    'CDLHAMMER': lambda g: ((g['low'] - g['bottom']) > 2 * g['body']) & ((g['top'] - g['high']) < g['body']),
+    'CDLHANGINGMAN': lambda g: ((g['low'] - g['bottom']) > 2 * g['body']) & ((g['top'] - g['high']) < g['body']) & g['bearish'],
+    'CDLHARAMI': lambda g: (g['body'] < g['prev_body']) & (g['open'] > g['prev_close']) & (g['close'] < g['prev_open']),
+    'CDLINVERTEDHAMMER': lambda g: ((g['high'] - g['top']) > 2 * g['body']) & ((g['bottom'] - g['low']) < g['body']),
+    'CDLSHOOTINGSTAR': lambda g: ((g['high'] - g['top']) > 2 * g['body']) & ((g['bottom'] - g['low']) < g['body']) & g['bearish'],
+}
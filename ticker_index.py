@@ -0,0 +1,50 @@
+from bisect import bisect_left
+
+# Longest n-gram indexed; queries up to this length are answered straight from the index
+MAX_GRAM = 3
+
+
+# Prebuilt search over the ticker universe: prefix matches by bisect on a sorted lowercase array,
+# substring matches by intersecting n-gram postings. Prefix hits rank first, results are capped.
+class TickerIndex:
+    def __init__(self, names):
+        self.names = sorted(set(names), key=str.lower)
+        self.lowered = [name.lower() for name in self.names]
+        self.grams = {}
+        for position, name in enumerate(self.lowered):
+            for gram in self._grams(name):
+                self.grams.setdefault(gram, []).append(position)
+
+    @staticmethod
+    def _grams(text):
+        return {text[i:i + n] for n in range(1, MAX_GRAM + 1) for i in range(len(text) - n + 1)}
+
+    def prefix_matches(self, query):
+        start = bisect_left(self.lowered, query)
+        end = bisect_left(self.lowered, query + '\uffff', lo=start)
+        return range(start, end)
+
+    def substring_matches(self, query):
+        if len(query) <= MAX_GRAM:
+            return self.grams.get(query, [])
+        postings = sorted(
+            (self.grams.get(query[i:i + MAX_GRAM], []) for i in range(len(query) - MAX_GRAM + 1)),
+            key=len,
+        )
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(position for position in candidates if query in self.lowered[position])
+
+    def search(self, query, limit=20):
+        query = query.strip().lower()
+        if not query:
+            return []
+        results = [self.names[position] for position in self.prefix_matches(query)[:limit]]
+        if len(results) < limit:
+            prefix = set(results)
+            others = sorted(
+                (self.lowered[position].find(query), position)
+                for position in self.substring_matches(query)
+                if self.names[position] not in prefix
+            )
+            results.extend(self.names[position] for _, position in others[:limit - len(results)])
+        return results
@@ -1,29 +1,88 @@
+import os
+import pandas as pd
+from cache import TTLCache
+from history_plan import slice_period
+from market_hours import known_exchange_for_symbol
+from metrics import cache_lookups, upstream
+from ohlcv_store import COLUMNS, OhlcvStore
+from providers import provider
+from resample import resample, source_interval
+
+# Seconds each kind of upstream response stays fresh
+CACHE_TTLS = {
+    'info': 6 * 60 * 60,
+    'calendar': 6 * 60 * 60,
+    'news': 15 * 60,
+    'history_intraday': 30,
+    'history': 15 * 60,
+}
+
+# Shared by every Yfinance instance in the process, so repeated tickers reuse one upstream fetch
+cache = TTLCache(max_bytes=int(os.environ.get('YF_CACHE_MAX_MB', 256)) * 1024 * 1024, on_lookup=cache_lookups('upstream'))
+
+# On-disk bars; the TTL cache above throttles how often it is topped up from upstream
+store = OhlcvStore()
+
+
+# Bars frame with no rows, shaped like a stored history
+def empty_history():
+    return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in COLUMNS.items() if column != 'ts'},
+                        index=pd.DatetimeIndex([], tz='UTC', name='Date'))
+
+
+def history_ttl(interval):
+    return CACHE_TTLS['history_intraday'] if interval.endswith(('m', 'h')) else CACHE_TTLS['history']
 
-import yfinance as yf
 
 class Yfinance:
     def __init__(self, ticker):
         self.ticker = ticker
-        self.stock = yf.Ticker(ticker)
-    
+
+    # One timed call to the data provider for this ticker
+    def _upstream(self, call, *args, **kwargs):
+        with upstream(call):
+            return getattr(provider, call)(self.ticker, *args, **kwargs)
+
     def stock_info(self):
-        info = self.stock.info
+        info = cache.get_or_load((self.ticker, 'info', None, None), lambda: self._upstream('info'), CACHE_TTLS['info'])
         return info
     
     def fetch_stock_data(self, period, interval):
-        data = self.stock.history(period=period, interval=interval,rounding=2)
-        return data
+        data = cache.get_or_load(
+            (self.ticker, 'history', period, interval),
+            lambda: self._history(period, interval),
+            history_ttl(interval),
+            cacheable=lambda data: not data.empty,
+        )
+        # Callers add indicator columns, so hand out a shallow copy rather than the cached frame
+        return data.copy(deep=False)
+
+    # Bars of `interval` over `period`. Coarser bars are aggregated locally from a finer interval
+    # already stored for the ticker, so switching intervals only downloads when a finer one is needed;
+    # every period and interval built on one source shares its cached series.
+    def _history(self, period, interval):
+        source = source_interval(interval, period, store.intervals(self.ticker), store.coverage)
+        series = cache.get_or_load(
+            (self.ticker, 'series', source, None),
+            lambda: self._stored_series(source),
+            history_ttl(source),
+            cacheable=lambda data: not data.empty,
+        )
+        if source != interval:
+            series = resample(series, interval, known_exchange_for_symbol(self.ticker))
+        return slice_period(series, period)
+
+    def _stored_series(self, interval):
+        store.refresh(self.ticker, interval, lambda period, start: self._upstream('history', interval, period=period, start=start))
+        data = store.read(self.ticker, interval)
+        # Nothing stored: upstream has no bars for this ticker and interval
+        return data if data is not None else empty_history()
 
     
     def stock_earning_date(self):
-        earnings = self.stock.calendar
+        earnings = cache.get_or_load((self.ticker, 'calendar', None, None), lambda: self._upstream('calendar'), CACHE_TTLS['calendar'])
         return earnings
     
     def stock_news(self):
-        news = self.stock.news
+        news = cache.get_or_load((self.ticker, 'news', None, None), lambda: self._upstream('news'), CACHE_TTLS['news'])
         return news
-
-    
-
-    
-